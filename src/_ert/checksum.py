@@ -0,0 +1,81 @@
+"""
+Checksums of forward model output files.
+
+The forward model runner computes a checksum for every file listed in the
+runpath manifest, and the scheduler verifies them when the realization has
+finished. The manifest may contain an entry with the key
+:data:`MANIFEST_CHECKSUM_KEY` selecting the algorithm to use and a size limit
+above which files are verified by size and modification time instead of
+being hashed. Files are read in fixed-size chunks so that large outputs are
+never held in memory.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import zlib
+from pathlib import Path
+from typing import Any, Literal, get_args
+
+ChecksumAlgorithm = Literal["md5", "crc32"]
+CHECKSUM_ALGORITHMS: tuple[ChecksumAlgorithm, ...] = get_args(ChecksumAlgorithm)
+MANIFEST_CHECKSUM_KEY = "__checksum__"
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+def file_checksum(
+    path: str | os.PathLike[str],
+    algorithm: ChecksumAlgorithm = "md5",
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+) -> str:
+    """Hexadecimal checksum of the file at path, read in chunks of buffer_size"""
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        if algorithm == "crc32":
+            crc = 0
+            while size := f.readinto(buffer):
+                crc = zlib.crc32(view[:size], crc)
+            return f"{crc:08x}"
+        if algorithm == "md5":
+            md5 = hashlib.md5(usedforsecurity=False)
+            while size := f.readinto(buffer):
+                md5.update(view[:size])
+            return md5.hexdigest()
+    raise ValueError(f"Unknown checksum algorithm: {algorithm}")
+
+
+def checksum_info(
+    path: str | os.PathLike[str],
+    algorithm: ChecksumAlgorithm = "md5",
+    size_limit: int | None = None,
+) -> dict[str, Any]:
+    """
+    The checksum information reported for a file. Files larger than
+    size_limit bytes are described by their size and modification time
+    instead of being hashed. Md5 checksums are reported as ``md5sum``
+    for compatibility with older versions of the scheduler.
+    """
+    stat = Path(path).stat()
+    if size_limit is not None and stat.st_size > size_limit:
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    checksum = file_checksum(path, algorithm)
+    if algorithm == "md5":
+        return {"md5sum": checksum}
+    return {"checksum": checksum, "checksum_algorithm": algorithm}
+
+
+def verify_checksum(path: str | os.PathLike[str], info: dict[str, Any]) -> bool | None:
+    """
+    Whether the file at path matches the checksum information given by
+    :func:`checksum_info`, or None if info does not contain any checksum.
+    """
+    if "md5sum" in info:
+        return file_checksum(path, "md5") == info["md5sum"]
+    if "checksum" in info:
+        return file_checksum(path, info["checksum_algorithm"]) == info["checksum"]
+    if "size" in info:
+        stat = Path(path).stat()
+        return stat.st_size == info["size"] and stat.st_mtime_ns == info["mtime_ns"]
+    return None
@@ -1,8 +1,15 @@
 from datetime import datetime
 from typing import Annotated, Any, Final, Literal
 
+import msgpack
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
+WireFormat = Literal["json", "msgpack"]
+WIRE_FORMAT_VERSION: Final = 1
+# Binary messages start with a null byte, which never starts a json message,
+# followed by the version of the wire format
+_MSGPACK_HEADER: Final = b"\x00" + bytes([WIRE_FORMAT_VERSION])
+
 
 class Id:
     FORWARD_MODEL_STEP_START_TYPE = Literal["forward_model_step.start"]
@@ -109,6 +116,7 @@ class RealizationBaseEvent(BaseEvent):
     ensemble: str | None = None
     queue_event_type: str | None = None
     exec_hosts: str | None = None
+    queue_wait_time: float | None = None
 
 
 class RealizationPending(RealizationBaseEvent):
@@ -249,5 +257,39 @@ def event_to_json(event: Event) -> str:
     return event.model_dump_json()
 
 
+def _msgpack_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+
+
+def event_to_bytes(event: Event, wire_format: WireFormat = "json") -> bytes:
+    """Serialize an event for sending with the given wire format"""
+    if wire_format == "msgpack":
+        return _MSGPACK_HEADER + msgpack.packb(dict(event), default=_msgpack_default)
+    return event.model_dump_json().encode("utf-8")
+
+
+def _unpack(raw_msg: bytes) -> Any:
+    if raw_msg[1:2] != _MSGPACK_HEADER[1:]:
+        raise ValueError(f"Unsupported wire format version {raw_msg[1:2]!r}")
+    return msgpack.unpackb(raw_msg[len(_MSGPACK_HEADER) :])
+
+
+def event_from_bytes(raw_msg: bytes) -> Event:
+    """Deserialize an event sent with any of the wire formats"""
+    if raw_msg[:1] == _MSGPACK_HEADER[:1]:
+        # Timestamps are sent as strings, so they need to be parsed
+        return EventAdapter.validate_python(_unpack(raw_msg), strict=False)
+    return event_from_json(raw_msg)
+
+
+def dispatch_event_from_bytes(raw_msg: bytes) -> DispatchEvent:
+    """Deserialize an event from a dispatcher sent with any of the wire formats"""
+    if raw_msg[:1] == _MSGPACK_HEADER[:1]:
+        return DispatchEventAdapter.validate_python(_unpack(raw_msg), strict=False)
+    return dispatch_event_from_json(raw_msg)
+
+
 def event_to_dict(event: Event) -> dict[str, Any]:
     return event.model_dump()
@@ -8,6 +8,8 @@
 import zmq
 import zmq.asyncio
 
+from _ert.events import WIRE_FORMAT_VERSION, Event, WireFormat, event_to_bytes
+
 logger = logging.getLogger(__name__)
 
 
@@ -20,6 +22,19 @@ class ClientConnectionError(Exception):
 ACK_MSG = b"ACK"
 HEARTBEAT_MSG = b"BEAT"
 HEARTBEAT_TIMEOUT = 5.0
+# The zmq connection property where each side of a connection announces
+# that it can read binary messages. Peers without it only read json.
+WIRE_FORMAT_PROPERTY = "X-Ert-Wire-Format"
+MSGPACK_WIRE_FORMAT = f"msgpack/{WIRE_FORMAT_VERSION}"
+
+
+def peer_wire_format(frame: zmq.Frame) -> WireFormat:
+    """The wire format announced by the sender of frame"""
+    try:
+        announced = frame.get(WIRE_FORMAT_PROPERTY)
+    except zmq.ZMQError:
+        return "json"
+    return "msgpack" if announced == MSGPACK_WIRE_FORMAT else "json"
 
 
 class Client:
@@ -32,10 +47,19 @@ def __init__(
         token: str | None = None,
         dealer_name: str | None = None,
         ack_timeout: float | None = None,
+        wire_format: WireFormat = "msgpack",
     ) -> None:
+        """
+        With wire_format set to msgpack, the client announces that it reads
+        binary messages, and sends events in binary once the evaluator has
+        announced the same. Evaluators that do not announce it are sent
+        json, and json only is used with wire_format set to json.
+        """
         self._ack_timeout = ack_timeout or self.DEFAULT_ACK_TIMEOUT
         self.url = url
         self.token = token
+        self.wire_format: WireFormat = wire_format
+        self._peer_wire_format: WireFormat = "json"
 
         self._ack_event: asyncio.Event = asyncio.Event()
         self.context = zmq.asyncio.Context()
@@ -45,6 +69,11 @@ def __init__(
         self.socket.setsockopt(zmq.LINGER, 0)
         self.dealer_id = dealer_name or f"dispatch-{uuid.uuid4().hex[:8]}"
         self.socket.setsockopt_string(zmq.IDENTITY, self.dealer_id)
+        if wire_format == "msgpack":
+            self.socket.setsockopt(
+                zmq.METADATA,
+                f"{WIRE_FORMAT_PROPERTY}:{MSGPACK_WIRE_FORMAT}".encode(),
+            )
 
         if token is not None:
             client_public, client_secret = zmq.curve_keypair()
@@ -91,15 +120,17 @@ async def connect(self) -> None:
             self.term()
             raise
 
-    async def process_message(self, msg: str) -> None:
+    async def process_message(self, msg: bytes) -> None:
         raise NotImplementedError("Only monitor can receive messages!")
 
     async def _receiver(self) -> None:
         last_heartbeat_time: float | None = None
         while True:
             try:
-                _, raw_msg = await self.socket.recv_multipart()
+                _, frame = await self.socket.recv_multipart(copy=False)
+                raw_msg = frame.bytes
                 if raw_msg == ACK_MSG:
+                    self._peer_wire_format = peer_wire_format(frame)
                     self._ack_event.set()
                 elif raw_msg == HEARTBEAT_MSG:
                     if (
@@ -113,7 +144,7 @@ async def _receiver(self) -> None:
                         )
                     last_heartbeat_time = asyncio.get_running_loop().time()
                 else:
-                    await self.process_message(raw_msg.decode("utf-8"))
+                    await self.process_message(raw_msg)
             except zmq.ZMQError as exc:
                 logger.debug(
                     f"{self.dealer_id} connection to evaluator went down, reconnecting: {exc}"
@@ -121,6 +152,15 @@ async def _receiver(self) -> None:
                 await asyncio.sleep(0)
                 self.socket.connect(self.url)
 
+    async def send_event(self, event: Event, retries: int | None = None) -> None:
+        """Send an event in binary if both sides have announced it, else json"""
+        wire_format: WireFormat = (
+            "msgpack"
+            if self.wire_format == "msgpack" and self._peer_wire_format == "msgpack"
+            else "json"
+        )
+        await self.send(event_to_bytes(event, wire_format), retries)
+
     async def send(self, message: str | bytes, retries: int | None = None) -> None:
         self._ack_event.clear()
 
@@ -14,7 +14,6 @@
     ForwardModelStepRunning,
     ForwardModelStepStart,
     ForwardModelStepSuccess,
-    event_to_json,
 )
 from _ert.forward_model_runner.client import Client, ClientConnectionError
 from _ert.forward_model_runner.reporting.base import Reporter
@@ -118,7 +117,7 @@ async def publisher():
                             > self._finished_event_timeout
                         ):
                             break
-                        await client.send(event_to_json(event), self._max_retries)
+                        await client.send_event(event, self._max_retries)
                         event = None
                     except asyncio.CancelledError:
                         return
@@ -14,6 +14,10 @@ class _ChecksumDictBase(TypedDict):
 
     class ChecksumDict(_ChecksumDictBase, total=False):
         md5sum: str
+        checksum: str
+        checksum_algorithm: str
+        size: int
+        mtime_ns: int
         error: str
 
 
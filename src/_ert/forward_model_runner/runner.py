@@ -1,10 +1,15 @@
-import hashlib
 import json
 import os
 from collections.abc import Generator
 from pathlib import Path
 from typing import Any
 
+from _ert.checksum import (
+    CHECKSUM_ALGORITHMS,
+    MANIFEST_CHECKSUM_KEY,
+    ChecksumAlgorithm,
+    checksum_info,
+)
 from _ert.forward_model_runner.forward_model_step import ForwardModelStep
 from _ert.forward_model_runner.reporting.message import Checksum, Finish, Init, Message
 
@@ -20,6 +25,8 @@ def __init__(self, steps_data: dict[str, Any]):
         self.real_id = steps_data.get("real_id")
         self.ert_pid = steps_data.get("ert_pid")
         self.global_environment = steps_data.get("global_environment")
+        self.checksum_algorithm: ChecksumAlgorithm = "md5"
+        self.checksum_size_limit: int | None = None
         if self.simulation_id is not None:
             os.environ["ERT_RUN_ID"] = self.simulation_id
 
@@ -34,6 +41,11 @@ def _read_manifest(self):
             return None
         with open("manifest.json", encoding="utf-8") as f:
             data = json.load(f)
+        settings = data.pop(MANIFEST_CHECKSUM_KEY, {})
+        # Fall back to md5 for algorithms this runner does not know about
+        if settings.get("algorithm") in CHECKSUM_ALGORITHMS:
+            self.checksum_algorithm = settings["algorithm"]
+        self.checksum_size_limit = settings.get("size_limit")
         return {
             name: {"type": "file", "path": str(Path(file).absolute())}
             for name, file in data.items()
@@ -45,7 +57,11 @@ def _populate_checksums(self, manifest):
         for info in manifest.values():
             path = Path(info["path"])
             if path.exists():
-                info["md5sum"] = hashlib.md5(path.read_bytes()).hexdigest()
+                info.update(
+                    checksum_info(
+                        path, self.checksum_algorithm, self.checksum_size_limit
+                    )
+                )
             else:
                 info["error"] = f"Expected file {path} not created by forward model!"
         return manifest
@@ -2,21 +2,62 @@
 Ert - Ensemble Reservoir Tool - a package for reservoir modeling.
 """
 
-# workaround for https://github.com/Unidata/netcdf4-python/issues/1343
-import netCDF4 as _netcdf4  # noqa
-
-from .config import (
-    ForwardModelStepJSON,
-    ForwardModelStepPlugin,
-    ForwardModelStepValidationError,
-    ForwardModelStepWarning,
-    ForwardModelStepDocumentation,
-)
-from .data import MeasuredData
-from .libres_facade import LibresFacade
-from .workflow_runner import WorkflowRunner
-from .plugins import plugin, ErtScript, WorkflowConfigs, ErtScriptWorkflow
-from .scheduler import JobState
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .config import (
+        ForwardModelStepDocumentation,
+        ForwardModelStepJSON,
+        ForwardModelStepPlugin,
+        ForwardModelStepValidationError,
+        ForwardModelStepWarning,
+    )
+    from .data import MeasuredData
+    from .libres_facade import LibresFacade
+    from .plugins import ErtScript, ErtScriptWorkflow, WorkflowConfigs, plugin
+    from .scheduler import JobState
+    from .workflow_runner import WorkflowRunner
+
+# The exports are imported on first use, so that importing any part of ert,
+# which imports this package first, does not import all of it
+_lazy_exports = {
+    "ErtScript": ".plugins",
+    "ErtScriptWorkflow": ".plugins",
+    "ForwardModelStepDocumentation": ".config",
+    "ForwardModelStepJSON": ".config",
+    "ForwardModelStepPlugin": ".config",
+    "ForwardModelStepValidationError": ".config",
+    "ForwardModelStepWarning": ".config",
+    "JobState": ".scheduler",
+    "LibresFacade": ".libres_facade",
+    "MeasuredData": ".data",
+    "WorkflowConfigs": ".plugins",
+    "WorkflowRunner": ".workflow_runner",
+    "plugin": ".plugins",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_exports:
+        value = getattr(importlib.import_module(_lazy_exports[name], __name__), name)
+        globals()[name] = value
+        return value
+    # Subpackages were available after `import ert` when this package imported
+    # its exports eagerly, so keep them available
+    try:
+        return importlib.import_module(f".{name}", __name__)
+    except ModuleNotFoundError as err:
+        if err.name != f"{__name__}.{name}":
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "ErtScript",
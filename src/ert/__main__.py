@@ -12,31 +12,25 @@
 import warnings
 from argparse import ArgumentParser, ArgumentTypeError
 from collections.abc import Sequence
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 import yaml
-from opentelemetry.instrumentation.threading import ThreadingInstrumentor
 from opentelemetry.trace import Status, StatusCode
 
 import ert.shared
 from _ert.threading import set_signal_handler
-from ert.cli.main import ErtCliError, run_cli
-from ert.config import ConfigValidationError, ErtConfig, lint_file
 from ert.logging import LOGGING_CONFIG
 from ert.mode_definitions import (
     ENSEMBLE_EXPERIMENT_MODE,
     ENSEMBLE_SMOOTHER_MODE,
+    ES_MDA_DEFAULT_WEIGHTS,
     ES_MDA_MODE,
     TEST_RUN_MODE,
     WORKFLOW_MODE,
 )
 from ert.namespace import Namespace
-from ert.plugins import ErtPluginContext, ErtPluginManager
-from ert.run_models.multiple_data_assimilation import MultipleDataAssimilation
-from ert.services import StorageService, WebvizErt
 from ert.shared.storage.command import add_parser_options as ert_api_add_parser_options
-from ert.storage import ErtStorageException
 from ert.trace import trace, tracer, tracer_provider
 from ert.validation import (
     IntegerArgument,
@@ -47,10 +41,20 @@
     ValidationStatus,
 )
 
+if TYPE_CHECKING:
+    from ert.plugins import ErtPluginManager
+
+# Only what is needed to parse the arguments is imported up front. The rest of
+# ert is imported by the sub command that needs it, which keeps `ert --help`
+# and argument errors from paying for importing all of ert.
+
 logger = logging.getLogger(__name__)
 
 
 def run_ert_storage(args: Namespace, _: ErtPluginManager | None = None) -> None:
+    from ert.config import ErtConfig  # noqa: PLC0415
+    from ert.services import StorageService  # noqa: PLC0415
+
     with StorageService.start_server(
         verbose=True,
         project=ErtConfig.from_file(args.config).ens_path,
@@ -67,6 +71,9 @@ def run_webviz_ert(args: Namespace, _: ErtPluginManager | None = None) -> None:
             "Running `ert vis` requires that webviz_ert is installed"
         ) from err
 
+    from ert.config import ErtConfig  # noqa: PLC0415
+    from ert.services import StorageService, WebvizErt  # noqa: PLC0415
+
     kwargs: dict[str, Any] = {"verbose": args.verbose}
     ert_config = ErtConfig.with_plugins().from_file(args.config)
     os.chdir(ert_config.config_path)
@@ -192,9 +199,17 @@ def run_gui_wrapper(args: Namespace, ert_plugin_manager: ErtPluginManager) -> No
 
 
 def run_lint_wrapper(args: Namespace, _: ErtPluginManager) -> None:
+    from ert.config import lint_file  # noqa: PLC0415
+
     lint_file(args.config)
 
 
+def run_cli(args: Namespace, plugin_manager: ErtPluginManager | None = None) -> None:
+    from ert.cli.main import run_cli as _run_cli  # noqa: PLC0415
+
+    _run_cli(args, plugin_manager)
+
+
 class DeprecatedAction(argparse.Action):
     def __init__(self, alternative_option: str | None = None, **kwargs: Any) -> None:
         self.alternative_option: str | None = alternative_option
@@ -453,7 +468,7 @@ def get_ert_parser(parser: ArgumentParser | None = None) -> ArgumentParser:
     es_mda_parser.add_argument(
         "--weights",
         type=valid_weights,
-        default=MultipleDataAssimilation.default_weights,
+        default=ES_MDA_DEFAULT_WEIGHTS,
         help="Example custom relative weights: '8,4,2,1'. This means multiple data "
         "assimilation ensemble smoother will half the weight applied to the "
         "observation errors from one iteration to the next across 4 iterations.",
@@ -548,8 +563,10 @@ def ert_parser(parser: ArgumentParser | None, args: Sequence[str]) -> Namespace:
 
 def log_process_usage() -> None:
     try:
+        from ert.shared.status.utils import get_ert_memory_usage  # noqa: PLC0415
+
         usage = resource.getrusage(resource.RUSAGE_SELF)
-        max_rss = ert.shared.status.utils.get_ert_memory_usage()
+        max_rss = get_ert_memory_usage()
 
         usage_dict: dict[str, int | float] = {
             "User time": usage.ru_utime,
@@ -577,10 +594,20 @@ def main() -> None:
 
     # Have ErtThread re-raise uncaught exceptions on main thread
     set_signal_handler()
-    ThreadingInstrumentor().instrument()
 
     args = ert_parser(None, sys.argv[1:])
 
+    from opentelemetry.instrumentation.threading import (  # noqa: PLC0415
+        ThreadingInstrumentor,
+    )
+
+    from ert.cli.main import ErtCliError  # noqa: PLC0415
+    from ert.config import ConfigValidationError  # noqa: PLC0415
+    from ert.plugins import ErtPluginContext  # noqa: PLC0415
+    from ert.storage import ErtStorageException  # noqa: PLC0415
+
+    ThreadingInstrumentor().instrument()
+
     log_dir = os.path.abspath(args.logdir)
     try:
         os.makedirs(log_dir, exist_ok=True)
@@ -4,6 +4,7 @@
 import logging
 import time
 from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from fnmatch import fnmatch
 from typing import (
     TYPE_CHECKING,
@@ -117,10 +118,13 @@ def _save_param_ensemble_array_to_disk(
     iens_active_index: npt.NDArray[np.int_],
 ) -> None:
     config_node = ensemble.experiment.parameter_configuration[param_group]
-    for i, realization in enumerate(iens_active_index):
-        config_node.save_parameters(
-            ensemble, param_group, realization, param_ensemble_array[:, i]
-        )
+    start = time.time()
+    config_node.save_parameters_many(
+        ensemble, param_group, iens_active_index, param_ensemble_array
+    )
+    logger.info(
+        f"Storing data for {param_group} completed in {(time.time() - start) / 60} minutes"
+    )
 
 
 def _load_param_ensemble_array(
@@ -171,26 +175,20 @@ def _load_observations_and_responses(
         list[ObservationAndResponseSnapshot],
     ],
 ]:
-    observations_and_responses = ensemble.get_observations_and_responses(
+    observations_and_responses, S = ensemble.get_observations_and_response_matrix(
         selected_observations,
         iens_active_index,
     )
 
-    observations_and_responses = observations_and_responses.sort(
-        by=["observation_key", "index"]
-    )
-
-    S = observations_and_responses.select(
-        observations_and_responses.columns[5:]
-    ).to_numpy()
-    observations = (
-        observations_and_responses.select("observations").to_numpy().reshape((-1,))
-    )
-    errors = observations_and_responses.select("std").to_numpy().reshape((-1,))
-    obs_keys = (
-        observations_and_responses.select("observation_key").to_numpy().reshape((-1,))
-    )
-    indexes = observations_and_responses.select("index").to_numpy().reshape((-1,))
+    order = observations_and_responses.select(
+        pl.arg_sort_by(["observation_key", "index"])
+    ).to_series()
+    observations_and_responses = observations_and_responses[order]
+    S = S[order.to_numpy()]
+    observations = observations_and_responses["observations"].to_numpy()
+    errors = observations_and_responses["std"].to_numpy()
+    obs_keys = observations_and_responses["observation_key"].to_numpy()
+    indexes = observations_and_responses["index"].to_numpy()
 
     # Inflating measurement errors by a factor sqrt(global_std_scaling) as shown
     # in for example evensen2018 - Analysis of iterative ensemble smoothers for
@@ -419,11 +417,11 @@ def _copy_unupdated_parameters(
         set(all_parameter_groups) - set(updated_parameter_groups)
     )
 
-    # Copy the non-updated parameter groups from source to target for each active realization
+    # Copy the non-updated parameter groups from source to target for all active realizations
     for parameter_group in not_updated_parameter_groups:
-        for realization in iens_active_index:
-            ds = source_ensemble.load_parameters(parameter_group, realization)
-            target_ensemble.save_parameters(parameter_group, realization, ds)
+        target_ensemble.copy_parameters(
+            source_ensemble, parameter_group, iens_active_index
+        )
 
 
 def analysis_ES(
@@ -541,88 +539,97 @@ def correlation_callback(
     ) -> None:
         cross_correlations_accumulator.append(cross_correlations_of_batch)
 
-    for param_group in parameters:
-        param_ensemble_array = _load_param_ensemble_array(
-            source_ensemble, param_group, iens_active_index
-        )
-        if module.localization:
-            config_node = source_ensemble.experiment.parameter_configuration[
-                param_group
-            ]
-            num_params = param_ensemble_array.shape[0]
-            batch_size = _calculate_adaptive_batch_size(num_params, num_obs)
-            batches = _split_by_batchsize(np.arange(0, num_params), batch_size)
-
-            log_msg = f"Running localization on {num_params} parameters, {num_obs} responses, {ensemble_size} realizations and {len(batches)} batches"
-            logger.info(log_msg)
-            progress_callback(AnalysisStatusEvent(msg=log_msg))
-
-            start = time.time()
-            cross_correlations: list[npt.NDArray[np.float64]] = []
-            for param_batch_idx in batches:
-                X_local = param_ensemble_array[param_batch_idx, :]
-                if isinstance(config_node, GenKwConfig):
-                    correlation_batch_callback = functools.partial(
-                        correlation_callback,
-                        cross_correlations_accumulator=cross_correlations,
-                    )
-                else:
-                    correlation_batch_callback = None
-                param_ensemble_array[param_batch_idx, :] = (
-                    smoother_adaptive_es.assimilate(
-                        X=X_local,
-                        Y=S,
-                        D=D,
-                        alpha=1.0,  # The user is responsible for scaling observation covariance (esmda usage)
-                        correlation_threshold=module.correlation_threshold,
-                        cov_YY=cov_YY,
-                        progress_callback=adaptive_localization_progress_callback,
-                        correlation_callback=correlation_batch_callback,
+    # Storing a parameter group is done in the background while the next
+    # group is updated, with at most one group waiting to be stored
+    pending_write: Future[None] | None = None
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        for param_group in parameters:
+            param_ensemble_array = _load_param_ensemble_array(
+                source_ensemble, param_group, iens_active_index
+            )
+            if module.localization:
+                config_node = source_ensemble.experiment.parameter_configuration[
+                    param_group
+                ]
+                num_params = param_ensemble_array.shape[0]
+                batch_size = _calculate_adaptive_batch_size(num_params, num_obs)
+                batches = _split_by_batchsize(np.arange(0, num_params), batch_size)
+
+                log_msg = f"Running localization on {num_params} parameters, {num_obs} responses, {ensemble_size} realizations and {len(batches)} batches"
+                logger.info(log_msg)
+                progress_callback(AnalysisStatusEvent(msg=log_msg))
+
+                start = time.time()
+                cross_correlations: list[npt.NDArray[np.float64]] = []
+                for param_batch_idx in batches:
+                    X_local = param_ensemble_array[param_batch_idx, :]
+                    if isinstance(config_node, GenKwConfig):
+                        correlation_batch_callback = functools.partial(
+                            correlation_callback,
+                            cross_correlations_accumulator=cross_correlations,
+                        )
+                    else:
+                        correlation_batch_callback = None
+                    param_ensemble_array[param_batch_idx, :] = (
+                        smoother_adaptive_es.assimilate(
+                            X=X_local,
+                            Y=S,
+                            D=D,
+                            alpha=1.0,  # The user is responsible for scaling observation covariance (esmda usage)
+                            correlation_threshold=module.correlation_threshold,
+                            cov_YY=cov_YY,
+                            progress_callback=adaptive_localization_progress_callback,
+                            correlation_callback=correlation_batch_callback,
+                        )
                     )
+
+                if cross_correlations:
+                    assert isinstance(config_node, GenKwConfig)
+                    parameter_names = [
+                        t["name"]  # type: ignore
+                        for t in config_node.transform_function_definitions
+                    ]
+                    cross_correlations_ = np.vstack(cross_correlations)
+                    if cross_correlations_.size != 0:
+                        source_ensemble.save_cross_correlations(
+                            cross_correlations_,
+                            param_group,
+                            parameter_names[: cross_correlations_.shape[0]],
+                        )
+                logger.info(
+                    f"Adaptive Localization of {param_group} completed in {(time.time() - start) / 60} minutes"
                 )
 
-            if cross_correlations:
-                assert isinstance(config_node, GenKwConfig)
-                parameter_names = [
-                    t["name"]  # type: ignore
-                    for t in config_node.transform_function_definitions
-                ]
-                cross_correlations_ = np.vstack(cross_correlations)
-                if cross_correlations_.size != 0:
-                    source_ensemble.save_cross_correlations(
-                        cross_correlations_,
-                        param_group,
-                        parameter_names[: cross_correlations_.shape[0]],
-                    )
-            logger.info(
-                f"Adaptive Localization of {param_group} completed in {(time.time() - start) / 60} minutes"
-            )
+            else:
+                # In-place multiplication is not yet supported, therefore avoiding @=
+                param_ensemble_array = param_ensemble_array @ T.astype(  # noqa: PLR6104
+                    param_ensemble_array.dtype
+                )
 
-        else:
-            # In-place multiplication is not yet supported, therefore avoiding @=
-            param_ensemble_array = param_ensemble_array @ T.astype(  # noqa: PLR6104
-                param_ensemble_array.dtype
-            )
+            log_msg = f"Storing data for {param_group}.."
+            logger.info(log_msg)
+            progress_callback(AnalysisStatusEvent(msg=log_msg))
 
-        log_msg = f"Storing data for {param_group}.."
-        logger.info(log_msg)
-        progress_callback(AnalysisStatusEvent(msg=log_msg))
-        start = time.time()
+            if pending_write is not None:
+                pending_write.result()
+            pending_write = executor.submit(
+                _save_param_ensemble_array_to_disk,
+                target_ensemble,
+                param_ensemble_array,
+                param_group,
+                iens_active_index,
+            )
 
-        _save_param_ensemble_array_to_disk(
-            target_ensemble, param_ensemble_array, param_group, iens_active_index
-        )
-        logger.info(
-            f"Storing data for {param_group} completed in {(time.time() - start) / 60} minutes"
-        )
+        if pending_write is not None:
+            pending_write.result()
 
-        _copy_unupdated_parameters(
-            list(source_ensemble.experiment.parameter_configuration.keys()),
-            parameters,
-            iens_active_index,
-            source_ensemble,
-            target_ensemble,
-        )
+    _copy_unupdated_parameters(
+        list(source_ensemble.experiment.parameter_configuration.keys()),
+        parameters,
+        iens_active_index,
+        source_ensemble,
+        target_ensemble,
+    )
 
 
 def _create_smoother_snapshot(
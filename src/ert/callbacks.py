@@ -3,7 +3,10 @@
 import asyncio
 import logging
 import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
 from pathlib import Path
+from typing import Any, TypeVar
 
 from ert.config import InvalidResponseFile
 from ert.storage import Ensemble
@@ -13,12 +16,35 @@
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+async def _run_in_executor(
+    executor: Executor | None, func: Callable[..., T], *args: Any
+) -> T:
+    if executor is None:
+        result = func(*args)
+        await asyncio.sleep(0)
+        return result
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+
+async def _write_to_storage(
+    executor: Executor | None, func: Callable[..., None], *args: Any
+) -> None:
+    if isinstance(executor, ProcessPoolExecutor):
+        # Storage is only written from this process
+        await asyncio.to_thread(func, *args)
+    else:
+        await _run_in_executor(executor, func, *args)
+
 
 async def _read_parameters(
     run_path: str,
     realization: int,
     iteration: int,
     ensemble: Ensemble,
+    executor: Executor | None = None,
 ) -> LoadResult:
     result = LoadResult(LoadStatus.LOAD_SUCCESSFUL, "")
     error_msg = ""
@@ -29,15 +55,21 @@ async def _read_parameters(
         try:
             start_time = time.perf_counter()
             logger.debug(f"Starting to load parameter: {config.name}")
-            ds = config.read_from_runpath(Path(run_path), realization, iteration)
-            await asyncio.sleep(0)
+            ds = await _run_in_executor(
+                executor,
+                config.read_from_runpath,
+                Path(run_path),
+                realization,
+                iteration,
+            )
             logger.debug(
                 f"Loaded {config.name}",
                 extra={"Time": f"{(time.perf_counter() - start_time):.4f}s"},
             )
             start_time = time.perf_counter()
-            ensemble.save_parameters(config.name, realization, ds)
-            await asyncio.sleep(0)
+            await _write_to_storage(
+                executor, ensemble.save_parameters, config.name, realization, ds
+            )
             logger.debug(
                 f"Saved {config.name} to storage",
                 extra={"Time": f"{(time.perf_counter() - start_time):.4f}s"},
@@ -53,6 +85,7 @@ async def _write_responses_to_storage(
     run_path: str,
     realization: int,
     ensemble: Ensemble,
+    executor: Executor | None = None,
 ) -> LoadResult:
     errors = []
     response_configs = ensemble.experiment.response_configuration.values()
@@ -61,19 +94,25 @@ async def _write_responses_to_storage(
             start_time = time.perf_counter()
             logger.debug(f"Starting to load response: {config.response_type}")
             try:
-                ds = config.read_from_file(run_path, realization, ensemble.iteration)
+                ds = await _run_in_executor(
+                    executor,
+                    config.read_from_file,
+                    run_path,
+                    realization,
+                    ensemble.iteration,
+                )
             except (FileNotFoundError, InvalidResponseFile) as err:
                 errors.append(str(err))
                 logger.warning(f"Failed to write: {realization}: {err}")
                 continue
-            await asyncio.sleep(0)
             logger.debug(
                 f"Loaded {config.response_type}",
                 extra={"Time": f"{(time.perf_counter() - start_time):.4f}s"},
             )
             start_time = time.perf_counter()
-            ensemble.save_response(config.response_type, ds, realization)
-            await asyncio.sleep(0)
+            await _write_to_storage(
+                executor, ensemble.save_response, config.response_type, ds, realization
+            )
             logger.debug(
                 f"Saved {config.response_type} to storage",
                 extra={"Time": f"{(time.perf_counter() - start_time):.4f}s"},
@@ -96,7 +135,13 @@ async def forward_model_ok(
     realization: int,
     iter: int,
     ensemble: Ensemble,
+    executor: Executor | None = None,
 ) -> LoadResult:
+    """
+    Reads the parameters and responses of a finished realization from its
+    runpath into storage. Reading is done in the executor if one is given,
+    so that several realizations can be read at the same time.
+    """
     parameters_result = LoadResult(LoadStatus.LOAD_SUCCESSFUL, "")
     response_result = LoadResult(LoadStatus.LOAD_SUCCESSFUL, "")
     try:
@@ -108,6 +153,7 @@ async def forward_model_ok(
                 realization,
                 iter,
                 ensemble,
+                executor,
             )
 
         if parameters_result.status == LoadStatus.LOAD_SUCCESSFUL:
@@ -115,6 +161,7 @@ async def forward_model_ok(
                 run_path,
                 realization,
                 ensemble,
+                executor,
             )
 
     except Exception as err:
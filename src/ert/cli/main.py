@@ -40,7 +40,7 @@ def run_cli(args: Namespace, plugin_manager: ErtPluginManager | None = None) ->
     # the config file to be the base name of the original config
     args.config = os.path.basename(args.config)
 
-    ert_config = ErtConfig.with_plugins().from_file(args.config)
+    ert_config = ErtConfig.with_plugins().from_file(args.config, use_cache=True)
 
     local_storage_set_ert_config(ert_config)
     counter_fm_steps = Counter(fms.name for fms in ert_config.forward_model_steps)
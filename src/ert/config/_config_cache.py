@@ -0,0 +1,385 @@
+"""On-disk cache of validated ErtConfigs.
+
+Parsing and validating a configuration reads the config file, its includes,
+the refcase, observation files, grids and surfaces, which takes a long time
+for large projects. The validated configuration is therefore pickled to a
+cache directory together with the content digest of every file it was
+created from. A later ErtConfig.from_file of the same file is served from the
+cache as long as none of those have changed.
+
+The files are found from the parsed config: the config file, its includes,
+the site config, every file named in the config, such as the observation
+config and the grid, the listing and files of the job directories, the
+refcase, the files named in the observation config and the base surfaces.
+Other directories named in the config are tracked by whether they still exist.
+
+As loading a cached config unpickles it, the cache directory must be private
+to the user. It is created with mode 0700, and directories or files that are
+owned by someone else or writable by group or others are not used.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime
+import hashlib
+import io
+import logging
+import os
+import pickle
+import platform
+import stat
+import warnings
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeAlias, TypeVar
+
+from ert.shared import __version__
+
+from ._read_summary import _get_summary_filenames
+from .parsing import ConfigKeys, ConfigWarning
+from .parsing.observations_parser import GenObsValues, ObservationConfigError
+from .parsing.observations_parser import parse as parse_observations
+from .surface_config import SurfaceConfig
+
+if TYPE_CHECKING:
+    from .ert_config import ErtConfig
+
+    T = TypeVar("T", bound=ErtConfig)
+
+logger = logging.getLogger(__name__)
+
+# message, category, filename and line number of a given warning
+_Warning: TypeAlias = tuple[Warning | str, type[Warning], str, int]
+
+CONFIG_CACHE_DIR_ENV = "ERT_CONFIG_CACHE_DIR"
+CACHE_FORMAT_VERSION = 1
+MAX_CACHE_ENTRIES = 8
+
+# Variables the shell changes on its own, which configs never refer to
+_VOLATILE_ENVIRONMENT = {"OLDPWD", "_"}
+# Keywords naming directories whose files are all read
+_SCANNED_DIRECTORY_KEYWORDS = (
+    ConfigKeys.INSTALL_JOB_DIRECTORY,
+    ConfigKeys.WORKFLOW_JOB_DIRECTORY,
+)
+
+
+def config_cache_dir() -> Path | None:
+    """Where configs are cached, or None if caching is disabled.
+
+    Set ERT_CONFIG_CACHE_DIR to choose the directory, or to the empty
+    string to disable the cache. The cached configs are unpickled when
+    loaded, so the directory must be private to the user: it is not used
+    if it is owned by someone else or writable by group or others.
+    """
+    if CONFIG_CACHE_DIR_ENV in os.environ:
+        cache_dir = os.environ[CONFIG_CACHE_DIR_ENV]
+        return Path(cache_dir) if cache_dir else None
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "ert" / "config"
+
+
+@dataclass
+class _Dependencies:
+    files: set[str] = field(default_factory=set)
+    directories: set[str] = field(default_factory=set)
+    existing: set[str] = field(default_factory=set)
+
+
+def _dependencies(
+    config: ErtConfig, user_config_file: str, config_dict: dict[str, Any]
+) -> _Dependencies:
+    """The files and directories config was created from: the config file,
+    its includes and the site config, every path named in the config, the
+    job directories and their files, the refcase, the files named in the
+    observation config and the surfaces"""
+    from .ert_config import site_config_location  # noqa: PLC0415
+
+    dependencies = _Dependencies(files={os.path.abspath(user_config_file)})
+    if site_config_file := site_config_location():
+        dependencies.files.add(os.path.abspath(site_config_file))
+    for path in _paths_in(config_dict):
+        if os.path.isfile(path):
+            dependencies.files.add(path)
+        elif os.path.exists(path):
+            dependencies.existing.add(path)
+
+    for keyword in _SCANNED_DIRECTORY_KEYWORDS:
+        for directory in config_dict.get(keyword, []):
+            # Every file in the directory is read as a job config
+            dependencies.directories.add(directory)
+            with contextlib.suppress(OSError), os.scandir(directory) as entries:
+                dependencies.files.update(
+                    entry.path for entry in entries if entry.is_file()
+                )
+
+    if refcase := config_dict.get(ConfigKeys.REFCASE):
+        # The summary files are found by listing the directory of the refcase
+        dependencies.directories.add(os.path.dirname(refcase) or ".")
+        with contextlib.suppress(OSError):
+            dependencies.files.update(_get_summary_filenames(refcase))
+
+    if obs_config_file := config_dict.get(ConfigKeys.OBS_CONFIG):
+        with contextlib.suppress(OSError, ObservationConfigError):
+            for _, values in parse_observations(obs_config_file):
+                if isinstance(values, GenObsValues):
+                    dependencies.files.update(
+                        filename
+                        for filename in (values.obs_file, values.index_file)
+                        if filename is not None
+                    )
+
+    for parameter in config.ensemble_config.parameter_configs.values():
+        if isinstance(parameter, SurfaceConfig):
+            dependencies.files.add(parameter.base_surface_path)
+
+    dependencies.files = {os.path.abspath(path) for path in dependencies.files}
+    dependencies.directories = {
+        os.path.abspath(path) for path in dependencies.directories
+    }
+    return dependencies
+
+
+def _is_private(stat_result: os.stat_result) -> bool:
+    """Whether only the current user can have written the file"""
+    return stat_result.st_uid == os.getuid() and not (
+        stat_result.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def _paths_in(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        if os.path.isabs(value):
+            yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _paths_in(item)
+    elif isinstance(value, list | tuple):
+        for item in value:
+            yield from _paths_in(item)
+
+
+def _file_digest(path: str) -> str | None:
+    try:
+        with open(path, "rb") as fp:
+            return hashlib.file_digest(
+                fp, lambda: hashlib.blake2b(digest_size=16)
+            ).hexdigest()
+    except OSError:
+        return None
+
+
+def _directory_digest(path: str) -> str | None:
+    try:
+        names = sorted(os.listdir(path))
+    except OSError:
+        return None
+    return hashlib.blake2b("\0".join(names).encode(), digest_size=16).hexdigest()
+
+
+def _existence_digest(path: str) -> str | None:
+    if os.path.isdir(path):
+        return "directory"
+    return "file" if os.path.exists(path) else None
+
+
+_DIGESTS = {
+    "file": _file_digest,
+    "directory": _directory_digest,
+    "existing": _existence_digest,
+}
+
+
+def _digests(dependencies: _Dependencies) -> dict[tuple[str, str], str | None]:
+    return {
+        (kind, path): _DIGESTS[kind](path)
+        for kind, paths in (
+            ("file", dependencies.files),
+            ("directory", dependencies.directories),
+            ("existing", dependencies.existing),
+        )
+        for path in paths
+    }
+
+
+def _is_unchanged(dependencies: dict[tuple[str, str], str | None]) -> bool:
+    for (kind, path), digest in dependencies.items():
+        if _DIGESTS[kind](path) != digest:
+            logger.info(f"Cached config is outdated, {path} has changed")
+            return False
+    return True
+
+
+def _plugin_types(config_cls: type[ErtConfig]) -> dict[str, type]:
+    """Plugins may create their classes at runtime, so these are pickled by
+    name and looked up among the plugins of config_cls when loaded"""
+    types: dict[str, type] = {
+        f"forward_model_step:{name}": type(step)
+        for name, step in config_cls.PREINSTALLED_FORWARD_MODEL_STEPS.items()
+    }
+    for name, workflow in config_cls.PREINSTALLED_WORKFLOWS.items():
+        types[f"workflow:{name}"] = type(workflow)
+        types[f"ert_script:{name}"] = workflow.ert_script
+    return types
+
+
+class _ConfigPickler(pickle.Pickler):
+    def __init__(self, file: io.BufferedIOBase, plugin_types: dict[str, type]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._names = {id(t): name for name, t in plugin_types.items()}
+
+    def persistent_id(self, obj: Any) -> str | None:
+        if isinstance(obj, type):
+            return self._names.get(id(obj))
+        return None
+
+
+class _ConfigUnpickler(pickle.Unpickler):
+    def __init__(self, file: io.BufferedIOBase, plugin_types: dict[str, type]):
+        super().__init__(file)
+        self._plugin_types = plugin_types
+
+    def persistent_load(self, pid: Any) -> type:
+        try:
+            return self._plugin_types[pid]
+        except KeyError as err:
+            raise pickle.UnpicklingError(f"Unknown plugin {pid}") from err
+
+
+def warn_again(given_warnings: list[warnings.WarningMessage]) -> None:
+    """Give warnings recorded with warnings.catch_warnings again"""
+    for message in given_warnings:
+        warnings.warn_explicit(
+            message.message, message.category, message.filename, message.lineno
+        )
+
+
+@dataclass
+class _CacheEntry:
+    dependencies: dict[tuple[str, str], str | None]
+    warnings: list[_Warning]
+    state: dict[str, Any]
+
+
+class ConfigCache:
+    def __init__(self, directory: Path, max_entries: int = MAX_CACHE_ENTRIES):
+        self.directory = directory
+        self.max_entries = max_entries
+
+    def _key(self, config_cls: type[ErtConfig], user_config_file: str) -> str:
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in (
+            CACHE_FORMAT_VERSION,
+            __version__,
+            platform.python_version(),
+            os.path.abspath(user_config_file),
+            os.getcwd(),
+            # <DATE> is substituted with the date of parsing
+            datetime.date.today().isoformat(),
+            sorted(
+                (key, value)
+                for key, value in os.environ.items()
+                if key not in _VOLATILE_ENVIRONMENT
+            ),
+            sorted(config_cls.PREINSTALLED_FORWARD_MODEL_STEPS.items()),
+            sorted(config_cls.PREINSTALLED_WORKFLOWS.items()),
+            config_cls.ENV_PR_FM_STEP,
+            config_cls.ACTIVATE_SCRIPT,
+        ):
+            hasher.update(repr(part).encode())
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def load(self, config_cls: type[T], user_config_file: str) -> T | None:
+        """The cached config for user_config_file, or None if there is no
+        cached config or any file it was created from has changed.
+        Warnings given when the config was created are given again.
+
+        Cached configs in a directory or file that others can write to are
+        not used, as unpickling them could run arbitrary code."""
+        path = self._path(self._key(config_cls, user_config_file))
+        try:
+            if not self._is_private_directory():
+                return None
+            with open(os.open(path, os.O_RDONLY | os.O_NOFOLLOW), "rb") as fp:
+                if not _is_private(os.fstat(fp.fileno())):
+                    logger.warning(
+                        f"Not using cached config {path}, it is not private to the user"
+                    )
+                    return None
+                entry = _ConfigUnpickler(fp, _plugin_types(config_cls)).load()
+        except FileNotFoundError:
+            return None
+        except Exception as err:
+            logger.warning(f"Could not read cached config {path}: {err}")
+            return None
+        if not isinstance(entry, _CacheEntry) or not _is_unchanged(entry.dependencies):
+            return None
+        for message, category, filename, lineno in entry.warnings:
+            warnings.warn_explicit(message, category, filename, lineno)
+        config = config_cls.__new__(config_cls)
+        config.__dict__.update(entry.state)
+        os.utime(path)
+        return config
+
+    def store(
+        self,
+        config: ErtConfig,
+        user_config_file: str,
+        config_dict: dict[str, Any],
+        given_warnings: list[warnings.WarningMessage],
+    ) -> None:
+        entry = _CacheEntry(
+            dependencies=_digests(_dependencies(config, user_config_file, config_dict)),
+            warnings=[
+                (message.message, message.category, message.filename, message.lineno)
+                for message in given_warnings
+                if issubclass(message.category, ConfigWarning)
+            ],
+            state=vars(config),
+        )
+        path = self._path(self._key(type(config), user_config_file))
+        buffer = io.BytesIO()
+        try:
+            _ConfigPickler(buffer, _plugin_types(type(config))).dump(entry)
+        except Exception as err:
+            # E.g. workflows loaded from user scripts can not be pickled
+            logger.info(f"Could not cache config {user_config_file}: {err}")
+            return
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self._is_private_directory():
+                return
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            with open(
+                os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "wb"
+            ) as fp:
+                fp.write(buffer.getbuffer())
+            os.replace(tmp_path, path)
+            self._prune()
+        except OSError as err:
+            logger.warning(f"Could not write cached config {path}: {err}")
+
+    def _is_private_directory(self) -> bool:
+        if _is_private(self.directory.stat()):
+            return True
+        logger.warning(
+            f"Not using config cache {self.directory}, it must be owned by "
+            "the user and not writable by group or others"
+        )
+        return False
+
+    def _prune(self) -> None:
+        """Remove all but the most recently used entries"""
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            with contextlib.suppress(FileNotFoundError):
+                entries.append((path.stat().st_mtime, path))
+        entries.sort(reverse=True)
+        for _, stale in entries[self.max_entries :]:
+            stale.unlink(missing_ok=True)
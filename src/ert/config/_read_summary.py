@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import fnmatch
+import hashlib
 import os
 import os.path
 import re
+import threading
+from collections import OrderedDict
 from collections.abc import Callable, Sequence
 from datetime import datetime, timedelta
 from enum import Enum, auto
 from typing import (
     Any,
+    TypeAlias,
     TypeVar,
 )
 
@@ -233,9 +237,35 @@ def _fetch_keys_to_matcher(fetch_keys: Sequence[str]) -> Callable[[str], bool]:
     return lambda s: regex.fullmatch(s) is not None
 
 
-def _read_spec(
-    spec: str, fetch_keys: Sequence[str]
-) -> tuple[int, datetime, DateUnit, list[str], npt.NDArray[np.int64]]:
+_Spec: TypeAlias = tuple[int, datetime, DateUnit, list[str], npt.NDArray[np.int64]]
+
+# All realizations of an ensemble usually share the same SMSPEC, so the
+# parsed specifications are cached by their content and the keys fetched.
+_SPEC_CACHE_SIZE = 8
+_spec_cache: OrderedDict[tuple[str, tuple[str, ...]], _Spec] = OrderedDict()
+_spec_cache_lock = threading.Lock()
+
+
+def _read_spec(spec: str, fetch_keys: Sequence[str]) -> _Spec:
+    with open(spec, "rb") as fp:
+        digest = hashlib.blake2b(fp.read(), digest_size=16).hexdigest()
+    cache_key = (digest, tuple(fetch_keys))
+    with _spec_cache_lock:
+        cached = _spec_cache.get(cache_key)
+        if cached is not None:
+            _spec_cache.move_to_end(cache_key)
+    if cached is None:
+        cached = _parse_spec(spec, fetch_keys)
+        cached[4].flags.writeable = False
+        with _spec_cache_lock:
+            _spec_cache[cache_key] = cached
+            if len(_spec_cache) > _SPEC_CACHE_SIZE:
+                _spec_cache.popitem(last=False)
+    date_index, date, date_unit, keys, indices = cached
+    return date_index, date, date_unit, list(keys), indices
+
+
+def _parse_spec(spec: str, fetch_keys: Sequence[str]) -> _Spec:
     date = None
     n = None
     nx = None
@@ -415,14 +445,17 @@ def _read_summary(
         format = resfo.Format.UNFORMATTED
 
     last_params = None
-    values: list[npt.NDArray[np.float32]] = []
+    # Grown by doubling, so each PARAMS record is copied straight into place
+    values = np.empty((16, len(indices)), dtype=np.float32)
     dates: list[datetime] = []
 
     def read_params() -> None:
         nonlocal last_params, values
         if last_params is not None:
             vals = _check_vals("PARAMS", summary, last_params.read_array())
-            values.append(vals[indices])
+            if len(dates) == len(values):
+                values = np.resize(values, (2 * len(values), len(indices)))
+            values[len(dates)] = vals[indices]
 
             dates.append(
                 _round_to_seconds(
@@ -443,4 +476,6 @@ def read_params() -> None:
             if kw == "SEQHDR  ":
                 read_params()
         read_params()
-    return np.array(values, dtype=np.float32).T, dates
+    if not dates:
+        return np.array([], dtype=np.float32), dates
+    return values[: len(dates)].T, dates
@@ -4,6 +4,7 @@
 import logging
 import os
 import re
+import warnings
 from collections import defaultdict
 from collections.abc import Sequence
 from dataclasses import field
@@ -11,6 +12,7 @@
 from os import path
 from pathlib import Path
 from typing import (
+    TYPE_CHECKING,
     Any,
     ClassVar,
     Self,
@@ -24,10 +26,14 @@
 from pydantic.dataclasses import dataclass, rebuild_dataclass
 
 from ert.config.parsing.context_values import ContextBoolEncoder
-from ert.plugins import ErtPluginManager
-from ert.plugins.workflow_config import ErtScriptWorkflow
+from ert.plugins.plugin_manager import ErtPluginManager
 from ert.substitutions import Substitutions
 
+from ._config_cache import (
+    ConfigCache,
+    config_cache_dir,
+    warn_again,
+)
 from .analysis_config import AnalysisConfig
 from .ensemble_config import EnsembleConfig
 from .forward_model_step import (
@@ -73,6 +79,9 @@
 from .workflow import Workflow
 from .workflow_job import ErtScriptLoadFailure, WorkflowJob
 
+if TYPE_CHECKING:
+    from ert.plugins import ErtScriptWorkflow
+
 logger = logging.getLogger(__name__)
 
 EMPTY_LINES = re.compile(r"\n[\s\n]*\n")
@@ -294,7 +303,7 @@ def read_templates(config_dict) -> list[tuple[str, str]]:
 def workflows_from_dict(
     content_dict,
     substitutions,
-    installed_workflows: dict[str, ErtScriptWorkflow] | None = None,
+    installed_workflows: dict[str, "ErtScriptWorkflow"] | None = None,
 ):
     workflow_job_info = content_dict.get(ConfigKeys.LOAD_WORKFLOW_JOB, [])
     workflow_job_dir_info = content_dict.get(ConfigKeys.WORKFLOW_JOB_DIRECTORY, [])
@@ -551,7 +560,7 @@ class ErtConfig:
     DEFAULT_ENSPATH: ClassVar[str] = "storage"
     DEFAULT_RUNPATH_FILE: ClassVar[str] = ".ert_runpath_list"
     PREINSTALLED_FORWARD_MODEL_STEPS: ClassVar[dict[str, ForwardModelStep]] = {}
-    PREINSTALLED_WORKFLOWS: ClassVar[dict[str, ErtScriptWorkflow]] = {}
+    PREINSTALLED_WORKFLOWS: ClassVar[dict[str, "ErtScriptWorkflow"]] = {}
     ENV_PR_FM_STEP: ClassVar[dict[str, dict[str, Any]]] = {}
     ACTIVATE_SCRIPT: str | None = None
 
@@ -649,12 +658,16 @@ class ErtConfigWithPlugins(ErtConfig):
         return ErtConfigWithPlugins
 
     @classmethod
-    def from_file(cls, user_config_file: str) -> Self:
+    def from_file(cls, user_config_file: str, use_cache: bool = False) -> Self:
         """
         Reads the given :ref:`User Config File<List of keywords>` and the
         `Site wide configuration` and returns an ErtConfig containing the
         configured values specified in those files.
 
+        With use_cache, the validated config is kept in an on-disk cache
+        (see ERT_CONFIG_CACHE_DIR, which must be private to the user) and
+        returned from there until any of the files it was read from changes.
+
         Raises:
             ConfigValidationError: Signals one or more incorrectly configured
             value(s) that the user needs to fix before ert can run.
@@ -663,6 +676,29 @@ def from_file(cls, user_config_file: str) -> Self:
         Warnings will be issued with :python:`warnings.warn(category=ConfigWarning)`
         when the user should be notified with non-fatal configuration problems.
         """
+        cache_dir = config_cache_dir() if use_cache else None
+        if cache_dir is None:
+            return cls.from_dict(cls._config_dict_from_file(user_config_file))
+
+        cache = ConfigCache(cache_dir)
+        cached = cache.load(cls, user_config_file)
+        if cached is not None:
+            cls._log_config_file(user_config_file, read_file(user_config_file))
+            logger.info(f"Using cached config for {user_config_file}")
+            return cached
+
+        given_warnings: list[warnings.WarningMessage] = []
+        try:
+            with warnings.catch_warnings(record=True) as given_warnings:
+                config_dict = cls._config_dict_from_file(user_config_file)
+                config = cls.from_dict(config_dict)
+        finally:
+            warn_again(given_warnings)
+        cache.store(config, user_config_file, config_dict, given_warnings)
+        return config
+
+    @classmethod
+    def _config_dict_from_file(cls, user_config_file: str) -> ConfigDict:
         user_config_contents = read_file(user_config_file)
         cls._log_config_file(user_config_file, user_config_contents)
         site_config_file = site_config_location()
@@ -673,7 +709,7 @@ def from_file(cls, user_config_file: str) -> Self:
             site_config_file,
         )
         cls._log_config_dict(user_config_dict)
-        return cls.from_dict(user_config_dict)
+        return user_config_dict
 
     @classmethod
     def _config_dict_from_contents(
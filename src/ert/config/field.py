@@ -195,18 +195,34 @@ def save_parameters(
         ds = xr.Dataset({"values": (["x", "y", "z"], ma.filled())})  # type: ignore
         ensemble.save_parameters(group, realization, ds)
 
+    def save_parameters_many(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        data: npt.NDArray[np.float64],
+    ) -> None:
+        values = np.full((len(realizations), self.mask.size), np.nan, dtype=data.dtype)
+        values[:, ~np.asarray(self.mask, dtype=bool).ravel()] = data.T
+        ds = xr.Dataset(
+            {
+                "values": (
+                    ["realizations", "x", "y", "z"],
+                    values.reshape(-1, *self.mask.shape),
+                )
+            }
+        )
+        ensemble.save_parameters_many(group, realizations, ds)
+
     def load_parameters(
         self, ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
-    ) -> npt.NDArray[np.float64]:
-        ds = ensemble.load_parameters(group, realizations)
-        ensemble_size = len(ds.realizations)
-        da = xr.DataArray(
-            [
-                np.ma.MaskedArray(data=d, mask=self.mask).compressed()  # type: ignore
-                for d in ds["values"].values.reshape(ensemble_size, -1)
-            ]
+    ) -> npt.NDArray[np.float32]:
+        return ensemble.load_parameter_values(
+            group,
+            realizations,
+            indices=np.flatnonzero(~np.asarray(self.mask, dtype=bool)),
+            dtype=np.float32,
         )
-        return da.T.to_numpy()
 
     def _fetch_from_ensemble(self, real_nr: int, ensemble: Ensemble) -> xr.DataArray:
         da = ensemble.load_parameters(self.name, real_nr)["values"]
@@ -306,6 +306,30 @@ def sample_or_load(
             }
         )
 
+    def sample_many(self, realizations: npt.ArrayLike, random_seed: int) -> xr.Dataset:
+        """
+        Samples the parameters of all given realizations at once. Gives the
+        same values as sampling each realization through sample_or_load.
+        """
+        keys = [e.name for e in self.transform_functions]
+        parameter_values = self._sample_values(
+            self.name,
+            keys,
+            str(random_seed),
+            realizations,
+        )
+
+        return xr.Dataset(
+            {
+                "values": (["realizations", "names"], parameter_values.T),
+                "transformed_values": (
+                    ["realizations", "names"],
+                    self.transform(parameter_values).T,
+                ),
+                "names": keys,
+            }
+        )
+
     def read_from_runpath(
         self,
         run_path: Path,
@@ -408,6 +432,25 @@ def save_parameters(
         )
         ensemble.save_parameters(group, realization, ds)
 
+    def save_parameters_many(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        data: npt.NDArray[np.float64],
+    ) -> None:
+        ds = xr.Dataset(
+            {
+                "values": (["realizations", "names"], data.T),
+                "transformed_values": (
+                    ["realizations", "names"],
+                    self.transform(data).T,
+                ),
+                "names": [e.name for e in self.transform_functions],
+            }
+        )
+        ensemble.save_parameters_many(group, realizations, ds)
+
     @staticmethod
     def load_parameters(
         ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
@@ -437,7 +480,9 @@ def transform(self, array: npt.ArrayLike) -> npt.NDArray[np.float64]:
         """Transform the input array in accordance with priors
 
         Parameters:
-            array: An array of standard normal values
+            array: An array of standard normal values, either with one value
+                per parameter or of shape (number of parameters, number of
+                realizations)
 
         Returns: Transformed array, where each element has been transformed from
             a standard normal distribution to the distribution set by the user
@@ -491,24 +536,44 @@ def _sample_value(
 
         Note:
         The method uses SHA-256 for hash generation and numpy's default random number generator
-        for sampling. The RNG state is advanced to the 'realization' point before generating
-        a single sample, enhancing efficiency by avoiding the generation of large, unused sample sets.
+        for sampling. The sample is the 'realization'-th value of the standard normal sequence
+        of each key. Use _sample_values to sample many realizations at once.
+        """
+        return GenKwConfig._sample_values(
+            parameter_group_name, keys, global_seed, [realization]
+        )[:, 0]
+
+    @staticmethod
+    def _sample_values(
+        parameter_group_name: str,
+        keys: list[str],
+        global_seed: str,
+        realizations: npt.ArrayLike,
+    ) -> npt.NDArray[np.double]:
+        """
+        Generate sample values for each key in a parameter group and each of
+        the given realizations, see _sample_value.
+
+        The standard normal sequence of each key is drawn once, up to the
+        highest realization, instead of once per realization.
+
+        Returns:
+        - npt.NDArray[np.double]: An array of shape (number of keys, number of
+        realizations) of sample values.
         """
-        parameter_values = []
-        for key in keys:
+        realizations = np.asarray(realizations, dtype=np.int_)
+        parameter_values = np.empty((len(keys), realizations.size))
+        if realizations.size == 0:
+            return parameter_values
+        num_draws = int(realizations.max()) + 1
+        for index, key in enumerate(keys):
             key_hash = sha256(
                 global_seed.encode("utf-8") + f"{parameter_group_name}:{key}".encode()
             )
             seed = np.frombuffer(key_hash.digest(), dtype="uint32")
             rng = np.random.default_rng(seed)
-
-            # Advance the RNG state to the realization point
-            rng.standard_normal(realization)
-
-            # Generate a single sample
-            value = rng.standard_normal(1)
-            parameter_values.append(value[0])
-        return np.array(parameter_values)
+            parameter_values[index] = rng.standard_normal(num_draws)[realizations]
+        return parameter_values
 
     @staticmethod
     def _parse_transform_function_definition(
@@ -564,7 +629,7 @@ class TransformFunction:
     name: str
     transform_function_name: str
     parameter_list: dict[str, float]
-    calc_func: Callable[[float, list[float]], float]
+    calc_func: Callable[[npt.ArrayLike, list[float]], Any]
     use_log: bool = False
 
     def __post_init__(self) -> None:
@@ -572,7 +637,7 @@ def __post_init__(self) -> None:
             self.use_log = True
 
     @staticmethod
-    def trans_errf(x: float, arg: list[float]) -> float:
+    def trans_errf(x: npt.ArrayLike, arg: list[float]) -> Any:
         """
         Width  = 1 => uniform
         Width  > 1 => unimodal peaked
@@ -583,8 +648,8 @@ def trans_errf(x: float, arg: list[float]) -> float:
         The width is a relavant scale for the value of skewness.
         """
         min_, max_, skew, width = arg[0], arg[1], arg[2], arg[3]
-        y = norm(loc=0, scale=width).cdf(x + skew)
-        if np.isnan(y):
+        y = norm(loc=0, scale=width).cdf(np.add(x, skew))
+        if np.isnan(y).any():
             raise ValueError(
                 "Output is nan, likely from triplet (x, skewness, width) "
                 "leading to low/high-probability in normal CDF."
@@ -592,15 +657,15 @@ def trans_errf(x: float, arg: list[float]) -> float:
         return min_ + y * (max_ - min_)
 
     @staticmethod
-    def trans_const(_: float, arg: list[float]) -> float:
-        return arg[0]
+    def trans_const(x: npt.ArrayLike, arg: list[float]) -> Any:
+        return np.full(np.shape(x), arg[0])[()]
 
     @staticmethod
-    def trans_raw(x: float, _: list[float]) -> float:
+    def trans_raw(x: npt.ArrayLike, _: list[float]) -> Any:
         return x
 
     @staticmethod
-    def trans_derrf(x: float, arg: list[float]) -> float:
+    def trans_derrf(x: npt.ArrayLike, arg: list[float]) -> Any:
         """
         Bin the result of `trans_errf` with `min=0` and `max=1` to closest of `nbins`
         linearly spaced values on [0,1]. Finally map [0,1] to [min, max].
@@ -618,72 +683,73 @@ def trans_derrf(x: float, arg: list[float]) -> float:
         bin_index = np.digitize(y, q_checks, right=True)
         y_binned = q_values[bin_index]
         result = min_ + y_binned * (max_ - min_)
-        if result > max_ or result < min_:
+        if np.isnan(result).any():
+            raise ValueError(
+                "trans_derrf returns nan, check that input arguments are reasonable"
+            )
+        if np.any((result > max_) | (result < min_)):
             warnings.warn(
                 "trans_derff suffered from catastrophic loss of precision, clamping to min,max",
                 stacklevel=1,
             )
             return np.clip(result, min_, max_)
-        if np.isnan(result):
-            raise ValueError(
-                "trans_derrf returns nan, check that input arguments are reasonable"
-            )
         return result
 
     @staticmethod
-    def trans_unif(x: float, arg: list[float]) -> float:
+    def trans_unif(x: npt.ArrayLike, arg: list[float]) -> Any:
         min_, max_ = arg[0], arg[1]
         y = norm.cdf(x)
         return y * (max_ - min_) + min_
 
     @staticmethod
-    def trans_dunif(x: float, arg: list[float]) -> float:
+    def trans_dunif(x: npt.ArrayLike, arg: list[float]) -> Any:
         steps, min_, max_ = int(arg[0]), arg[1], arg[2]
         y = norm.cdf(x)
-        return (math.floor(y * steps) / (steps - 1)) * (max_ - min_) + min_
+        return (np.floor(y * steps) / (steps - 1)) * (max_ - min_) + min_
 
     @staticmethod
-    def trans_normal(x: float, arg: list[float]) -> float:
+    def trans_normal(x: npt.ArrayLike, arg: list[float]) -> Any:
         mean, std = arg[0], arg[1]
-        return x * std + mean
+        return np.multiply(x, std) + mean
 
     @staticmethod
-    def trans_truncated_normal(x: float, arg: list[float]) -> float:
+    def trans_truncated_normal(x: npt.ArrayLike, arg: list[float]) -> Any:
         mean, std, min_, max_ = arg[0], arg[1], arg[2], arg[3]
-        y = x * std + mean
-        return max(min(y, max_), min_)  # clamp
+        y = np.multiply(x, std) + mean
+        return np.maximum(np.minimum(y, max_), min_)  # clamp
 
     @staticmethod
-    def trans_lognormal(x: float, arg: list[float]) -> float:
+    def trans_lognormal(x: npt.ArrayLike, arg: list[float]) -> Any:
         # mean is the expectation of log( y )
         mean, std = arg[0], arg[1]
-        return math.exp(x * std + mean)
+        return np.exp(np.multiply(x, std) + mean)
 
     @staticmethod
-    def trans_logunif(x: float, arg: list[float]) -> float:
+    def trans_logunif(x: npt.ArrayLike, arg: list[float]) -> Any:
         log_min, log_max = math.log(arg[0]), math.log(arg[1])
         tmp = norm.cdf(x)
         log_y = log_min + tmp * (log_max - log_min)  # Shift according to max / min
-        return math.exp(log_y)
+        return np.exp(log_y)
 
     @staticmethod
-    def trans_triangular(x: float, arg: list[float]) -> float:
+    def trans_triangular(x: npt.ArrayLike, arg: list[float]) -> Any:
         min_, mode, max_ = arg[0], arg[1], arg[2]
         inv_norm_left = (max_ - min_) * (mode - min_)
         inv_norm_right = (max_ - min_) * (max_ - mode)
         ymode = (mode - min_) / (max_ - min_)
         y = norm.cdf(x)
 
-        if y < ymode:
-            return min_ + math.sqrt(y * inv_norm_left)
-        else:
-            return max_ - math.sqrt((1 - y) * inv_norm_right)
+        return np.where(
+            y < ymode,
+            min_ + np.sqrt(y * inv_norm_left),
+            max_ - np.sqrt((1 - y) * inv_norm_right),
+        )[()]
 
-    def calculate(self, x: float, arg: list[float]) -> float:
+    def calculate(self, x: npt.ArrayLike, arg: list[float]) -> Any:
         return self.calc_func(x, arg)
 
 
-PRIOR_FUNCTIONS: dict[str, Callable[[float, list[float]], float]] = {
+PRIOR_FUNCTIONS: dict[str, Callable[[npt.ArrayLike, list[float]], Any]] = {
     "NORMAL": TransformFunction.trans_normal,
     "LOGNORMAL": TransformFunction.trans_lognormal,
     "TRUNCATED_NORMAL": TransformFunction.trans_truncated_normal,
@@ -10,6 +10,7 @@
 from pydantic import field_validator
 from pydantic.dataclasses import dataclass
 
+from _ert.checksum import CHECKSUM_ALGORITHMS, ChecksumAlgorithm
 from ert.shared.status.utils import byte_with_unit, get_mount_directory
 
 from .parsing import (
@@ -46,6 +47,7 @@ def str_to_datetime(date_str: str) -> datetime:
 DEFAULT_GEN_KW_EXPORT_NAME = "parameters"
 DEFAULT_JOBNAME_FORMAT = "<CONFIG_FILE>-<IENS>"
 DEFAULT_ECLBASE_FORMAT = "ECLBASE<IENS>"
+DEFAULT_CHECKSUM_ALGORITHM: ChecksumAlgorithm = "md5"
 
 FULL_DISK_PERCENTAGE_THRESHOLD = 0.97
 MINIMUM_BYTES_LEFT_ON_DISK_THRESHOLD = 200 * 1000**3  # 200 GB
@@ -62,6 +64,8 @@ class ModelConfig:
     eclbase_format_string: str = DEFAULT_ECLBASE_FORMAT
     gen_kw_export_name: str = DEFAULT_GEN_KW_EXPORT_NAME
     time_map: list[datetime] | None = None
+    checksum_algorithm: ChecksumAlgorithm = DEFAULT_CHECKSUM_ALGORITHM
+    checksum_size_limit: int | None = None
 
     @field_validator("runpath_format_string", mode="before")
     @classmethod
@@ -138,6 +142,15 @@ def from_dict(cls, config_dict: ConfigDict) -> ModelConfig:
                 raise ConfigValidationError.with_context(
                     f"Could not read timemap file {time_map_file}: {err}", time_map_file
                 ) from err
+        checksum_algorithm = config_dict.get(
+            ConfigKeys.CHECKSUM_ALGORITHM, DEFAULT_CHECKSUM_ALGORITHM
+        )
+        if checksum_algorithm not in CHECKSUM_ALGORITHMS:
+            raise ConfigValidationError.with_context(
+                f"CHECKSUM_ALGORITHM must be one of {', '.join(CHECKSUM_ALGORITHMS)}, "
+                f"got {checksum_algorithm!r}",
+                checksum_algorithm,
+            )
         return cls(
             num_realizations=config_dict.get(ConfigKeys.NUM_REALIZATIONS, 1),
             history_source=config_dict.get(
@@ -158,6 +171,8 @@ def from_dict(cls, config_dict: ConfigDict) -> ModelConfig:
                 ConfigKeys.GEN_KW_EXPORT_NAME, DEFAULT_GEN_KW_EXPORT_NAME
             ),
             time_map=time_map,
+            checksum_algorithm=checksum_algorithm,
+            checksum_size_limit=config_dict.get(ConfigKeys.CHECKSUM_SIZE_LIMIT),
         )
 
 
@@ -8,7 +8,7 @@
 
 from .general_observation import GenObservation
 from .parsing import ObservationType
-from .summary_observation import SummaryObservation
+from .summary_observation import SummaryObservation, SummaryObservationColumns
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -21,7 +21,10 @@ class ObsVector:
     observation_type: ObservationType
     observation_key: str
     data_key: str
-    observations: dict[int | datetime, GenObservation | SummaryObservation]
+    observations: (
+        dict[int | datetime, GenObservation | SummaryObservation]
+        | SummaryObservationColumns
+    )
 
     def __iter__(self) -> Iterable[SummaryObservation | GenObservation]:
         """Iterate over active report steps; return node"""
@@ -57,6 +60,8 @@ def to_dataset(self, active_list: list[int]) -> pl.DataFrame:
             combined = pl.concat(dataframes)
             return combined
         elif self.observation_type == ObservationType.SUMMARY:
+            if isinstance(self.observations, SummaryObservationColumns):
+                return self._columns_to_dataset(self.observations, active_list)
             observations = []
             actual_response_key = self.observation_key
             actual_observation_keys = []
@@ -85,3 +90,76 @@ def to_dataset(self, active_list: list[int]) -> pl.DataFrame:
             )
         else:
             raise ValueError(f"Unknown observation type {self.observation_type}")
+
+    def _columns_to_dataset(
+        self, columns: SummaryObservationColumns, active_list: list[int]
+    ) -> pl.DataFrame:
+        time = columns.time
+        values = columns.value
+        std = columns.std
+        if active_list:
+            mask = np.isin(np.arange(len(columns)), active_list)
+            time = time.filter(mask)
+            values = values[mask]
+            std = std[mask]
+        return pl.DataFrame(
+            {
+                "response_key": self.observation_key,
+                "observation_key": columns.observation_key,
+                "time": time,
+                "observations": pl.Series(values, dtype=pl.Float32),
+                "std": pl.Series(std, dtype=pl.Float32),
+            }
+        )
+
+
+def summary_dataset(vectors: Iterable[ObsVector]) -> pl.DataFrame | None:
+    """Build the dataset of many summary observation vectors at once.
+
+    Vectors holding a single observation each are collected into the same
+    columns instead of becoming a dataframe each, and vectors kept as
+    columns are converted without creating an object per observation. The
+    rows are in the same order as concatenating the dataset of each vector.
+    """
+    dataframes = []
+    response_keys: list[str] = []
+    observation_keys: list[str] = []
+    dates: list[datetime] = []
+    values: list[float] = []
+    errors: list[float] = []
+
+    def flush() -> None:
+        if not dates:
+            return
+        dataframes.append(
+            pl.DataFrame(
+                {
+                    "response_key": pl.Series(response_keys, dtype=pl.String),
+                    "observation_key": pl.Series(observation_keys, dtype=pl.String),
+                    "time": pl.Series(dates).dt.cast_time_unit("ms"),
+                    "observations": pl.Series(values, dtype=pl.Float32),
+                    "std": pl.Series(errors, dtype=pl.Float32),
+                }
+            )
+        )
+        for column in (response_keys, observation_keys, dates, values, errors):
+            column.clear()
+
+    for vector in vectors:
+        if isinstance(vector.observations, SummaryObservationColumns):
+            flush()
+            dataframes.append(vector.to_dataset([]))
+            continue
+        for date, node in vector.observations.items():
+            assert isinstance(node, SummaryObservation)
+            response_keys.append(vector.observation_key)
+            observation_keys.append(node.observation_key)
+            dates.append(date)  # type: ignore
+            values.append(node.value)
+            errors.append(node.std)
+    flush()
+
+    dataframes = [df for df in dataframes if not df.is_empty()]
+    if not dataframes:
+        return None
+    return pl.concat(dataframes)
@@ -12,7 +12,7 @@
 
 from .gen_data_config import GenDataConfig
 from .general_observation import GenObservation
-from .observation_vector import ObsVector
+from .observation_vector import ObsVector, summary_dataset
 from .parsing import ConfigWarning, HistorySource, ObservationType
 from .parsing.observations_parser import (
     DateValues,
@@ -22,7 +22,7 @@
     ObservationConfigError,
     SummaryValues,
 )
-from .summary_observation import SummaryObservation
+from .summary_observation import SummaryObservation, SummaryObservationColumns
 
 if TYPE_CHECKING:
     import numpy.typing as npt
@@ -44,14 +44,15 @@ class EnkfObs:
 
     def __post_init__(self) -> None:
         grouped: dict[str, list[pl.DataFrame]] = {}
+        summary = summary_dataset(
+            vec
+            for vec in self.obs_vectors.values()
+            if vec.observation_type == ObservationType.SUMMARY
+        )
+        if summary is not None:
+            grouped["summary"] = [summary]
         for vec in self.obs_vectors.values():
-            if vec.observation_type == ObservationType.SUMMARY:
-                if "summary" not in grouped:
-                    grouped["summary"] = []
-
-                grouped["summary"].append(vec.to_dataset([]))
-
-            elif vec.observation_type == ObservationType.GENERAL:
+            if vec.observation_type == ObservationType.GENERAL:
                 if "gen_data" not in grouped:
                     grouped["gen_data"] = []
 
@@ -132,7 +133,6 @@ def _handle_history_observation(
         refcase = ensemble_config.refcase
         if refcase is None:
             raise ObservationConfigError("REFCASE is required for HISTORY_OBSERVATION")
-        error = history_observation.error
 
         if history_type == HistorySource.REFCASE_HISTORY:
             local_key = history_key(summary_key)
@@ -140,9 +140,9 @@ def _handle_history_observation(
             local_key = summary_key
         if local_key is None:
             return {}
-        if local_key not in refcase.keys:
+        if local_key not in refcase.key_index:
             return {}
-        values = refcase.values[refcase.keys.index(local_key)]
+        values = refcase.values[refcase.key_index[local_key]].astype(np.double)
         std_dev = cls._handle_error_mode(values, history_observation)
         for segment_name, segment_instance in history_observation.segment:
             start = segment_instance.start
@@ -180,16 +180,19 @@ def _handle_history_observation(
                 values[start:stop],
                 segment_instance,
             )
-        data: dict[int | datetime, GenObservation | SummaryObservation] = {}
-        for date, error, value in zip(refcase.dates, std_dev, values, strict=False):
-            data[date] = SummaryObservation(summary_key, summary_key, value, error)
-
         return {
             summary_key: ObsVector(
                 ObservationType.SUMMARY,
                 summary_key,
                 "summary",
-                data,
+                SummaryObservationColumns(
+                    summary_key,
+                    summary_key,
+                    refcase.dates,
+                    values,
+                    std_dev,
+                    refcase.time_series,
+                ),
             )
         }
 
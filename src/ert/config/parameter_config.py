@@ -98,6 +98,21 @@ def save_parameters(
         Save the parameter in internal storage for the given ensemble
         """
 
+    def save_parameters_many(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        data: npt.NDArray[np.float64],
+    ) -> None:
+        """
+        Save the parameter for several realizations in internal storage for the
+        given ensemble. Data has shape (number of parameters, number of
+        realizations).
+        """
+        for i, realization in enumerate(realizations):
+            self.save_parameters(ensemble, group, realization, data[:, i])
+
     @abstractmethod
     def load_parameters(
         self, ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
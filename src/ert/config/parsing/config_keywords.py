@@ -56,3 +56,5 @@ class ConfigKeys(StrEnum):
     CONFIG_DIRECTORY = "CONFIG_DIRECTORY"
     SUBMIT_SLEEP = "SUBMIT_SLEEP"
     MAX_RUNNING = "MAX_RUNNING"
+    CHECKSUM_ALGORITHM = "CHECKSUM_ALGORITHM"
+    CHECKSUM_SIZE_LIMIT = "CHECKSUM_SIZE_LIMIT"
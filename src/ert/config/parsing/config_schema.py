@@ -347,6 +347,8 @@ def init_user_config_schema() -> ConfigSchemaDict:
         existing_path_keyword(ConfigKeys.TIME_MAP),
         single_arg_keyword(ConfigKeys.GEN_KW_EXPORT_NAME),
         history_source_keyword(),
+        single_arg_keyword(ConfigKeys.CHECKSUM_ALGORITHM),
+        positive_int_keyword(ConfigKeys.CHECKSUM_SIZE_LIMIT),
         path_keyword(ConfigKeys.RUNPATH_FILE),
         positive_int_keyword(ConfigKeys.MAX_SUBMIT),
         positive_int_keyword(ConfigKeys.NUM_CPU),
@@ -41,6 +41,9 @@ def __new__(
         obj.keyword_token = keyword_token
         return obj
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (ContextInt, (int(self), self.token, self.keyword_token))
+
     @no_type_check
     def __deepcopy__(self, memo):
         new_instance = ContextInt(int(self), self.token, self.keyword_token)
@@ -57,6 +60,9 @@ def __new__(
         obj.keyword_token = keyword_token
         return obj
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (ContextFloat, (float(self), self.token, self.keyword_token))
+
     @no_type_check
     def __deepcopy__(self, memo):
         new_instance = ContextFloat(float(self), self.token, self.keyword_token)
@@ -77,6 +83,9 @@ def __new__(
         obj.keyword_token = keyword_token
         return obj
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (ContextString, (str(self), self.token, self.keyword_token))
+
     @no_type_check
     def __deepcopy__(self, memo):
         new_instance = ContextString(str(self), self.token, self.keyword_token)
@@ -1,4 +1,4 @@
-from typing import cast
+from typing import Any, cast
 
 from lark import Token
 
@@ -44,6 +44,23 @@ def __eq__(self, other: object) -> bool:
     def __hash__(self) -> int:  # type: ignore
         return hash(self.value)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Token.__reduce__ leaves out the end position and the filename
+        return (
+            _file_context_token,
+            (
+                self.type,
+                self.value,
+                self.start_pos,
+                self.line,
+                self.column,
+                self.end_line,
+                self.end_column,
+                self.end_pos,
+                self.filename,
+            ),
+        )
+
     @classmethod
     def join_tokens(
         cls, tokens: list["FileContextToken"], separator: str = " "
@@ -81,3 +98,8 @@ def replace_value(self, old: str, new: str, count: int = -1) -> "FileContextToke
             replaced = self.value.replace(old, new, count)
             return FileContextToken(self.update(value=replaced), filename=self.filename)
         return self
+
+
+def _file_context_token(*args: Any) -> FileContextToken:
+    *token_args, filename = args
+    return FileContextToken(Token(*token_args), filename)
@@ -8,6 +8,7 @@
 
 from .config_dict import ConfigDict
 from .config_errors import ConfigValidationError, ConfigWarning
+from .config_keywords import ConfigKeys
 from .config_schema import SchemaItem, define_keyword
 from .error_info import ErrorInfo
 from .schema_dict import SchemaItemDict
@@ -312,6 +313,7 @@ def _handle_includes(
     tree: Tree[Instruction],
     defines: Defines,
     config_file: str,
+    included_files: list[str],
     current_included_file: IncludedFile | None = None,
 ):
     if current_included_file is None:
@@ -383,6 +385,7 @@ def _handle_includes(
                         info.set_context_list(args)
                     errors.append(info)
                 continue
+            included_files.append(file_to_include)
 
             child_included_file = IncludedFile(
                 included_from=current_included_file, filename=file_to_include
@@ -393,6 +396,7 @@ def _handle_includes(
                     sub_tree,
                     defines,
                     file_to_include,
+                    included_files,
                     current_included_file=child_included_file,
                 )
 
@@ -530,11 +534,15 @@ def _transform_tree(
 
     # need to copy pre_defines because _handle_includes will
     # add to this list
-    _handle_includes(tree, pre_defines.copy(), filepath)
+    included_files: list[str] = []
+    _handle_includes(tree, pre_defines.copy(), filepath, included_files)
 
-    return _tree_to_dict(
+    config_dict = _tree_to_dict(
         config_file=file,
         pre_defines=pre_defines,
         tree=tree,
         schema=schema,
     )
+    if included_files:
+        config_dict[ConfigKeys.INCLUDE] = included_files  # type: ignore
+    return config_dict
@@ -101,10 +101,15 @@ def driver_options(self) -> dict[str, Any]:
 @pydantic.dataclasses.dataclass
 class LocalQueueOptions(QueueOptions):
     name: Literal[QueueSystem.LOCAL] = QueueSystem.LOCAL
+    resource_aware: bool = False
+    cpu_affinity: bool = False
 
     @property
     def driver_options(self) -> dict[str, Any]:
-        return {}
+        return {
+            "resource_aware": self.resource_aware,
+            "cpu_affinity": self.cpu_affinity,
+        }
 
 
 @pydantic.dataclasses.dataclass
@@ -117,6 +122,7 @@ class LsfQueueOptions(QueueOptions):
     exclude_host: str | None = None
     lsf_queue: NonEmptyString | None = None
     lsf_resource: str | None = None
+    array_job_size: pydantic.NonNegativeInt = 0
 
     @property
     def driver_options(self) -> dict[str, Any]:
@@ -140,6 +146,7 @@ class TorqueQueueOptions(QueueOptions):
     cluster_label: NonEmptyString | None = None
     job_prefix: NonEmptyString | None = None
     keep_qsub_output: bool = False
+    array_job_size: pydantic.NonNegativeInt = 0
 
     @property
     def driver_options(self) -> dict[str, Any]:
@@ -164,6 +171,7 @@ class SlurmQueueOptions(QueueOptions):
     partition: NonEmptyString | None = None  # aka queue_name
     squeue_timeout: pydantic.PositiveFloat = 2
     max_runtime: pydantic.NonNegativeFloat | None = None
+    array_job_size: pydantic.NonNegativeInt = 0
 
     @property
     def driver_options(self) -> dict[str, Any]:
@@ -1,9 +1,13 @@
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Self
+from functools import cached_property
+from typing import Annotated, Any, Self
 
 import numpy as np
+import numpy.typing as npt
+import polars as pl
+from pydantic import PlainSerializer, PlainValidator, WithJsonSchema
 
 from ._read_summary import read_summary
 from .parsing.config_dict import ConfigDict
@@ -11,12 +15,26 @@
 from .parsing.config_keywords import ConfigKeys
 
 
+def _to_array(values: Any) -> npt.NDArray[np.float32]:
+    return np.asarray(values, dtype=np.float32)
+
+
+SummaryValuesArray = Annotated[
+    npt.NDArray[np.float32],
+    PlainValidator(_to_array),
+    PlainSerializer(lambda values: values.tolist(), return_type=list[list[float]]),
+    WithJsonSchema(
+        {"type": "array", "items": {"type": "array", "items": {"type": "number"}}}
+    ),
+]
+
+
 @dataclass(eq=False)
 class Refcase:
     start_date: datetime
     keys: list[str]
     dates: Sequence[datetime]
-    values: list[list[float]]
+    values: SummaryValuesArray
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Refcase):
@@ -25,13 +43,23 @@ def __eq__(self, other: object) -> bool:
             self.start_date == other.start_date
             and self.keys == other.keys
             and self.dates == other.dates
-            and np.all(self.values == other.values)
+            and np.array_equal(self.values, other.values)
         )
 
     @property
     def all_dates(self) -> list[datetime]:
         return [self.start_date, *self.dates]
 
+    @cached_property
+    def key_index(self) -> dict[str, int]:
+        """The row in values of each key"""
+        return {key: i for i, key in enumerate(self.keys)}
+
+    @cached_property
+    def time_series(self) -> pl.Series:
+        """The dates as the time column of observation datasets"""
+        return pl.Series(self.dates).dt.cast_time_unit("ms")
+
     @classmethod
     def from_config_dict(cls, config_dict: ConfigDict) -> Self | None:
         data = None
@@ -45,7 +73,5 @@ def from_config_dict(cls, config_dict: ConfigDict) -> Self | None:
                 raise ConfigValidationError(f"Could not read refcase: {err}") from err
 
         return (
-            cls(start_date, refcase_keys, time_map, data.tolist())
-            if data is not None
-            else None
+            cls(start_date, refcase_keys, time_map, data) if data is not None else None
         )
@@ -5,6 +5,9 @@
 from datetime import datetime
 from typing import Any, no_type_check
 
+import numpy as np
+import polars as pl
+
 from ert.substitutions import substitute_runpath_name
 
 from ._read_summary import read_summary
@@ -15,7 +18,6 @@
 from .responses_index import responses_index
 
 logger = logging.getLogger(__name__)
-import polars as pl
 
 
 @dataclass
@@ -50,14 +52,16 @@ def read_from_file(self, run_path: str, iens: int, iter: int) -> pl.DataFrame:
         # Important: Pick lowest unit resolution to allow for using
         # datetimes many years into the future
         time_map_series = pl.Series(time_map).dt.cast_time_unit("ms")
+        num_keys, num_times = data.shape
         df = pl.DataFrame(
             {
-                "response_key": keys,
-                "time": [time_map_series for _ in data],
-                "values": [pl.Series(row, dtype=pl.Float32) for row in data],
+                "response_key": pl.Series(keys, dtype=pl.String).gather(
+                    np.repeat(np.arange(num_keys), num_times)
+                ),
+                "time": time_map_series.gather(np.tile(np.arange(num_times), num_keys)),
+                "values": pl.Series(data.ravel(), dtype=pl.Float32),
             }
         )
-        df = df.explode("values", "time")
         df = df.sort(by=["time"])
         return df
 
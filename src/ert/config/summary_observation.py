@@ -1,6 +1,19 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import polars as pl
+from pydantic import GetCoreSchemaHandler
+from pydantic_core import core_schema
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
 
 
 @dataclass
@@ -14,3 +27,75 @@ class SummaryObservation:
     def __post_init__(self) -> None:
         if self.std <= 0:
             raise ValueError("Observation uncertainty must be strictly > 0")
+
+
+class SummaryObservationColumns(Mapping["datetime", SummaryObservation]):
+    """The summary observations of one key at many dates, kept as arrays.
+
+    Behaves as a mapping from date to SummaryObservation, but the
+    observation objects are only created when looked up, so that
+    observation datasets can be built directly from the arrays.
+    """
+
+    def __init__(
+        self,
+        summary_key: str,
+        observation_key: str,
+        dates: Sequence[datetime],
+        values: npt.ArrayLike,
+        std: npt.ArrayLike,
+        time: pl.Series | None = None,
+    ) -> None:
+        self.summary_key = summary_key
+        self.observation_key = observation_key
+        self.dates = dates
+        self.value = np.asarray(values, dtype=np.double)
+        self.std = np.asarray(std, dtype=np.double)
+        if np.any(self.std <= 0):
+            raise ValueError("Observation uncertainty must be strictly > 0")
+        self._time = time
+        self._index: dict[datetime, int] | None = None
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, _source_type: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        # Serialized as the dictionary of observations it stands for
+        dict_schema = handler.generate_schema(dict[datetime, SummaryObservation])
+        return core_schema.json_or_python_schema(
+            json_schema=dict_schema,
+            python_schema=core_schema.is_instance_schema(cls),
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                dict, return_schema=dict_schema
+            ),
+        )
+
+    @property
+    def time(self) -> pl.Series:
+        """The dates as a polars series of millisecond datetimes"""
+        if self._time is None:
+            self._time = pl.Series(list(self.dates)).dt.cast_time_unit("ms")
+        return self._time
+
+    def __getitem__(self, date: datetime) -> SummaryObservation:
+        if self._index is None:
+            self._index = {d: i for i, d in enumerate(self.dates)}
+        i = self._index[date]
+        return SummaryObservation(
+            self.summary_key,
+            self.observation_key,
+            float(self.value[i]),
+            float(self.std[i]),
+        )
+
+    def __iter__(self) -> Iterator[datetime]:
+        return iter(self.dates)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __repr__(self) -> str:
+        return (
+            f"SummaryObservationColumns({self.summary_key!r}, "
+            f"{self.observation_key!r}, {len(self)} dates)"
+        )
@@ -161,6 +161,23 @@ def save_parameters(
         )
         ensemble.save_parameters(group, realization, ds)
 
+    def save_parameters_many(
+        self,
+        ensemble: Ensemble,
+        group: str,
+        realizations: npt.NDArray[np.int_],
+        data: npt.NDArray[np.float64],
+    ) -> None:
+        ds = xr.Dataset(
+            {
+                "values": (
+                    ["realizations", "x", "y"],
+                    data.T.reshape(-1, self.ncol, self.nrow).astype("float32"),
+                )
+            }
+        )
+        ensemble.save_parameters_many(group, realizations, ds)
+
     @staticmethod
     def load_parameters(
         ensemble: Ensemble, group: str, realizations: npt.NDArray[np.int_]
@@ -1,5 +1,7 @@
 import contextlib
 import logging
+import threading
+from collections import OrderedDict
 from collections.abc import Callable, Iterator
 from typing import Any
 from uuid import UUID
@@ -99,17 +101,7 @@ def gen_data_display_keys(ensemble: Ensemble) -> Iterator[str]:
                     yield f"{key}@{report_step}"
 
 
-def data_for_key(
-    ensemble: Ensemble,
-    key: str,
-) -> pd.DataFrame:
-    """Returns a pandas DataFrame with the datapoints for a given key for a
-    given ensemble. The row index is the realization number, and the columns are an
-    index over the indexes/dates"""
-
-    if key.startswith("LOG10_"):
-        key = key[6:]
-
+def _find_response_key(ensemble: Ensemble, key: str) -> str | None:
     response_key_to_response_type = ensemble.experiment.response_key_to_response_type
 
     # Check for exact match first. For example if key is "FOPRH"
@@ -120,9 +112,23 @@ def data_for_key(
             (k for k in response_key_to_response_type if k in key and key != f"{k}H"),
             None,
         )
+    return response_key
+
+
+def data_for_key(
+    ensemble: Ensemble,
+    key: str,
+) -> pd.DataFrame:
+    """Returns a pandas DataFrame with the datapoints for a given key for a
+    given ensemble. The row index is the realization number, and the columns are an
+    index over the indexes/dates"""
+
+    if key.startswith("LOG10_"):
+        key = key[6:]
 
+    response_key = _find_response_key(ensemble, key)
     if response_key is not None:
-        response_type = response_key_to_response_type[response_key]
+        response_type = ensemble.experiment.response_key_to_response_type[response_key]
 
         if response_type == "summary":
             summary_data = ensemble.load_responses(
@@ -219,6 +225,124 @@ def data_for_key(
     return pd.DataFrame()
 
 
+STATISTICS_QUANTILES = {"p10": 0.1, "p33": 0.33, "p50": 0.5, "p67": 0.67, "p90": 0.9}
+_STATISTICS_CACHE_SIZE = 256
+_statistics_cache: OrderedDict[tuple[UUID, str, tuple[int, int]], pd.DataFrame] = (
+    OrderedDict()
+)
+_statistics_cache_lock = threading.Lock()
+
+
+def _response_values(ensemble: Ensemble, key: str) -> tuple[pl.DataFrame, str]:
+    """The values of a response in long format, with the columns
+    "realization", the axis of the response and "values", and the name of
+    that axis"""
+    response_key = _find_response_key(ensemble, key)
+    if response_key is None:
+        return pl.DataFrame(), ""
+    response_type = ensemble.experiment.response_key_to_response_type[response_key]
+
+    if response_type == "summary":
+        return (
+            ensemble.load_responses(
+                response_key,
+                tuple(ensemble.get_realization_list_with_responses()),
+            ).select("realization", "time", "values"),
+            "time",
+        )
+
+    if response_type == "gen_data":
+        try:
+            response_key, report_step = displayed_key_to_response_key["gen_data"](key)
+            assert isinstance(response_key, str)
+            data = ensemble.load_responses(
+                response_key,
+                tuple(np.where(ensemble.get_realization_mask_with_responses())[0]),
+            )
+        except ValueError as err:
+            logger.info(f"Dark storage could not load response {key}: {err}")
+            return pl.DataFrame(), ""
+        return (
+            data.filter(pl.col("report_step").eq(report_step)).select(
+                "realization", "index", "values"
+            ),
+            "index",
+        )
+
+    return pl.DataFrame(), ""
+
+
+def _compute_statistics(ensemble: Ensemble, key: str) -> pd.DataFrame:
+    values, axis = _response_values(ensemble, key)
+    if values.is_empty():
+        return pd.DataFrame()
+
+    value = pl.col("values")
+    statistics = (
+        values.with_columns(value.cast(pl.Float64).fill_nan(None))
+        # Duplicate values are aggregated by mean as in data_for_key
+        .group_by(axis, "realization")
+        .agg(value.mean())
+        .group_by(axis)
+        .agg(
+            value.min().alias("Minimum"),
+            value.max().alias("Maximum"),
+            value.mean().alias("Mean"),
+            *(
+                value.quantile(q, interpolation="linear").alias(name)
+                for name, q in STATISTICS_QUANTILES.items()
+            ),
+            value.std().alias("std"),
+        )
+        .sort(axis)
+        .to_pandas()
+        .set_index(axis)
+        .T
+    )
+    if axis == "time":
+        statistics.columns.name = "Date"
+    else:
+        statistics.columns = statistics.columns.astype(int)
+        statistics.columns.name = "axis"
+    return statistics
+
+
+def _manifest_stat(ensemble: Ensemble) -> tuple[int, int] | None:
+    try:
+        stat = (ensemble.mount_point / "manifest.json").stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns
+
+
+def statistics_for_key(ensemble: Ensemble, key: str) -> pd.DataFrame:
+    """Returns a pandas DataFrame with statistics over the realizations for a
+    given response key for a given ensemble. The row index is the statistic
+    (Minimum, Maximum, Mean, p10, p33, p50, p67, p90 and std), and the columns
+    are an index over the indexes/dates, as in data_for_key.
+
+    The statistics are cached until responses are saved to the ensemble."""
+    if key.startswith("LOG10_"):
+        key = key[6:]
+
+    generation = _manifest_stat(ensemble)
+    if generation is None:
+        return _compute_statistics(ensemble, key)
+
+    cache_key = (ensemble.id, key, generation)
+    with _statistics_cache_lock:
+        if cache_key in _statistics_cache:
+            _statistics_cache.move_to_end(cache_key)
+            return _statistics_cache[cache_key].copy()
+
+    statistics = _compute_statistics(ensemble, key)
+    with _statistics_cache_lock:
+        _statistics_cache[cache_key] = statistics
+        while len(_statistics_cache) > _STATISTICS_CACHE_SIZE:
+            _statistics_cache.popitem(last=False)
+    return statistics.copy()
+
+
 def _get_observations(
     experiment: Experiment, observation_keys: list[str] | None = None
 ) -> list[dict[str, Any]]:
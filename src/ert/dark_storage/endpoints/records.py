@@ -5,6 +5,7 @@
 from uuid import UUID, uuid4
 
 import numpy as np
+import pandas as pd
 from fastapi import APIRouter, Body, Depends, File, Header, HTTPException, status
 from fastapi.responses import Response
 
@@ -16,6 +17,7 @@
     get_observation_keys_for_response,
     get_observations_for_obs_keys,
     response_key_to_displayed_key,
+    statistics_for_key,
 )
 from ert.dark_storage.enkf import get_storage
 from ert.storage import Storage
@@ -86,6 +88,37 @@ async def get_ensemble_record(
         dataframe = data_for_key(storage.get_ensemble(ensemble_id), name)
     except PermissionError as e:
         raise HTTPException(status_code=401, detail=str(e)) from e
+    return _dataframe_response(dataframe, accept)
+
+
+@router.get(
+    "/ensembles/{ensemble_id}/records/{name}/statistics",
+    responses={
+        status.HTTP_200_OK: {
+            "content": {
+                "application/json": {},
+                "text/csv": {},
+                "application/x-parquet": {},
+            }
+        },
+    },
+)
+def get_ensemble_record_statistics(
+    *,
+    storage: Storage = DEFAULT_STORAGE,
+    name: str,
+    ensemble_id: UUID,
+    accept: Annotated[str | None, Header()] = None,
+) -> Response:
+    name = unquote(name)
+    try:
+        dataframe = statistics_for_key(storage.get_ensemble(ensemble_id), name)
+    except PermissionError as e:
+        raise HTTPException(status_code=401, detail=str(e)) from e
+    return _dataframe_response(dataframe, accept)
+
+
+def _dataframe_response(dataframe: pd.DataFrame, accept: str | None) -> Response:
     media_type = accept if accept is not None else "text/csv"
     if media_type == "application/x-parquet":
         dataframe.columns = [str(s) for s in dataframe.columns]
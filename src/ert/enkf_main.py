@@ -3,7 +3,8 @@
 import json
 import logging
 import os
-from collections.abc import Iterable, Mapping
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -13,6 +14,7 @@
 import xarray as xr
 from numpy.random import SeedSequence
 
+from _ert.checksum import MANIFEST_CHECKSUM_KEY, ChecksumAlgorithm
 from ert.substitutions import Substitutions, substitute_runpath_name
 from ert.utils import log_duration
 
@@ -123,8 +125,14 @@ def _generate_parameter_files(
     _value_export_json(run_path, export_base_name, exports)
 
 
-def _manifest_to_json(ensemble: Ensemble, iens: int, iter: int) -> dict[str, Any]:
-    manifest = {}
+def _manifest_to_json(
+    ensemble: Ensemble,
+    iens: int,
+    iter: int,
+    checksum_algorithm: ChecksumAlgorithm = "md5",
+    checksum_size_limit: int | None = None,
+) -> dict[str, Any]:
+    manifest: dict[str, Any] = {}
     # Add expected parameter files to manifest
     for param_config in ensemble.experiment.parameter_configuration.values():
         assert isinstance(
@@ -143,7 +151,14 @@ def _manifest_to_json(ensemble: Ensemble, iens: int, iter: int) -> dict[str, Any
             manifest[f"{response_config.response_type}_{input_file}"] = (
                 substitute_runpath_name(input_file, iens, iter)
             )
-
+    # The forward model runner checksums the files with md5 unless told
+    # otherwise. Older runners read every entry as a file, so the settings
+    # are only written when they differ from the default.
+    if checksum_algorithm != "md5" or checksum_size_limit is not None:
+        manifest[MANIFEST_CHECKSUM_KEY] = {
+            "algorithm": checksum_algorithm,
+            "size_limit": checksum_size_limit,
+        }
     return manifest
 
 
@@ -169,20 +184,16 @@ def save_design_matrix_to_ensemble(
     design_group_name: str = DESIGN_MATRIX_GROUP,
 ) -> None:
     assert not design_matrix_df.empty
-    for realization_nr in active_realizations:
-        row = design_matrix_df.loc[realization_nr]
-        ds = xr.Dataset(
-            {
-                "values": ("names", list(row.values)),
-                "transformed_values": ("names", list(row.values)),
-                "names": list(row.keys()),
-            }
-        )
-        ensemble.save_parameters(
-            design_group_name,
-            realization_nr,
-            ds,
-        )
+    realizations = list(active_realizations)
+    rows = design_matrix_df.loc[realizations]
+    ds = xr.Dataset(
+        {
+            "values": (["realizations", "names"], rows.values),
+            "transformed_values": (["realizations", "names"], rows.values),
+            "names": list(rows.columns),
+        }
+    )
+    ensemble.save_parameters_many(design_group_name, realizations, ds)
 
 
 @log_duration(
@@ -201,6 +212,7 @@ def sample_prior(
     until after the forward model has completed.
     """
     random_seed = _seed_sequence(random_seed)
+    active_realizations = list(active_realizations)
     parameter_configs = ensemble.experiment.parameter_configuration
     if parameters is None:
         parameters = list(parameter_configs.keys())
@@ -211,6 +223,14 @@ def sample_prior(
         logger.info(
             f"Sampling parameter {config_node.name} for realizations {active_realizations}"
         )
+        if isinstance(config_node, GenKwConfig) and not config_node.forward_init_file:
+            if active_realizations:
+                ensemble.save_parameters_many(
+                    parameter,
+                    active_realizations,
+                    config_node.sample_many(active_realizations, random_seed),
+                )
+            continue
         for realization_nr in active_realizations:
             ds = config_node.sample_or_load(
                 realization_nr,
@@ -222,6 +242,94 @@ def sample_prior(
     ensemble.refresh_ensemble_state()
 
 
+def _read_templates(templates: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Reads the source file of each template, returning (content, target)"""
+    contents = []
+    for source_file, target_file in templates:
+        try:
+            file_content = Path(source_file).read_text("utf-8")
+        except UnicodeDecodeError as e:
+            raise ValueError(
+                f"Unsupported non UTF-8 character found in file: {source_file}"
+            ) from e
+        contents.append((file_content, target_file))
+    return contents
+
+
+def _create_realization_run_path(
+    run_arg: RunArg,
+    ensemble: Ensemble,
+    user_config_file: str,
+    env_vars: dict[str, str],
+    env_pr_fm_step: dict[str, dict[str, Any]],
+    forward_model_steps: list[ForwardModelStep],
+    substitutions: Substitutions,
+    template_contents: list[tuple[str, str]],
+    parameter_configs: list[ParameterConfig],
+    model_config: ModelConfig,
+) -> None:
+    run_path = Path(run_arg.runpath)
+    run_path.mkdir(parents=True, exist_ok=True)
+    for file_content, target_file in template_contents:
+        target_file = substitutions.substitute_real_iter(
+            target_file, run_arg.iens, ensemble.iteration
+        )
+        result = substitutions.substitute_real_iter(
+            file_content,
+            run_arg.iens,
+            ensemble.iteration,
+        )
+        target = run_path / target_file
+        if not target.parent.exists():
+            os.makedirs(
+                target.parent,
+                exist_ok=True,
+            )
+        target.write_text(result)
+
+    _generate_parameter_files(
+        parameter_configs,
+        model_config.gen_kw_export_name,
+        run_path,
+        run_arg.iens,
+        ensemble,
+        ensemble.iteration,
+    )
+
+    path = run_path / "jobs.json"
+    _backup_if_existing(path)
+
+    forward_model_output: dict[str, Any] = create_forward_model_json(
+        context=substitutions,
+        forward_model_steps=forward_model_steps,
+        user_config_file=user_config_file,
+        env_vars=env_vars,
+        env_pr_fm_step=env_pr_fm_step,
+        run_id=run_arg.run_id,
+        iens=run_arg.iens,
+        itr=ensemble.iteration,
+    )
+    with open(run_path / "jobs.json", mode="wb") as fptr:
+        fptr.write(
+            orjson.dumps(
+                forward_model_output,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2,
+            )
+        )
+    # Write MANIFEST file to runpath use to avoid NFS sync issues
+    data = _manifest_to_json(
+        ensemble,
+        run_arg.iens,
+        run_arg.itr,
+        model_config.checksum_algorithm,
+        model_config.checksum_size_limit,
+    )
+    with open(run_path / "manifest.json", mode="wb") as fptr:
+        fptr.write(
+            orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+        )
+
+
 @log_duration(logger, logging.INFO)
 def create_run_path(
     run_args: list[RunArg],
@@ -235,75 +343,48 @@ def create_run_path(
     model_config: ModelConfig,
     runpaths: Runpaths,
     context_env: dict[str, str] | None = None,
+    progress_callback: Callable[[int, int], None] | None = None,
+    max_workers: int | None = None,
 ) -> None:
+    """
+    Creates the runpath of each active realization in a pool of max_workers
+    threads. The template files are only read once. After each runpath is
+    created, progress_callback is called with the number of created runpaths
+    and the number of runpaths to create.
+    """
     if context_env is None:
         context_env = {}
     runpaths.set_ert_ensemble(ensemble.name)
-    for run_arg in run_args:
-        run_path = Path(run_arg.runpath)
-        if run_arg.active:
-            run_path.mkdir(parents=True, exist_ok=True)
-            for source_file, target_file in templates:
-                target_file = substitutions.substitute_real_iter(
-                    target_file, run_arg.iens, ensemble.iteration
-                )
-                try:
-                    file_content = Path(source_file).read_text("utf-8")
-                except UnicodeDecodeError as e:
-                    raise ValueError(
-                        f"Unsupported non UTF-8 character found in file: {source_file}"
-                    ) from e
-
-                result = substitutions.substitute_real_iter(
-                    file_content,
-                    run_arg.iens,
-                    ensemble.iteration,
-                )
-                target = run_path / target_file
-                if not target.parent.exists():
-                    os.makedirs(
-                        target.parent,
-                        exist_ok=True,
-                    )
-                target.write_text(result)
-
-            _generate_parameter_files(
-                ensemble.experiment.parameter_configuration.values(),
-                model_config.gen_kw_export_name,
-                run_path,
-                run_arg.iens,
-                ensemble,
-                ensemble.iteration,
-            )
-
-            path = run_path / "jobs.json"
-            _backup_if_existing(path)
-
-            forward_model_output: dict[str, Any] = create_forward_model_json(
-                context=substitutions,
-                forward_model_steps=forward_model_steps,
-                user_config_file=user_config_file,
-                env_vars={**env_vars, **context_env},
-                env_pr_fm_step=env_pr_fm_step,
-                run_id=run_arg.run_id,
-                iens=run_arg.iens,
-                itr=ensemble.iteration,
-            )
-            with open(run_path / "jobs.json", mode="wb") as fptr:
-                fptr.write(
-                    orjson.dumps(
-                        forward_model_output,
-                        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2,
-                    )
-                )
-            # Write MANIFEST file to runpath use to avoid NFS sync issues
-            data = _manifest_to_json(ensemble, run_arg.iens, run_arg.itr)
-            with open(run_path / "manifest.json", mode="wb") as fptr:
-                fptr.write(
-                    orjson.dumps(
-                        data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
-                    )
+    active_run_args = [run_arg for run_arg in run_args if run_arg.active]
+    if active_run_args:
+        template_contents = _read_templates(templates)
+        parameter_configs = list(ensemble.experiment.parameter_configuration.values())
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(
+                    _create_realization_run_path,
+                    run_arg,
+                    ensemble,
+                    user_config_file,
+                    {**env_vars, **context_env},
+                    env_pr_fm_step,
+                    forward_model_steps,
+                    substitutions,
+                    template_contents,
+                    parameter_configs,
+                    model_config,
                 )
+                for run_arg in active_run_args
+            ]
+            try:
+                for created, future in enumerate(as_completed(futures), start=1):
+                    future.result()
+                    if progress_callback is not None:
+                        progress_callback(created, len(futures))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
 
     runpaths.write_runpath_list(
         [ensemble.iteration], [real.iens for real in run_args if real.active]
@@ -15,7 +15,6 @@
     ForwardModelStepSuccess,
     Id,
     event_from_dict,
-    event_to_json,
 )
 from _ert.forward_model_runner.client import Client
 from ert.config import ForwardModelStep, QueueConfig
@@ -192,7 +191,7 @@ async def send_event(
         retries: int = 10,
     ) -> None:
         async with Client(url, token) as client:
-            await client.send(event_to_json(event), retries)
+            await client.send_event(event, retries)
 
     def generate_event_creator(self) -> Callable[[Id.ENSEMBLE_TYPES], Event]:
         def event_builder(status: str) -> Event:
@@ -3,12 +3,15 @@
 import asyncio
 import datetime
 import logging
+import time
 import traceback
 from collections.abc import Awaitable, Callable, Iterable, Sequence
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, get_args
 
 import zmq.asyncio
+from opentelemetry import metrics
 
 from _ert.events import (
     EESnapshot,
@@ -24,9 +27,10 @@
     FMEvent,
     ForwardModelStepChecksum,
     RealizationEvent,
-    dispatch_event_from_json,
-    event_from_json,
-    event_to_json,
+    WireFormat,
+    dispatch_event_from_bytes,
+    event_from_bytes,
+    event_to_bytes,
 )
 from _ert.forward_model_runner.client import (
     ACK_MSG,
@@ -34,6 +38,9 @@
     DISCONNECT_MSG,
     HEARTBEAT_MSG,
     HEARTBEAT_TIMEOUT,
+    MSGPACK_WIRE_FORMAT,
+    WIRE_FORMAT_PROPERTY,
+    peer_wire_format,
 )
 from ert.ensemble_evaluator import identifiers as ids
 
@@ -51,6 +58,80 @@
 
 EVENT_HANDLER = Callable[[list[Event]], Awaitable[None]]
 
+meter = metrics.get_meter("ert.ensemble_evaluator")
+_events_counter = meter.create_counter(
+    "ert.evaluator.events",
+    unit="{event}",
+    description="Number of events received by the evaluator",
+)
+_batch_size_histogram = meter.create_histogram(
+    "ert.evaluator.batch_size",
+    unit="{event}",
+    description="Number of events in each batch handled by the evaluator",
+)
+_queue_depth_histogram = meter.create_histogram(
+    "ert.evaluator.queue_depth",
+    unit="{event}",
+    description="Number of events waiting to be batched when a batch is flushed",
+)
+_handler_latency_histogram = meter.create_histogram(
+    "ert.evaluator.handler_latency",
+    unit="s",
+    description="Time spent handling a batch of events",
+)
+
+
+@dataclass
+class EvaluatorMetrics:
+    """Counters for the events handled by the evaluator.
+
+    The same numbers are recorded with OpenTelemetry under the
+    ``ert.evaluator`` prefix, and are logged when the evaluator is done.
+    """
+
+    events: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+    max_queue_depth: int = 0
+    handler_seconds: float = 0.0
+    start_time: float = field(default_factory=time.monotonic)
+
+    @property
+    def events_per_second(self) -> float:
+        elapsed = time.monotonic() - self.start_time
+        return self.events / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.events / self.batches if self.batches else 0.0
+
+    @property
+    def mean_handler_latency(self) -> float:
+        return self.handler_seconds / self.batches if self.batches else 0.0
+
+    def record_batch(self, batch_size: int, queue_depth: int) -> None:
+        self.events += batch_size
+        self.batches += 1
+        self.largest_batch = max(self.largest_batch, batch_size)
+        self.max_queue_depth = max(self.max_queue_depth, queue_depth)
+        _events_counter.add(batch_size)
+        _batch_size_histogram.record(batch_size)
+        _queue_depth_histogram.record(queue_depth)
+
+    def record_handler_latency(self, seconds: float) -> None:
+        self.handler_seconds += seconds
+        _handler_latency_histogram.record(seconds)
+
+    def __str__(self) -> str:
+        return (
+            f"{self.events} events in {self.batches} batches "
+            f"({self.events_per_second:.1f} events/s, "
+            f"mean batch size {self.mean_batch_size:.1f}, "
+            f"largest batch {self.largest_batch}, "
+            f"max queue depth {self.max_queue_depth}, "
+            f"mean handler latency {self.mean_handler_latency * 1000:.1f} ms)"
+        )
+
 
 class HeartbeatEvent(Enum):
     event = HEARTBEAT_MSG
@@ -72,16 +153,35 @@ def __init__(self, ensemble: Ensemble, config: EvaluatorServerConfig):
         self._batch_processing_queue: asyncio.Queue[
             list[tuple[EVENT_HANDLER, Event]]
         ] = asyncio.Queue()
-        self._max_batch_size: int = 500
-        self._batching_interval: float = 0.5
+        # The batch size and interval adapt to the rate of incoming events:
+        # single events are handled right away, while bursts of events are
+        # collected into larger batches to limit the number of snapshot updates
+        self._min_batch_size: int = 500
+        self._max_batch_size: int = self._min_batch_size
+        self._batch_size_limit: int = 5000
+        self._min_batching_interval: float = 0.01
+        self._batching_interval: float = self._min_batching_interval
+        self._max_batching_interval: float = 0.5
+        # The event rate (events/s) where the batching interval is at its largest
+        self._saturated_event_rate: float = 2000.0
+        self._event_rate: float = 0.0
         self._complete_batch: asyncio.Event = asyncio.Event()
+        self._complete_batch.set()
+        self.metrics = EvaluatorMetrics()
         self._server_started: asyncio.Future[None] = asyncio.Future()
         self._clients_connected: set[bytes] = set()
+        self._client_wire_formats: dict[bytes, WireFormat] = {}
         self._clients_empty: asyncio.Event = asyncio.Event()
         self._clients_empty.set()
         self._dispatchers_connected: set[bytes] = set()
         self._dispatchers_empty: asyncio.Event = asyncio.Event()
         self._dispatchers_empty.set()
+        # When closing down, the server keeps answering until no message has
+        # arrived for this long, so that connections in flight are answered
+        self._closing_quiet_period: float = 0.1
+        self._last_message_time: float = 0.0
+        self._closing_down_time: float = 0.0
+        self._terminated: bool = False
 
     async def _do_heartbeat_clients(self) -> None:
         while True:
@@ -94,15 +194,18 @@ async def _do_heartbeat_clients(self) -> None:
     async def _publisher(self) -> None:
         while True:
             event = await self._events_to_send.get()
-            for identity in self._clients_connected:
+            # Each event is serialized once per wire format in use, and the
+            # same bytes are sent to all clients reading that format
+            serialized: dict[WireFormat, bytes] = {}
+            for identity in list(self._clients_connected):
                 if isinstance(event, HeartbeatEvent):
-                    await self._router_socket.send_multipart(
-                        [identity, b"", event.value]
-                    )
+                    message = event.value
                 else:
-                    await self._router_socket.send_multipart(
-                        [identity, b"", event_to_json(event).encode("utf-8")]
-                    )
+                    wire_format = self._client_wire_formats.get(identity, "json")
+                    if wire_format not in serialized:
+                        serialized[wire_format] = event_to_bytes(event, wire_format)
+                    message = serialized[wire_format]
+                await self._router_socket.send_multipart([identity, b"", message])
             self._events_to_send.task_done()
 
     async def _append_message(self, snapshot_update_event: EnsembleSnapshot) -> None:
@@ -120,8 +223,10 @@ async def _process_event_buffer(self) -> None:
                     function_to_events_map[func] = []
                 function_to_events_map[func].append(event)
 
+            start_time = time.perf_counter()
             for func, events in function_to_events_map.items():
                 await func(events)
+            self.metrics.record_handler_latency(time.perf_counter() - start_time)
 
             self._batch_processing_queue.task_done()
 
@@ -138,28 +243,62 @@ def set_event_handler(event_types: set[type[Event]], func: Any) -> None:
         set_event_handler({EnsembleCancelled}, self._cancelled_handler)
         set_event_handler({EnsembleFailed}, self._failed_handler)
 
+        loop = asyncio.get_running_loop()
+        last_flush = loop.time()
         while True:
-            batch: list[tuple[EVENT_HANDLER, Event]] = []
-            start_time = asyncio.get_running_loop().time()
-            while (
-                len(batch) < self._max_batch_size
-                and asyncio.get_running_loop().time() - start_time
-                < self._batching_interval
-            ):
-                self._complete_batch.clear()
-                try:
+            event = await self._events.get()
+            self._complete_batch.clear()
+            batch: list[tuple[EVENT_HANDLER, Event]] = [
+                (event_handler[type(event)], event)
+            ]
+            self._events.task_done()
+            deadline = loop.time() + self._batching_interval
+            while len(batch) < self._max_batch_size:
+                if self._events.empty():
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        event = await asyncio.wait_for(self._events.get(), timeout)
+                    except TimeoutError:
+                        break
+                else:
                     event = self._events.get_nowait()
-                    function = event_handler[type(event)]
-                    batch.append((function, event))
-                    self._events.task_done()
-                except asyncio.QueueEmpty:
-                    await asyncio.sleep(0.1)
-                    continue
+                batch.append((event_handler[type(event)], event))
+                self._events.task_done()
+            self.metrics.record_batch(len(batch), self._events.qsize())
             self._complete_batch.set()
             await self._batch_processing_queue.put(batch)
+            now = loop.time()
+            self._adapt_batching(len(batch), now - last_flush)
+            last_flush = now
             if self._events.qsize() > 2 * self._max_batch_size:
                 logger.info(f"{self._events.qsize()} events left in queue")
 
+    def _adapt_batching(self, batch_size: int, elapsed: float) -> None:
+        """Update the batching interval and size from the rate of events
+        in the last batch. The interval grows linearly with the event rate,
+        and the batch size is twice the number of events expected within
+        the interval, so that bursts are split into several batches."""
+        rate = batch_size / max(elapsed, self._min_batching_interval)
+        self._event_rate = 0.7 * self._event_rate + 0.3 * rate
+        self._batching_interval = min(
+            max(
+                self._max_batching_interval
+                * self._event_rate
+                / self._saturated_event_rate,
+                self._min_batching_interval,
+            ),
+            self._max_batching_interval,
+        )
+        self._max_batch_size = min(
+            max(
+                int(2 * self._event_rate * self._batching_interval),
+                self._min_batch_size,
+            ),
+            self._batch_size_limit,
+        )
+
     async def _fm_handler(self, events: Sequence[FMEvent | RealizationEvent]) -> None:
         await self._append_message(self.ensemble.update_snapshot(events))
 
@@ -212,11 +351,14 @@ async def _failed_handler(self, events: Sequence[EnsembleFailed]) -> None:
     def ensemble(self) -> Ensemble:
         return self._ensemble
 
-    async def handle_client(self, dealer: bytes, frame: bytes) -> None:
+    async def handle_client(
+        self, dealer: bytes, frame: bytes, wire_format: WireFormat = "json"
+    ) -> None:
         if frame == CONNECT_MSG:
             if dealer in self._clients_connected:
                 logger.warning(f"{dealer!r} wants to reconnect.")
             self._clients_connected.add(dealer)
+            self._client_wire_formats[dealer] = wire_format
             self._clients_empty.clear()
             current_snapshot_dict = self._ensemble.snapshot.to_dict()
             event: Event = EESnapshot(
@@ -224,14 +366,26 @@ async def handle_client(self, dealer: bytes, frame: bytes) -> None:
                 ensemble=self.ensemble.id_,
             )
             await self._router_socket.send_multipart(
-                [dealer, b"", event_to_json(event).encode("utf-8")]
+                [dealer, b"", event_to_bytes(event, wire_format)]
             )
+            if self._terminated:
+                # Connected after the other clients were told to terminate
+                await self._router_socket.send_multipart(
+                    [
+                        dealer,
+                        b"",
+                        event_to_bytes(
+                            EETerminated(ensemble=self._ensemble.id_), wire_format
+                        ),
+                    ]
+                )
         elif frame == DISCONNECT_MSG:
             self._clients_connected.discard(dealer)
+            self._client_wire_formats.pop(dealer, None)
             if not self._clients_connected:
                 self._clients_empty.set()
         else:
-            event = event_from_json(frame.decode("utf-8"))
+            event = event_from_bytes(frame)
             if type(event) is EEUserCancel:
                 logger.debug("Client asked to cancel.")
                 await self._signal_cancel()
@@ -248,7 +402,7 @@ async def handle_dispatch(self, dealer: bytes, frame: bytes) -> None:
             if not self._dispatchers_connected:
                 self._dispatchers_empty.set()
         else:
-            event = dispatch_event_from_json(frame.decode("utf-8"))
+            event = dispatch_event_from_bytes(frame)
             if event.ensemble != self.ensemble.id_:
                 logger.info(
                     "Got event from evaluator "
@@ -264,11 +418,19 @@ async def handle_dispatch(self, dealer: bytes, frame: bytes) -> None:
     async def listen_for_messages(self) -> None:
         while True:
             try:
-                dealer, _, frame = await self._router_socket.recv_multipart()
+                dealer_frame, _, zmq_frame = await self._router_socket.recv_multipart(
+                    copy=False
+                )
+                dealer, frame = dealer_frame.bytes, zmq_frame.bytes
+                self._last_message_time = asyncio.get_running_loop().time()
                 await self._router_socket.send_multipart([dealer, b"", ACK_MSG])
                 sender = dealer.decode("utf-8")
                 if sender.startswith("client"):
-                    await self.handle_client(dealer, frame)
+                    await self.handle_client(
+                        dealer,
+                        frame,
+                        peer_wire_format(zmq_frame) if frame == CONNECT_MSG else "json",
+                    )
                 elif sender.startswith("dispatch"):
                     await self.handle_dispatch(dealer, frame)
                 else:
@@ -293,6 +455,9 @@ async def _server(self) -> None:
         try:
             self._router_socket: zmq.asyncio.Socket = zmq_context.socket(zmq.ROUTER)
             self._router_socket.setsockopt(zmq.LINGER, 0)
+            self._router_socket.setsockopt(
+                zmq.METADATA, f"{WIRE_FORMAT_PROPERTY}:{MSGPACK_WIRE_FORMAT}".encode()
+            )
             if self._config.server_public_key and self._config.server_secret_key:
                 self._router_socket.curve_secretkey = self._config.server_secret_key
                 self._router_socket.curve_publickey = self._config.server_public_key
@@ -315,6 +480,7 @@ async def _server(self) -> None:
             return
         try:
             await self._server_done.wait()
+            self._closing_down_time = asyncio.get_running_loop().time()
             try:
                 await asyncio.wait_for(self._dispatchers_empty.wait(), timeout=5)
             except TimeoutError:
@@ -327,8 +493,9 @@ async def _server(self) -> None:
             event = EETerminated(ensemble=self._ensemble.id_)
             await self._events_to_send.put(event)
             await self._events_to_send.join()
+            self._terminated = True
             try:
-                await asyncio.wait_for(self._clients_empty.wait(), timeout=5)
+                await asyncio.wait_for(self._wait_until_quiet(), timeout=5)
             except TimeoutError:
                 logger.warning(
                     "Not all clients were disconnected when closing zmq server!"
@@ -342,6 +509,19 @@ async def _server(self) -> None:
                 logger.warning(f"Failed to clean up zmq context {exc}")
             logger.info("ZMQ cleanup done!")
 
+    async def _wait_until_quiet(self) -> None:
+        """Wait until all clients have disconnected and no message has
+        arrived for the closing quiet period since closing down began"""
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._clients_empty.wait()
+            quiet_for = loop.time() - max(
+                self._last_message_time, self._closing_down_time
+            )
+            if quiet_for >= self._closing_quiet_period:
+                return
+            await asyncio.sleep(self._closing_quiet_period - quiet_for)
+
     def stop(self) -> None:
         self._server_done.set()
 
@@ -453,6 +633,7 @@ async def run_and_get_successful_realizations(self) -> list[int]:
                 ):
                     logger.error(str(result))
                     raise RuntimeError(result) from result
+        logger.info(f"Evaluator handled {self.metrics}")
         logger.debug("Evaluator is done")
         return self._ensemble.get_successful_realizations()
 
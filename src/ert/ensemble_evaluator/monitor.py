@@ -11,8 +11,8 @@
     EEUserCancel,
     EEUserDone,
     Event,
-    event_from_json,
-    event_to_json,
+    WireFormat,
+    event_from_bytes,
 )
 from _ert.forward_model_runner.client import Client
 
@@ -26,21 +26,25 @@ class EventSentinel:
 class Monitor(Client):
     _sentinel: Final = EventSentinel()
 
-    def __init__(self, uri: str, token: str | None = None) -> None:
+    def __init__(
+        self, uri: str, token: str | None = None, wire_format: WireFormat = "msgpack"
+    ) -> None:
         self._id = str(uuid.uuid1()).split("-", maxsplit=1)[0]
         self._event_queue: asyncio.Queue[Event | EventSentinel] = asyncio.Queue()
         self._receiver_timeout: float = 60.0
-        super().__init__(uri, token, dealer_name=f"client-{self._id}")
+        super().__init__(
+            uri, token, dealer_name=f"client-{self._id}", wire_format=wire_format
+        )
 
-    async def process_message(self, msg: str) -> None:
-        event = event_from_json(msg)
+    async def process_message(self, msg: bytes) -> None:
+        event = event_from_bytes(msg)
         await self._event_queue.put(event)
 
     async def signal_cancel(self) -> None:
         await self._event_queue.put(Monitor._sentinel)
         logger.debug(f"monitor-{self._id} asking server to cancel...")
         cancel_event = EEUserCancel(monitor=self._id)
-        await self.send(event_to_json(cancel_event))
+        await self.send_event(cancel_event)
         logger.debug(f"monitor-{self._id} asked server to cancel")
 
     async def signal_done(self) -> None:
@@ -48,7 +52,7 @@ async def signal_done(self) -> None:
         logger.debug(f"monitor-{self._id} informing server monitor is done...")
 
         done_event = EEUserDone(monitor=self._id)
-        await self.send(event_to_json(done_event))
+        await self.send_event(done_event)
         logger.debug(f"monitor-{self._id} informed server monitor is done")
 
     async def track(
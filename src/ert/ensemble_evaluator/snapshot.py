@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import sys
 from collections import Counter, defaultdict
 from collections.abc import Mapping
 from datetime import datetime
@@ -98,6 +99,11 @@ class EnsembleSnapshot:
     We start with an empty snapshot and as realizations progress, we send smaller snapshots only
     containing the changes which are then merged into the initial snapshot. In case a connection
     is dropped, we can send the entire snapshot.
+
+    Snapshots handed to other threads are made with :meth:`copy`, which shares
+    the realization and forward model step entries between the two snapshots.
+    Each entry is copied the first time either snapshot writes to it, so the
+    cost of an update stays proportional to the number of changed entries.
     """
 
     def __init__(self) -> None:
@@ -119,6 +125,12 @@ def __init__(self) -> None:
             sorted_real_ids=[],
             sorted_fm_step_ids=defaultdict(list),
         )
+        # Number of realizations in each status, kept up to date on every
+        # write so that progress reporting does not iterate the ensemble.
+        self._real_status_counts: Counter[str] = Counter()
+        # Entries that may be written in place. None means that no entries
+        # are shared with another snapshot.
+        self._owned_entries: set[RealId | tuple[RealId, FmStepId]] | None = None
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, EnsembleSnapshot):
@@ -138,23 +150,84 @@ def from_nested_dict(cls, source: Mapping[Any, Any]) -> EnsembleSnapshot:
             )
         return ensemble
 
+    def copy(self) -> EnsembleSnapshot:
+        """A copy that shares its entries with this snapshot until written to"""
+        snapshot = EnsembleSnapshot()
+        snapshot._realization_snapshots = self._realization_snapshots.copy()
+        snapshot._fm_step_snapshots = self._fm_step_snapshots.copy()
+        snapshot._ensemble_state = self._ensemble_state
+        snapshot._metadata = self._metadata.copy()
+        snapshot._real_status_counts = self._real_status_counts.copy()
+        snapshot._owned_entries = set()
+        self._owned_entries = set()
+        return snapshot
+
+    def _writable_real(self, real_id: RealId) -> RealizationSnapshot:
+        real = self._realization_snapshots[real_id]
+        if self._owned_entries is not None and real_id not in self._owned_entries:
+            real = self._realization_snapshots[real_id] = real.copy()
+            if "fm_steps" in real:
+                real["fm_steps"] = real["fm_steps"].copy()
+            self._owned_entries.add(real_id)
+        return real
+
+    def _writable_fm_step(
+        self, real_id: RealId, fm_step_id: FmStepId
+    ) -> FMStepSnapshot:
+        fm_step_idx = (real_id, fm_step_id)
+        fm_step = self._fm_step_snapshots[fm_step_idx]
+        if self._owned_entries is not None and fm_step_idx not in self._owned_entries:
+            shared = fm_step
+            fm_step = self._fm_step_snapshots[fm_step_idx] = shared.copy()
+            self._owned_entries.add(fm_step_idx)
+            # Steps added with a realization are also found in its fm_steps,
+            # which must see the copy as well
+            real = self._realization_snapshots.get(real_id, {})
+            if real.get("fm_steps", {}).get(fm_step_id) is shared:
+                self._writable_real(real_id)["fm_steps"][fm_step_id] = fm_step
+        return fm_step
+
+    def _count_status_change(
+        self, previous_status: str | None, status: str | None
+    ) -> None:
+        if previous_status == status:
+            return
+        if previous_status is not None:
+            self._real_status_counts[previous_status] -= 1
+            if self._real_status_counts[previous_status] <= 0:
+                del self._real_status_counts[previous_status]
+        if status is not None:
+            self._real_status_counts[status] += 1
+
+    def _update_real(self, real_id: RealId, values: RealizationSnapshot) -> None:
+        real = self._writable_real(real_id)
+        previous_status = real.get("status")
+        real.update(values)
+        self._count_status_change(previous_status, real.get("status"))
+
     def add_realization(
         self, real_id: RealId, realization: RealizationSnapshot
     ) -> None:
+        previous_status = self._realization_snapshots.get(real_id, {}).get("status")
         self._realization_snapshots[real_id] = realization
+        self._count_status_change(previous_status, realization.get("status"))
+        if self._owned_entries is not None:
+            self._owned_entries.add(real_id)
 
         for fm_step_id, fm_step_snapshot in realization.get("fm_steps", {}).items():
             fm_step_idx = (real_id, fm_step_id)
             self._fm_step_snapshots[fm_step_idx] = fm_step_snapshot
+            if self._owned_entries is not None:
+                self._owned_entries.add(fm_step_idx)
 
     def merge_snapshot(self, ensemble: EnsembleSnapshot) -> EnsembleSnapshot:
         self._metadata.update(ensemble._metadata)
         if ensemble._ensemble_state is not None:
             self._ensemble_state = ensemble._ensemble_state
         for real_id, other_real_data in ensemble._realization_snapshots.items():
-            self._realization_snapshots[real_id].update(other_real_data)
-        for fm_step_id, other_fm_data in ensemble._fm_step_snapshots.items():
-            self._fm_step_snapshots[fm_step_id].update(other_fm_data)
+            self._update_real(real_id, other_real_data)
+        for (real_id, fm_step_id), other_fm_data in ensemble._fm_step_snapshots.items():
+            self._writable_fm_step(real_id, fm_step_id).update(other_fm_data)
         return self
 
     def merge_metadata(self, metadata: EnsembleSnapshotMetadata) -> None:
@@ -168,9 +241,13 @@ def to_dict(self) -> dict[str, Any]:
         if self._ensemble_state:
             dict_["status"] = self._ensemble_state
         if self._realization_snapshots:
-            dict_["reals"] = {
-                k: _filter_nones(v) for k, v in self._realization_snapshots.items()
-            }
+            dict_["reals"] = {}
+            for real_id, real_values in self._realization_snapshots.items():
+                real_dict = _filter_nones(real_values)
+                if "fm_steps" in real_dict:
+                    # The nested dict may be shared with a copy of this snapshot
+                    real_dict["fm_steps"] = real_dict["fm_steps"].copy()
+                dict_["reals"][real_id] = real_dict
 
         for (real_id, fm_id), fm_values_dict in self._fm_step_snapshots.items():
             if "reals" not in dict_:
@@ -233,12 +310,7 @@ def get_successful_realizations(self) -> list[int]:
         ]
 
     def aggregate_real_states(self) -> Counter[str]:
-        counter = Counter(
-            real["status"]
-            for real in self._realization_snapshots.values()
-            if real.get("status") is not None
-        )
-        return counter  # type: ignore
+        return self._real_status_counts.copy()
 
     def data(self) -> Mapping[str, Any]:
         # The gui uses this
@@ -252,8 +324,10 @@ def update_realization(
         end_time: datetime | None = None,
         exec_hosts: str | None = None,
         message: str | None = None,
+        queue_wait_time: float | None = None,
     ) -> EnsembleSnapshot:
-        self._realization_snapshots[real_id].update(
+        self._update_real(
+            real_id,
             _filter_nones(
                 RealizationSnapshot(
                     status=status,
@@ -261,8 +335,9 @@ def update_realization(
                     end_time=end_time,
                     exec_hosts=exec_hosts,
                     message=message,
+                    queue_wait_time=queue_wait_time,
                 )
-            )
+            ),
         )
         return self
 
@@ -300,6 +375,7 @@ def update_from_event(
                 end_time,
                 exec_hosts,
                 message,
+                event.queue_wait_time,
             )
 
             if e_type is RealizationTimeout:
@@ -311,7 +387,7 @@ def update_from_event(
                         fm_idx = (event.real, fm_step_id)
                         if fm_idx not in source_snapshot._fm_step_snapshots:
                             self._fm_step_snapshots[fm_idx] = FMStepSnapshot()
-                        self._fm_step_snapshots[fm_idx].update(
+                        self._writable_fm_step(*fm_idx).update(
                             FMStepSnapshot(
                                 status=state.FORWARD_MODEL_STATE_FAILURE,
                                 end_time=end_time,
@@ -328,7 +404,7 @@ def update_from_event(
                         fm_idx = (event.real, fm_step_id)
                         if fm_idx not in source_snapshot._fm_step_snapshots:
                             self._fm_step_snapshots[fm_idx] = FMStepSnapshot()
-                        self._fm_step_snapshots[fm_idx].update(
+                        self._writable_fm_step(*fm_idx).update(
                             FMStepSnapshot(
                                 status=state.FORWARD_MODEL_STATE_FAILURE,
                                 end_time=end_time,
@@ -339,8 +415,7 @@ def update_from_event(
                         )
             elif e_type is RealizationResubmit:
                 for fm_step_id in source_snapshot.get_fm_steps_for_real(event.real):
-                    fm_idx = (event.real, fm_step_id)
-                    self._fm_step_snapshots[fm_idx].update(
+                    self._writable_fm_step(event.real, fm_step_id).update(
                         FMStepSnapshot(
                             status=state.FORWARD_MODEL_STATE_INIT,
                             start_time=None,
@@ -416,7 +491,7 @@ def update_fm_step(
             previous_error := self._fm_step_snapshots[real_id, fm_step_id].get("error")
         ) and fm_step.get("error") == FORWARD_MODEL_TERMINATED_MSG:
             fm_step["error"] = previous_error
-        self._fm_step_snapshots[real_id, fm_step_id].update(fm_step)
+        self._writable_fm_step(real_id, fm_step_id).update(fm_step)
         return self
 
 
@@ -442,21 +517,25 @@ class RealizationSnapshot(TypedDict, total=False):
     exec_hosts: str | None
     fm_steps: dict[str, FMStepSnapshot]
     message: str | None
+    queue_wait_time: float | None
 
 
 def _realization_dict_to_realization_snapshot(
     source: dict[str, Any],
 ) -> RealizationSnapshot:
     realization = RealizationSnapshot(
-        status=source.get("status"),
+        status=_intern_status(source.get("status")),
         active=source.get("active"),
         start_time=convert_iso8601_to_datetime(source.get("start_time")),
         end_time=convert_iso8601_to_datetime(source.get("end_time")),
         exec_hosts=source.get("exec_hosts"),
         message=source.get("message"),
+        queue_wait_time=source.get("queue_wait_time"),
         fm_steps=source.get("fm_steps", {}),
     )
     for step in realization["fm_steps"].values():
+        if step.get("status"):
+            step["status"] = _intern_status(step["status"])
         if step.get("start_time"):
             step["start_time"] = convert_iso8601_to_datetime(step["start_time"])
         if step.get("end_time"):
@@ -464,6 +543,11 @@ def _realization_dict_to_realization_snapshot(
     return _filter_nones(realization)
 
 
+def _intern_status(status: str | None) -> str | None:
+    # Decoded snapshots otherwise hold one copy of the status string per entry
+    return sys.intern(status) if status is not None else None
+
+
 T = TypeVar("T", RealizationSnapshot, FMStepSnapshot)
 
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+import re
+import warnings
 from collections.abc import Iterator
 from contextlib import contextmanager
 from typing import Any, TextIO
@@ -151,6 +153,91 @@ def read_grdecl(grdecl_stream: TextIO) -> Iterator[tuple[str, list[str]]]:
         yield read_grdecl(stream)
 
 
+_COMMENT = re.compile(rb"(?<!\S)--[^\r\n]*")
+
+
+def _find_word(data: bytes, word: bytes) -> int:
+    """The position of the first occurrence of word surrounded by whitespace
+
+    >>> _find_word(b"1/ 2 /", b"/")
+    5
+    """
+    position = data.find(word)
+    while position != -1:
+        end = position + len(word)
+        if data[position - 1 : position].strip() == b"" and (
+            data[end : end + 1].strip() == b""
+        ):
+            return position
+        position = data.find(word, end)
+    return -1
+
+
+def _read_grdecl_record(data: bytes, keyword: str) -> bytes | None:
+    r"""Finds the values of the first record of keyword in the contents of
+    a grdecl file, with the same rules as open_grdecl, without splitting
+    the file into lines and words.
+
+    >>> _read_grdecl_record(b"A\n 1 2 -- c\n 3 / 4\nB\n 5 /", "A")
+    b' 1 2 \n 3 '
+    >>> _read_grdecl_record(b"A\n 1 /", "B") is None
+    True
+    """
+    keyword = _until_space(keyword)
+    if len(keyword) > 8:
+        # Only the first 8 characters of a line are matched against keywords
+        return None
+    pattern = re.escape(keyword.encode("utf-8"))
+    if len(keyword) < 8:
+        pattern += rb"(?=\s|$)"
+    start = re.search(rb"^" + pattern, data, flags=re.MULTILINE)
+    if start is None:
+        return None
+    # The remainder of the line of the keyword is ignored
+    line_end = data.find(b"\n", start.end())
+    body = data[line_end + 1 :] if line_end != -1 else b""
+    if b"--" in body:
+        body = _COMMENT.sub(b"", body)
+    end = _find_word(body, b"/")
+    if end == -1:
+        raise ValueError(f"Reached end of stream while reading {keyword}")
+    return body[:end]
+
+
+def _parse_grdecl_values(
+    record: bytes, dtype: npt.DTypeLike
+) -> npt.NDArray[np.float32]:
+    r"""Parses the whitespace separated values of a grdecl record, expanding
+    repeated values such as 3*0.5.
+
+    >>> _parse_grdecl_values(b" 1 2*0.5\n 3 ", np.float32)
+    array([1. , 0.5, 0.5, 3. ], dtype=float32)
+    """
+    if b"*" not in record and b"'" not in record:
+        with warnings.catch_warnings():
+            # numpy warns when the string contains anything but numbers
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                return np.fromstring(record, dtype=dtype, sep=" ")
+            except DeprecationWarning:
+                pass
+    if b"'" in record:
+        return np.asarray(
+            [
+                value
+                for token in record.decode("utf-8").split()
+                for value in _interpret_token(token)
+            ],
+            dtype=dtype,
+        )
+    tokens = np.array(record.split())
+    multiplicands, stars, values = np.char.partition(tokens, b"*").T
+    repeated = stars == b"*"
+    counts = np.where(repeated, multiplicands, b"1").astype(np.int64)
+    values = np.where(repeated, values, multiplicands)
+    return np.repeat(values.astype(dtype), counts)
+
+
 def import_grdecl(
     filename: str | os.PathLike[str],
     name: str,
@@ -175,18 +262,13 @@ def import_grdecl(
         numpy array with given dimensions and data type read
         from the grdecl file.
     """
-    result = None
-
-    with open_grdecl(filename, keywords=[name]) as kw_generator:
-        try:
-            _, result = next(kw_generator)
-        except StopIteration as si:
-            raise ValueError(
-                f"Did not find field parameter {name} in {filename}"
-            ) from si
+    with open(filename, "rb") as fh:
+        record = _read_grdecl_record(fh.read(), name)
+    if record is None:
+        raise ValueError(f"Did not find field parameter {name} in {filename}")
 
     # The values are stored in F order in the grdecl file
-    f_order_values = np.asarray(result, dtype=dtype)
+    f_order_values = _parse_grdecl_values(record, dtype)
     return np.ascontiguousarray(f_order_values.reshape(dimensions, order="F"))
 
 
@@ -234,10 +316,12 @@ def export_grdecl(
     else:
         with open(file_path, "w", encoding="utf-8") as fh:
             fh.write(param_name + "\n")
-            for i, v in enumerate(values):
-                fh.write(" ")
-                fh.write(f"{v:3e}")
-                if i % 6 == 5:
-                    fh.write("\n")
+            # Six values per line, formatted a chunk of lines at a time
+            line_format = " %e" * 6 + "\n"
+            chunk_size = 6 * 10000
+            for start in range(0, len(values), chunk_size):
+                chunk = values[start : start + chunk_size].tolist()
+                full_lines, rest = divmod(len(chunk), 6)
+                fh.write((line_format * full_lines + " %e" * rest) % tuple(chunk))
 
             fh.write(" /\n")
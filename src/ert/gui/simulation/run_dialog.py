@@ -52,6 +52,7 @@
 from ert.gui.tools.file import FileDialog
 from ert.run_models import (
     BaseRunModelAPI,
+    RunModelRunpathEvent,
     RunModelStatusEvent,
     RunModelTimeEvent,
     RunModelUpdateBeginEvent,
@@ -467,6 +468,12 @@ def _on_event(self, event: object) -> None:
                 self._progress_widget.stop_waiting_progress_bar()
                 self._get_update_widget(event.iteration).end(event)
                 event.write_as_csv(self.output_path)
+            case RunModelRunpathEvent(created=created, total=total):
+                self.update_total_progress(
+                    self._total_progress_bar.value() / 100,
+                    f"Creating runpaths for iteration {event.iteration}: "
+                    f"{created}/{total}",
+                )
             case RunModelStatusEvent() | RunModelTimeEvent():
                 self._get_update_widget(event.iteration).update_status(event)
             case RunModelDataEvent():
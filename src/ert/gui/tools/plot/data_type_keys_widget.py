@@ -124,6 +124,25 @@ def getSelectedItem(self) -> PlotApiKeyDefinition | None:
         item = self.model.itemAt(source_index)
         return item
 
+    def getNeighbouringItems(self, count: int) -> list[PlotApiKeyDefinition]:
+        """The items up to count rows above and below the selected item, as
+        shown after filtering, nearest first"""
+        row = self.data_type_keys_widget.currentIndex().row()
+        if row < 0:
+            return []
+        items = []
+        for distance in range(1, count + 1):
+            for neighbour in (row + distance, row - distance):
+                if 0 <= neighbour < self.filter_model.rowCount():
+                    item = self.model.itemAt(
+                        self.filter_model.mapToSource(
+                            self.filter_model.index(neighbour, 0)
+                        )
+                    )
+                    if item is not None:
+                        items.append(item)
+        return items
+
     def selectDefault(self) -> None:
         self.data_type_keys_widget.setCurrentIndex(self.filter_model.index(0, 0))
 
@@ -2,10 +2,16 @@
 
 import io
 import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
+from functools import partial
 from itertools import combinations as combi
 from json.decoder import JSONDecodeError
-from typing import TYPE_CHECKING, Any, NamedTuple
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
 from urllib.parse import quote
 
 import httpx
@@ -21,6 +27,10 @@
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from ert.dark_storage.client import Client
+
+T = TypeVar("T")
+
 
 @dataclass(frozen=True, eq=True)
 class EnsembleObject:
@@ -39,11 +49,147 @@ class PlotApiKeyDefinition(NamedTuple):
     log_scale: bool
 
 
+def _nbytes(value: Any) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, list):
+        return sum(_nbytes(v) for v in value)
+    return 0
+
+
+class _DataCache:
+    """Least recently used cache evicting on the memory held by its values.
+
+    Fetches are run in a thread pool, and concurrent requests for the same
+    key share the fetch that is already in flight. Only successful fetches
+    are cached.
+    """
+
+    def __init__(self, max_bytes: int, max_workers: int) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._in_flight: dict[Hashable, Future[Any]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="plot_api"
+        )
+
+    def fetch(self, key: Hashable, fetcher: Callable[[], T]) -> Future[T]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                done: Future[T] = Future()
+                done.set_result(self._entries[key][0])
+                return done
+            if key not in self._in_flight:
+                self._in_flight[key] = self._executor.submit(self._run, key, fetcher)
+            return self._in_flight[key]
+
+    def _run(self, key: Hashable, fetcher: Callable[[], T]) -> T:
+        try:
+            value = fetcher()
+        except BaseException:
+            with self._lock:
+                self._in_flight.pop(key, None)
+            raise
+        size = _nbytes(value)
+        with self._lock:
+            self._in_flight.pop(key, None)
+            if size <= self.max_bytes:
+                self._entries[key] = (value, size)
+                self._size += size
+                while self._size > self.max_bytes:
+                    _, (_, evicted_size) = self._entries.popitem(last=False)
+                    self._size -= evicted_size
+        return value
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.clear()
+
+
 class PlotApi:
-    def __init__(self, ens_path: Path) -> None:
+    """Fetches plot data from dark storage.
+
+    Fetched data is kept in a least recently used cache keyed by ensemble,
+    key and storage generation, bounded by ``cache_size`` bytes. Requests
+    share one pooled connection to the server, and are run concurrently in
+    a thread pool so that data for all ensembles, and for keys that are
+    likely to be plotted next (see :meth:`prefetch`), is fetched at once.
+    """
+
+    def __init__(
+        self,
+        ens_path: Path,
+        cache_size: int = 512 * 1024**2,
+        max_workers: int = 8,
+    ) -> None:
         self.ens_path = ens_path
         self._all_ensembles: list[EnsembleObject] | None = None
         self._timeout = 120
+        self._storage_generation = 0
+        self._cache = _DataCache(cache_size, max_workers)
+        self._client: Client | None = None
+        self._client_lock = threading.Lock()
+        self._exit_stack = ExitStack()
+
+    def _session(self) -> Client:
+        with self._client_lock:
+            if self._client is None:
+                self._client = self._exit_stack.enter_context(
+                    StorageService.session(project=self.ens_path)
+                )
+            return self._client
+
+    def close(self) -> None:
+        """Stop fetches in flight and close the connection to the server"""
+        self._cache.shutdown()
+        with self._client_lock:
+            self._exit_stack.close()
+            self._client = None
+
+    def refresh(self) -> None:
+        """Forget cached ensembles and data after storage has changed"""
+        self._storage_generation += 1
+        self._all_ensembles = None
+        self._cache.clear()
+
+    def _fetch(
+        self, kind: str, ensemble_id: str, key: str, fetcher: Callable[[], T]
+    ) -> Future[T]:
+        return self._cache.fetch(
+            (kind, ensemble_id, key, self._storage_generation), fetcher
+        )
+
+    def prefetch(
+        self,
+        keys: Iterable[str],
+        ensemble_ids: Iterable[str],
+        statistics: bool = False,
+    ) -> None:
+        """Start fetching data for the given keys in the background, so that
+        later calls to :meth:`data_for_key`, or :meth:`statistics_for_key` if
+        statistics is set, are served from the cache"""
+        ensemble_ids = list(ensemble_ids)
+        fetch = self._statistics_for_key if statistics else self._data_for_key
+        for key in keys:
+            for ensemble_id in ensemble_ids:
+                fetch(ensemble_id, key)
 
     @staticmethod
     def escape(s: str) -> str:
@@ -59,35 +205,34 @@ def get_all_ensembles(self) -> list[EnsembleObject]:
         if self._all_ensembles is not None:
             return self._all_ensembles
 
-        self._all_ensembles = []
-        with StorageService.session(project=self.ens_path) as client:
-            try:
-                response = client.get("/experiments", timeout=self._timeout)
-                self._check_response(response)
-                experiments = response.json()
-                for experiment in experiments:
-                    for ensemble_id in experiment["ensemble_ids"]:
-                        response = client.get(
-                            f"/ensembles/{ensemble_id}", timeout=self._timeout
-                        )
-                        self._check_response(response)
-                        response_json = response.json()
-                        ensemble_name: str = response_json["userdata"]["name"]
-                        experiment_name: str = response_json["userdata"][
-                            "experiment_name"
-                        ]
-                        self._all_ensembles.append(
-                            EnsembleObject(
-                                name=ensemble_name,
-                                id=ensemble_id,
-                                experiment_name=experiment_name,
-                                hidden=ensemble_name.startswith("."),
-                            )
+        all_ensembles = []
+        client = self._session()
+        try:
+            response = client.get("/experiments", timeout=self._timeout)
+            self._check_response(response)
+            experiments = response.json()
+            for experiment in experiments:
+                for ensemble_id in experiment["ensemble_ids"]:
+                    response = client.get(
+                        f"/ensembles/{ensemble_id}", timeout=self._timeout
+                    )
+                    self._check_response(response)
+                    response_json = response.json()
+                    ensemble_name: str = response_json["userdata"]["name"]
+                    experiment_name: str = response_json["userdata"]["experiment_name"]
+                    all_ensembles.append(
+                        EnsembleObject(
+                            name=ensemble_name,
+                            id=ensemble_id,
+                            experiment_name=experiment_name,
+                            hidden=ensemble_name.startswith("."),
                         )
-                return self._all_ensembles
-            except IndexError as exc:
-                logging.exception(exc)
-                raise exc
+                    )
+            self._all_ensembles = all_ensembles
+            return all_ensembles
+        except IndexError as exc:
+            logging.exception(exc)
+            raise exc
 
     @staticmethod
     def _check_response(response: httpx._models.Response) -> None:
@@ -109,52 +254,52 @@ def all_data_type_keys(self) -> list[PlotApiKeyDefinition]:
 
         all_keys: dict[str, PlotApiKeyDefinition] = {}
 
-        with StorageService.session(project=self.ens_path) as client:
-            response = client.get("/experiments", timeout=self._timeout)
+        client = self._session()
+        response = client.get("/experiments", timeout=self._timeout)
+        self._check_response(response)
+
+        for experiment in response.json():
+            response = client.get(
+                f"/experiments/{experiment['id']}/ensembles", timeout=self._timeout
+            )
             self._check_response(response)
 
-            for experiment in response.json():
+            for ensemble in response.json():
                 response = client.get(
-                    f"/experiments/{experiment['id']}/ensembles", timeout=self._timeout
+                    f"/ensembles/{ensemble['id']}/responses", timeout=self._timeout
                 )
                 self._check_response(response)
-
-                for ensemble in response.json():
-                    response = client.get(
-                        f"/ensembles/{ensemble['id']}/responses", timeout=self._timeout
+                for key, value in response.json().items():
+                    assert isinstance(key, str)
+
+                    has_observation = value["has_observations"]
+                    k = all_keys.get(key)
+                    if k and k.observations:
+                        has_observation = True
+
+                    all_keys[key] = PlotApiKeyDefinition(
+                        key=key,
+                        index_type="VALUE",
+                        observations=has_observation,
+                        dimensionality=2,
+                        metadata=value["userdata"],
+                        log_scale=key.startswith("LOG10_"),
                     )
-                    self._check_response(response)
-                    for key, value in response.json().items():
-                        assert isinstance(key, str)
-
-                        has_observation = value["has_observations"]
-                        k = all_keys.get(key)
-                        if k and k.observations:
-                            has_observation = True
-
-                        all_keys[key] = PlotApiKeyDefinition(
-                            key=key,
-                            index_type="VALUE",
-                            observations=has_observation,
-                            dimensionality=2,
-                            metadata=value["userdata"],
-                            log_scale=key.startswith("LOG10_"),
-                        )
 
-                    response = client.get(
-                        f"/ensembles/{ensemble['id']}/parameters", timeout=self._timeout
+                response = client.get(
+                    f"/ensembles/{ensemble['id']}/parameters", timeout=self._timeout
+                )
+                self._check_response(response)
+                for e in response.json():
+                    key = e["name"]
+                    all_keys[key] = PlotApiKeyDefinition(
+                        key=key,
+                        index_type=None,
+                        observations=False,
+                        dimensionality=e["dimensionality"],
+                        metadata=e["userdata"],
+                        log_scale=key.startswith("LOG10_"),
                     )
-                    self._check_response(response)
-                    for e in response.json():
-                        key = e["name"]
-                        all_keys[key] = PlotApiKeyDefinition(
-                            key=key,
-                            index_type=None,
-                            observations=False,
-                            dimensionality=e["dimensionality"],
-                            metadata=e["userdata"],
-                            log_scale=key.startswith("LOG10_"),
-                        )
 
         return list(all_keys.values())
 
@@ -162,34 +307,56 @@ def data_for_key(self, ensemble_id: str, key: str) -> pd.DataFrame:
         """Returns a pandas DataFrame with the datapoints for a given key for a given
         ensemble. The row index is the realization number, and the columns are an index
         over the indexes/dates"""
+        return self._data_for_key(ensemble_id, key).result().copy()
 
+    def _data_for_key(self, ensemble_id: str, key: str) -> Future[pd.DataFrame]:
         if key.startswith("LOG10_"):
             key = key[6:]
-
+        return self._fetch(
+            "data", ensemble_id, key, partial(self._get_data, ensemble_id, key)
+        )
+
+    def statistics_for_key(self, ensemble_id: str, key: str) -> pd.DataFrame:
+        """Returns a pandas DataFrame with statistics over the realizations for a
+        given response key for a given ensemble, computed by the server. The row
+        index is the statistic (Minimum, Maximum, Mean, p10, p33, p50, p67, p90
+        and std), and the columns are an index over the indexes/dates"""
+        return self._statistics_for_key(ensemble_id, key).result().copy()
+
+    def _statistics_for_key(self, ensemble_id: str, key: str) -> Future[pd.DataFrame]:
+        if key.startswith("LOG10_"):
+            key = key[6:]
+        return self._fetch(
+            "statistics",
+            ensemble_id,
+            key,
+            partial(self._get_data, ensemble_id, key, "/statistics"),
+        )
+
+    def _get_data(self, ensemble_id: str, key: str, path: str = "") -> pd.DataFrame:
         ensemble = self._get_ensemble_by_id(ensemble_id)
         if not ensemble:
             return pd.DataFrame()
 
-        with StorageService.session(project=self.ens_path) as client:
-            response = client.get(
-                f"/ensembles/{ensemble.id}/records/{PlotApi.escape(key)}",
-                headers={"accept": "application/x-parquet"},
-                timeout=self._timeout,
-            )
-            self._check_response(response)
+        response = self._session().get(
+            f"/ensembles/{ensemble.id}/records/{PlotApi.escape(key)}{path}",
+            headers={"accept": "application/x-parquet"},
+            timeout=self._timeout,
+        )
+        self._check_response(response)
 
-            stream = io.BytesIO(response.content)
-            df = pd.read_parquet(stream)
+        stream = io.BytesIO(response.content)
+        df = pd.read_parquet(stream)
 
-            try:
-                df.columns = pd.to_datetime(df.columns, format="%Y-%m-%d %H:%M:%S")
-            except (ParserError, ValueError):
-                df.columns = [int(s) for s in df.columns]
+        try:
+            df.columns = pd.to_datetime(df.columns, format="%Y-%m-%d %H:%M:%S")
+        except (ParserError, ValueError):
+            df.columns = [int(s) for s in df.columns]
 
-            try:
-                return df.astype(float)
-            except ValueError:
-                return df
+        try:
+            return df.astype(float)
+        except ValueError:
+            return df
 
     def observations_for_key(self, ensemble_ids: list[str], key: str) -> pd.DataFrame:
         """Returns a pandas DataFrame with the datapoints for a given observation key
@@ -197,65 +364,80 @@ def observations_for_key(self, ensemble_ids: list[str], key: str) -> pd.DataFram
         is a multi-index with (obs_key, index/date, obs_index), where index/date is
         used to relate the observation to the data point it relates to, and obs_index
         is the index for the observation itself"""
+        futures = [
+            self._fetch(
+                "observations",
+                ensemble_id,
+                key,
+                partial(self._get_observations, ensemble_id, key),
+            )
+            for ensemble_id in ensemble_ids
+        ]
         all_observations = pd.DataFrame()
-        for ensemble_id in ensemble_ids:
-            ensemble = self._get_ensemble_by_id(ensemble_id)
-            if not ensemble:
-                continue
-
-            with StorageService.session(project=self.ens_path) as client:
-                response = client.get(
-                    f"/ensembles/{ensemble.id}/records/{PlotApi.escape(key)}/observations",
-                    timeout=self._timeout,
-                )
-                self._check_response(response)
-
-                try:
-                    observations = response.json()
-                    observations_dfs = []
-                    if not observations:
-                        continue
-
-                    observations[0]  # Just preserving the old logic/behavior
-                    # but this should really be revised
-                except (KeyError, IndexError, JSONDecodeError) as e:
-                    raise httpx.RequestError(
-                        f"Observation schema might have changed key={key},  ensemble_name={ensemble.name}, e={e}"
-                    ) from e
-
-                for obs in observations:
-                    try:
-                        int(obs["x_axis"][0])
-                        key_index = [int(v) for v in obs["x_axis"]]
-                    except ValueError:
-                        key_index = [pd.Timestamp(v) for v in obs["x_axis"]]
-
-                    observations_dfs.append(
-                        pd.DataFrame(
-                            {
-                                "STD": obs["errors"],
-                                "OBS": obs["values"],
-                                "key_index": key_index,
-                            }
-                        )
-                    )
-
+        for future in futures:
+            observations_dfs = future.result()
+            if observations_dfs is not None:
                 all_observations = pd.concat([all_observations, *observations_dfs])
 
         return all_observations.T
 
+    def _get_observations(
+        self, ensemble_id: str, key: str
+    ) -> list[pd.DataFrame] | None:
+        ensemble = self._get_ensemble_by_id(ensemble_id)
+        if not ensemble:
+            return None
+
+        response = self._session().get(
+            f"/ensembles/{ensemble.id}/records/{PlotApi.escape(key)}/observations",
+            timeout=self._timeout,
+        )
+        self._check_response(response)
+
+        try:
+            observations = response.json()
+            observations_dfs = []
+            if not observations:
+                return None
+
+            observations[0]  # Just preserving the old logic/behavior
+            # but this should really be revised
+        except (KeyError, IndexError, JSONDecodeError) as e:
+            raise httpx.RequestError(
+                f"Observation schema might have changed key={key},  ensemble_name={ensemble.name}, e={e}"
+            ) from e
+
+        for obs in observations:
+            try:
+                int(obs["x_axis"][0])
+                key_index = [int(v) for v in obs["x_axis"]]
+            except ValueError:
+                key_index = [pd.Timestamp(v) for v in obs["x_axis"]]
+
+            observations_dfs.append(
+                pd.DataFrame(
+                    {
+                        "STD": obs["errors"],
+                        "OBS": obs["values"],
+                        "key_index": key_index,
+                    }
+                )
+            )
+        return observations_dfs
+
     def history_data(self, key: str, ensemble_ids: list[str] | None) -> pd.DataFrame:
         """Returns a pandas DataFrame with the data points for the history for a
         given data key, if any.  The row index is the index/date and the column
         index is the key."""
         if ensemble_ids:
-            for ensemble_id in ensemble_ids:
-                if ":" in key:
-                    head, tail = key.split(":", 2)
-                    history_key = f"{head}H:{tail}"
-                else:
-                    history_key = f"{key}H"
+            if ":" in key:
+                head, tail = key.split(":", 2)
+                history_key = f"{head}H:{tail}"
+            else:
+                history_key = f"{key}H"
+            self.prefetch([history_key], ensemble_ids)
 
+            for ensemble_id in ensemble_ids:
                 df = self.data_for_key(ensemble_id, history_key)
 
                 if not df.empty:
@@ -272,20 +454,33 @@ def history_data(self, key: str, ensemble_ids: list[str] | None) -> pd.DataFrame
 
     def std_dev_for_parameter(
         self, key: str, ensemble_id: str, z: int
+    ) -> npt.NDArray[np.float32]:
+        return (
+            self._fetch(
+                f"std_dev:{z}",
+                ensemble_id,
+                key,
+                partial(self._get_std_dev, key, ensemble_id, z),
+            )
+            .result()
+            .copy()
+        )
+
+    def _get_std_dev(
+        self, key: str, ensemble_id: str, z: int
     ) -> npt.NDArray[np.float32]:
         ensemble = self._get_ensemble_by_id(ensemble_id)
         if not ensemble:
             return np.array([])
 
-        with StorageService.session(project=self.ens_path) as client:
-            response = client.get(
-                f"/ensembles/{ensemble.id}/records/{PlotApi.escape(key)}/std_dev",
-                params={"z": z},
-                timeout=self._timeout,
-            )
+        response = self._session().get(
+            f"/ensembles/{ensemble.id}/records/{PlotApi.escape(key)}/std_dev",
+            params={"z": z},
+            timeout=self._timeout,
+        )
 
-            if response.status_code == 200:
-                # Deserialize the numpy array
-                return np.load(io.BytesIO(response.content))
-            else:
-                return np.array([])
+        if response.status_code == 200:
+            # Deserialize the numpy array
+            return np.load(io.BytesIO(response.content))
+        else:
+            return np.array([])
@@ -9,6 +9,7 @@
 from pandas import DataFrame
 from PyQt6.QtCore import Qt
 from PyQt6.QtCore import pyqtSlot as Slot
+from PyQt6.QtGui import QCloseEvent
 from PyQt6.QtWidgets import QDockWidget, QMainWindow, QTabWidget, QWidget
 
 from ert.gui.ertwidgets import showWaitCursorWhileWaiting
@@ -42,6 +43,9 @@
 GEN_KW_DEFAULT = 2
 STD_DEV_DEFAULT = 6
 
+# Number of keys on each side of the selected key to fetch in the background
+PREFETCH_NEIGHBOURS = 2
+
 logger = logging.getLogger(__name__)
 
 from PyQt6.QtWidgets import (
@@ -200,12 +204,21 @@ def updatePlot(self, layer: int | None = None) -> None:
             selected_ensembles = (
                 self._ensemble_selection_widget.get_selected_ensembles()
             )
+            # The statistics plot only needs the statistics over the
+            # realizations, which the server computes
+            statistics = plot_widget.name == STATISTICS
+            fetch_data = (
+                self._api.statistics_for_key if statistics else self._api.data_for_key
+            )
+            # Start fetching for all ensembles at once, the loop below then
+            # collects the results as they come in
+            self._api.prefetch(
+                [key], [ensemble.id for ensemble in selected_ensembles], statistics
+            )
             ensemble_to_data_map: dict[EnsembleObject, pd.DataFrame] = {}
             for ensemble in selected_ensembles:
                 try:
-                    ensemble_to_data_map[ensemble] = self._api.data_for_key(
-                        ensemble.id, key
-                    )
+                    ensemble_to_data_map[ensemble] = fetch_data(ensemble.id, key)
                 except (RequestError, TimeoutError) as e:
                     logger.exception(f"plot api request failed: {e}")
                     open_error_dialog("Request failed", f"{e}")
@@ -380,6 +393,26 @@ def keySelected(self) -> None:
         self._prev_tab_widget_index = self._central_tab.currentIndex()
         self._prev_key_dimensionality = key_def.dimensionality
         self.updatePlot()
+        # Fields are too large to fetch speculatively
+        self._api.prefetch(
+            [
+                neighbour.key
+                for neighbour in self._data_type_keys_widget.getNeighbouringItems(
+                    PREFETCH_NEIGHBOURS
+                )
+                if neighbour.dimensionality < 3
+            ],
+            [
+                ensemble.id
+                for ensemble in self._ensemble_selection_widget.get_selected_ensembles()
+            ],
+            statistics=cast(PlotWidget, self._central_tab.currentWidget()).name
+            == STATISTICS,
+        )
+
+    def closeEvent(self, event: QCloseEvent | None) -> None:
+        self._api.close()
+        super().closeEvent(event)
 
     def toggleCustomizeDialog(self) -> None:
         self._plot_customizer.toggleCustomizationDialog()
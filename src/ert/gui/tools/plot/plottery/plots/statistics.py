@@ -39,6 +39,8 @@ def plot(
         plot_context.y_axis = plot_context.VALUE_AXIS
         plot_context.x_axis = plot_context.DATE_AXIS
 
+        # The data for each ensemble is the statistics over its realizations,
+        # see PlotApi.statistics_for_key
         for ensemble, data in ensemble_to_data_map.items():
             data = data.T
             if not data.empty:
@@ -53,18 +55,8 @@ def plot(
                 )  # creates rectangle patch for legend use.
                 config.addLegendItem(label, rectangle)
 
-                statistics_data = DataFrame()
-                std_dev_factor = config.getStandardDeviationFactor()
-
-                statistics_data["Minimum"] = data.min(axis=1)
-                statistics_data["Maximum"] = data.max(axis=1)
-                statistics_data["Mean"] = data.mean(axis=1)
-                statistics_data["p10"] = data.quantile(0.1, axis=1)
-                statistics_data["p33"] = data.quantile(0.33, axis=1)
-                statistics_data["p50"] = data.quantile(0.50, axis=1)
-                statistics_data["p67"] = data.quantile(0.67, axis=1)
-                statistics_data["p90"] = data.quantile(0.90, axis=1)
-                std = data.std(axis=1) * std_dev_factor
+                statistics_data = data.drop(columns="std")
+                std = data["std"] * config.getStandardDeviationFactor()
                 statistics_data["std+"] = statistics_data["Mean"] + std
                 statistics_data["std-"] = statistics_data["Mean"] - std
 
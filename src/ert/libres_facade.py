@@ -21,8 +21,6 @@
     Field,
     ObservationType,
 )
-from ert.data import MeasuredData
-from ert.data._measured_data import ObservationError, ResponseError
 from ert.load_status import LoadResult, LoadStatus
 
 from .plugins import ErtPluginContext
@@ -158,16 +156,13 @@ def get_data_key_for_obs_key(self, observation_key: str) -> str:
     def load_all_misfit_data(ensemble: Ensemble) -> DataFrame:
         """Loads all misfit data for a given ensemble.
 
-        Retrieves all active realizations from the ensemble, and for each
-        realization, it gathers the observations and measured data. The
-        function then calculates the misfit, which is a measure of the
-        discrepancy between observed and simulated values, for each data
-        column. The misfit is calculated as the squared difference between the
-        observed and measured data, normalized by the standard deviation of the
-        observations.
+        The misfit of an observation key is the sum over its observations of
+        the squared difference between the observed and simulated values,
+        normalized by the standard deviation of the observations. Misfits
+        are calculated by the ensemble, see Ensemble.load_misfits, which
+        stores them for reuse.
 
-        The misfit data is then grouped by key, summed, and transposed to form
-        a DataFrame. The DataFrame has an additional column "MISFIT:TOTAL",
+        The DataFrame has an additional column "MISFIT:TOTAL",
         which is the sum of all misfits for each realization. The index of the
         DataFrame is named "Realization".
 
@@ -177,24 +172,23 @@ def load_all_misfit_data(ensemble: Ensemble) -> DataFrame:
         Returns:
             DataFrame: A DataFrame containing the misfit data for all
                 realizations in the ensemble. Each column (except for "MISFIT:TOTAL")
-                corresponds to a key in the measured data, and each row corresponds
+                corresponds to an observation key, and each row corresponds
                 to a realization. The "MISFIT:TOTAL" column contains the total
                 misfit for each realization.
         """
-        try:
-            measured_data = MeasuredData(ensemble)
-        except (ResponseError, ObservationError):
+        misfits = ensemble.load_misfits()
+        if misfits.is_empty():
             return DataFrame()
-        misfit = DataFrame()
-        for name in measured_data.data.columns.unique(0):
-            df = (
-                (
-                    measured_data.data[name].loc["OBS"]
-                    - measured_data.get_simulated_data()[name]
-                )
-                / measured_data.data[name].loc["STD"]
-            ) ** 2
-            misfit[f"MISFIT:{name}"] = df.sum(axis=1)
+        misfit = (
+            misfits.pivot(
+                on="observation_key",
+                index="realization",
+                values="misfit",
+            )
+            .to_pandas()
+            .set_index("realization")
+            .add_prefix("MISFIT:")
+        )
         misfit["MISFIT:TOTAL"] = misfit.sum(axis=1)
         misfit.index.name = "Realization"
         misfit.index = misfit.index.astype(int)
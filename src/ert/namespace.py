@@ -2,8 +2,10 @@
 
 import argparse
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
-from ert.plugins.plugin_manager import ErtPluginManager
+if TYPE_CHECKING:
+    from ert.plugins.plugin_manager import ErtPluginManager
 
 
 class Namespace(argparse.Namespace):
@@ -1,6 +1,6 @@
 from collections.abc import Callable
 from functools import wraps
-from typing import Any, ParamSpec
+from typing import TYPE_CHECKING, Any, ParamSpec
 
 from .ert_plugin import CancelPluginException, ErtPlugin
 from .ert_script import ErtScript
@@ -12,12 +12,26 @@
     hook_implementation,
 )
 from .plugin_response import PluginMetadata, PluginResponse
-from .workflow_config import ErtScriptWorkflow, WorkflowConfigs
 from .workflow_fixtures import WorkflowFixtures
 
+if TYPE_CHECKING:
+    from .workflow_config import ErtScriptWorkflow, WorkflowConfigs
+
 P = ParamSpec("P")
 
 
+def __getattr__(name: str) -> Any:
+    # The workflow configs build on ert.config, which imports this package,
+    # so they are imported on first use
+    if name in {"ErtScriptWorkflow", "WorkflowConfigs"}:
+        from . import workflow_config  # noqa: PLC0415
+
+        value = getattr(workflow_config, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def plugin(name: str) -> Callable[[Callable[P, Any]], Callable[P, Any]]:
     def wrapper(func: Callable[P, Any]) -> Callable[P, Any]:
         @wraps(func)
@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 import json
 import os
+import tempfile
 from collections.abc import Sequence
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pandas as pd
@@ -20,6 +24,68 @@ def loadDesignMatrix(filename: str) -> pd.DataFrame:
     return dm
 
 
+class _CSVWriter:
+    """Writes frames to one CSV file as if they were concatenated.
+
+    The columns of the file are the union of the columns of all frames, so
+    they are only known when all frames are added. Frames are therefore
+    kept in a directory until written, such that only one frame is held in
+    memory at a time.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+        self._parts: list[Path] = []
+        self._columns: dict[str, None] = {}
+        # Columns in every part with rows, and those with a value that
+        # differs from the first row of all parts
+        self._in_all_parts: set[str] | None = None
+        self._varying: set[str] = set()
+        self._first_row: pd.Series | None = None
+        self._rows = 0
+
+    def add(self, frame: pd.DataFrame) -> None:
+        self._columns.update(dict.fromkeys(frame.columns))
+        if not frame.empty:
+            if self._first_row is None:
+                self._first_row = frame.iloc[0]
+            first_row = self._first_row
+            common = frame.columns.intersection(first_row.index)
+            differs = (frame[common] != first_row[common]).any()
+            self._varying.update(differs.index[differs])
+            self._varying.update(frame.columns.difference(first_row.index))
+            self._in_all_parts = (
+                set(frame.columns)
+                if self._in_all_parts is None
+                else self._in_all_parts.intersection(frame.columns)
+            )
+            self._rows += len(frame)
+        part = self._directory / f"{len(self._parts)}.pickle"
+        frame.to_pickle(part)
+        self._parts.append(part)
+
+    def write(self, output_file: str, drop_const_cols: bool) -> tuple[int, int]:
+        """Write the added frames and return the number of rows and columns"""
+        columns = list(self._columns)
+        if drop_const_cols and self._in_all_parts is not None:
+            # A column missing from some part is NaN there, which differs
+            # from any value
+            columns = [
+                column
+                for column in columns
+                if column in self._varying or column not in self._in_all_parts
+            ]
+        if not self._parts:
+            pd.DataFrame().to_csv(output_file, float_format="%.6f")
+            return 0, 0
+        with open(output_file, "w", encoding="utf-8") as fout:
+            for i, part in enumerate(self._parts):
+                frame = pd.read_pickle(part).reindex(columns=columns)
+                frame.to_csv(fout, header=i == 0, float_format="%.6f")
+                part.unlink()
+        return self._rows, len(columns)
+
+
 class CSVExportJob(ErtScript):
     """Export of summary, misfit, design matrix data and gen kw into a single CSV file.
 
@@ -82,55 +148,61 @@ def run(
             if not os.path.isfile(design_matrix_path):
                 raise UserWarning("The design matrix is not a file!")
 
-        data = pd.DataFrame()
-
-        for ensemble in ensembles:
-            if not ensemble.has_data():
-                raise UserWarning(
-                    f"The ensemble '{ensemble.name}' does not have any data!"
-                )
-
-            ensemble_data = ensemble.load_all_gen_kw_data()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            writer = _CSVWriter(Path(tmp_dir))
+            for ensemble in ensembles:
+                writer.add(self._ensemble_data(ensemble, design_matrix_path))
+            rows, columns = writer.write(output_file, bool(drop_const_cols))
 
-            if design_matrix_path is not None:
-                design_matrix_data = loadDesignMatrix(design_matrix_path)
-                if not design_matrix_data.empty:
-                    ensemble_data = ensemble_data.join(design_matrix_data, how="outer")
+        export_info = f"Exported {rows} rows and {columns} columns to {output_file}."
+        return export_info
 
-            misfit_data = LibresFacade.load_all_misfit_data(ensemble)
-            if not misfit_data.empty:
-                ensemble_data = ensemble_data.join(misfit_data, how="outer")
-            realizations = ensemble.get_realization_list_with_responses()
+    @staticmethod
+    def _ensemble_data(
+        ensemble: Ensemble, design_matrix_path: str | None
+    ) -> pd.DataFrame:
+        if not ensemble.has_data():
+            raise UserWarning(f"The ensemble '{ensemble.name}' does not have any data!")
 
-            try:
-                summary_data = ensemble.load_responses("summary", tuple(realizations))
-            except (KeyError, ValueError):
-                summary_data = pl.DataFrame({})
+        ensemble_data = ensemble.load_all_gen_kw_data()
 
-            if not summary_data.is_empty():
-                ensemble_data = ensemble_data.join(
-                    summary_data.to_pandas(), how="outer"
+        if design_matrix_path is not None:
+            design_matrix_data = loadDesignMatrix(design_matrix_path)
+            if not design_matrix_data.empty:
+                ensemble_data = ensemble_data.join(design_matrix_data, how="outer")
+
+        misfit_data = LibresFacade.load_all_misfit_data(ensemble)
+        if not misfit_data.empty:
+            ensemble_data = ensemble_data.join(misfit_data, how="outer")
+        realizations = ensemble.get_realization_list_with_responses()
+
+        try:
+            summary_data = ensemble.load_responses("summary", tuple(realizations))
+        except (KeyError, ValueError):
+            summary_data = pl.DataFrame({})
+
+        if not summary_data.is_empty():
+            summary_data = (
+                summary_data.pivot(
+                    on="response_key", index=["realization", "time"], sort_columns=True
                 )
-            else:
-                ensemble_data["Date"] = None
-                ensemble_data.set_index(["Date"], append=True, inplace=True)
-
-            ensemble_data["Iteration"] = ensemble.iteration
-            ensemble_data["Ensemble"] = ensemble.name
-            ensemble_data.set_index(
-                ["Ensemble", "Iteration"], append=True, inplace=True
+                .rename({"time": "Date", "realization": "Realization"})
+                .with_columns(pl.col("Realization").cast(pl.Int64))
             )
+            ensemble_data = ensemble_data.join(
+                summary_data.to_pandas().set_index(["Realization", "Date"]),
+                how="outer",
+            )
+        else:
+            ensemble_data["Date"] = None
+            ensemble_data.set_index(["Date"], append=True, inplace=True)
 
-            data = pd.concat([data, ensemble_data])
-        if not data.empty:
-            data = data.reorder_levels(["Realization", "Iteration", "Date", "Ensemble"])
-        if drop_const_cols:
-            data = data.loc[:, (data != data.iloc[0]).any()]
-
-        data.to_csv(output_file, float_format="%.6f")
+        ensemble_data["Iteration"] = ensemble.iteration
+        ensemble_data["Ensemble"] = ensemble.name
+        ensemble_data.set_index(["Ensemble", "Iteration"], append=True, inplace=True)
 
-        export_info = (
-            f"Exported {len(data.index)} rows and {len(data.columns)} "
-            f"columns to {output_file}."
-        )
-        return export_info
+        if not ensemble_data.empty:
+            ensemble_data = ensemble_data.reorder_levels(
+                ["Realization", "Iteration", "Date", "Ensemble"]
+            )
+        return ensemble_data
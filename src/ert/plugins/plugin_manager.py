@@ -16,8 +16,6 @@
 from opentelemetry.sdk.trace import TracerProvider
 from typing_extensions import TypedDict
 
-from .workflow_config import WorkflowConfigs
-
 logger = logging.getLogger(__name__)
 
 _PLUGIN_NAMESPACE = "ert"
@@ -33,6 +31,7 @@
     )
 
     from .plugin_response import PluginMetadata, PluginResponse
+    from .workflow_config import WorkflowConfigs
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -362,6 +361,8 @@ def get_documentation_for_workflows(self) -> dict[str, JobDoc]:
         return job_docs
 
     def get_ertscript_workflows(self) -> WorkflowConfigs:
+        from .workflow_config import WorkflowConfigs  # noqa: PLC0415
+
         config = WorkflowConfigs()
         self.hook.legacy_ertscript_workflow(config=config)
         return config
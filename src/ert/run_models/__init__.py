@@ -3,6 +3,7 @@
 from .ensemble_smoother import EnsembleSmoother
 from .event import (
     RunModelEvent,
+    RunModelRunpathEvent,
     RunModelStatusEvent,
     RunModelTimeEvent,
     RunModelUpdateBeginEvent,
@@ -20,6 +21,7 @@
     "ErtRunError",
     "MultipleDataAssimilation",
     "RunModelEvent",
+    "RunModelRunpathEvent",
     "RunModelStatusEvent",
     "RunModelTimeEvent",
     "RunModelUpdateBeginEvent",
@@ -71,6 +71,7 @@
     FullSnapshotEvent,
     RunModelDataEvent,
     RunModelErrorEvent,
+    RunModelRunpathEvent,
     RunModelStatusEvent,
     RunModelTimeEvent,
     RunModelUpdateBeginEvent,
@@ -441,11 +442,7 @@ def get_current_status(self) -> dict[str, int]:
         status: dict[str, int] = defaultdict(int)
         if self._iter_snapshot.keys():
             current_iter = max(list(self._iter_snapshot.keys()))
-            all_realizations = self._iter_snapshot[current_iter].reals
-
-            if all_realizations:
-                for real in all_realizations.values():
-                    status[str(real["status"])] += 1
+            status.update(self._iter_snapshot[current_iter].aggregate_real_states())
 
         if self.restart:
             status["Finished"] += (
@@ -483,12 +480,11 @@ def _current_progress(self) -> tuple[float, int]:
         realization_count = self.get_number_of_active_realizations()
 
         if all_realizations:
-            for real in all_realizations.values():
-                if real["status"] in {
-                    REALIZATION_STATE_FINISHED,
-                    REALIZATION_STATE_FAILED,
-                }:
-                    done_realizations += 1
+            status_counts = self._iter_snapshot[current_iter].aggregate_real_states()
+            done_realizations += (
+                status_counts[REALIZATION_STATE_FINISHED]
+                + status_counts[REALIZATION_STATE_FAILED]
+            )
 
             realization_progress = float(done_realizations) / len(
                 self.active_realizations
@@ -515,7 +511,7 @@ def send_snapshot_event(self, event: Event, iteration: int) -> None:
                     realization_count=realization_count,
                     status_count=status,
                     iteration=iteration,
-                    snapshot=copy.deepcopy(snapshot),
+                    snapshot=snapshot.copy(),
                 )
             )
         elif type(event) is EESnapshotUpdate:
@@ -539,7 +535,8 @@ def send_snapshot_event(self, event: Event, iteration: int) -> None:
                     realization_count=realization_count,
                     status_count=status,
                     iteration=iteration,
-                    snapshot=copy.deepcopy(snapshot),
+                    # A fresh delta that is not referenced after this event
+                    snapshot=snapshot,
                 )
             )
 
@@ -729,6 +726,18 @@ def run_workflows(
         for workflow in self._hooked_workflows[runtime]:
             WorkflowRunner(workflow=workflow, fixtures=fixtures).run_blocking()
 
+    def _send_runpath_event(self, ensemble: Ensemble, created: int, total: int) -> None:
+        # Limit the events to about one per percent of the runpaths
+        if created == total or created % max(1, total // 100) == 0:
+            self.send_event(
+                RunModelRunpathEvent(
+                    iteration=ensemble.iteration,
+                    run_id=ensemble.id,
+                    created=created,
+                    total=total,
+                )
+            )
+
     def _evaluate_and_postprocess(
         self,
         run_args: list[RunArg],
@@ -747,6 +756,7 @@ def _evaluate_and_postprocess(
             model_config=self._model_config,
             runpaths=self.run_paths,
             context_env=self._context_env,
+            progress_callback=functools.partial(self._send_runpath_event, ensemble),
         )
 
         self.run_workflows(
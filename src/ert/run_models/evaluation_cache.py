@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import polars as pl
+
+# Control values are grouped into cells of this size. Cells are much larger
+# than the tolerance, so that equal controls are almost always in the same
+# cell, and offset so that common values such as bounds are far from edges.
+_CELL_SIZE = 2.0**-10
+_CELL_OFFSET = 0.381966 * _CELL_SIZE
+
+
+class EvaluationCacheIndex:
+    """Index of previously evaluated control vectors.
+
+    A control vector of a model realization is found in the cache when every
+    control is within the tolerance of a cached evaluation of the same model
+    realization, as np.allclose(..., rtol=0, atol=tolerance).
+
+    The cached control vectors are hashed by the cells their values are in,
+    so that a batch is looked up with a single join, after which the
+    candidates are compared. A vector within the tolerance of a cell edge
+    may match a cached vector in a neighbouring cell, so those that are not
+    found by the join are searched for among all cached vectors instead.
+    """
+
+    def __init__(
+        self,
+        cached: pl.DataFrame,
+        control_names: Sequence[str],
+        tolerance: float,
+    ) -> None:
+        """
+        Parameters
+        ----------
+        cached : DataFrame
+            The cached evaluations, with a model_realization column and one
+            column per control.
+        control_names : sequence of str
+            Columns of the controls in the order of the control vectors.
+        tolerance : float
+            Maximum absolute difference of each control.
+        """
+        self.tolerance = tolerance
+        self._values = (
+            cached.select(pl.col(name).cast(pl.Float64) for name in control_names)
+            .to_numpy()
+            .reshape(cached.height, len(control_names))
+        )
+        self._columns = np.asfortranarray(self._values)
+        self._model_realizations = cached["model_realization"].to_numpy()
+        self._hashes = pl.DataFrame(
+            {
+                "hash": _cell_hashes(self._values, self._model_realizations),
+                "cached": np.arange(cached.height),
+            }
+        )
+
+    def lookup(
+        self,
+        control_values: npt.ArrayLike,
+        model_realizations: Sequence[int],
+    ) -> npt.NDArray[np.intp]:
+        """
+        Finds control vectors of model realizations in the cache.
+
+        Returns
+        -------
+        rows : ndarray of int
+            For each control vector, the first row of the cached evaluations
+            it matches, or -1 if it is not in the cache.
+        """
+        values = np.asarray(control_values, dtype=np.float64).reshape(
+            -1, self._values.shape[1]
+        )
+        realizations = np.asarray(model_realizations, dtype=np.int64)
+        rows = np.full(values.shape[0], -1, dtype=np.intp)
+        if values.shape[0] == 0 or self._values.shape[0] == 0:
+            return rows
+
+        candidates = (
+            pl.DataFrame(
+                {
+                    "hash": _cell_hashes(values, realizations),
+                    "evaluation": np.arange(values.shape[0]),
+                }
+            )
+            .join(self._hashes, on="hash", how="inner")
+            .sort("evaluation", "cached")
+        )
+        evaluations = candidates["evaluation"].to_numpy()
+        cached = candidates["cached"].to_numpy()
+        matching = self._matches(values[evaluations], realizations[evaluations], cached)
+        found, first = np.unique(evaluations[matching], return_index=True)
+        rows[found] = cached[matching][first]
+
+        position = (values + _CELL_OFFSET) / _CELL_SIZE
+        distance_to_edge = np.minimum(
+            position - np.floor(position), np.ceil(position) - position
+        )
+        # Twice the tolerance leaves room for rounding in the cell positions
+        near_edge = np.any(distance_to_edge * _CELL_SIZE <= 2 * self.tolerance, axis=1)
+        for evaluation in np.flatnonzero(near_edge & (rows < 0)):
+            rows[evaluation] = self._search(
+                values[evaluation], realizations[evaluation]
+            )
+        return rows
+
+    def _search(self, values: npt.NDArray[np.float64], realization: int) -> int:
+        """The first matching cached row, found by comparing one control at a
+        time against the remaining candidates"""
+        candidates = np.flatnonzero(self._model_realizations == realization)
+        for column, value in enumerate(values):
+            if candidates.size == 0:
+                return -1
+            candidates = candidates[
+                np.abs(self._columns[candidates, column] - value) <= self.tolerance
+            ]
+        return int(candidates[0]) if candidates.size else -1
+
+    def _matches(
+        self,
+        values: npt.NDArray[np.float64],
+        realizations: npt.NDArray[np.int64],
+        cached: npt.NDArray[np.intp],
+    ) -> npt.NDArray[np.bool_]:
+        return (self._model_realizations[cached] == realizations) & np.all(
+            np.abs(self._values[cached] - values) <= self.tolerance, axis=-1
+        )
+
+
+def _cell_hashes(
+    values: npt.NDArray[np.float64], model_realizations: npt.NDArray[Any]
+) -> pl.Series:
+    # Missing values give arbitrary cells, but never match
+    with np.errstate(invalid="ignore"):
+        cells = np.floor((values + _CELL_OFFSET) / _CELL_SIZE).astype(np.int64)
+    return (
+        pl.DataFrame(cells, orient="row")
+        .with_columns(model_realization=pl.Series(model_realizations, dtype=pl.Int64))
+        .hash_rows()
+    )
@@ -49,6 +49,12 @@ class EverestBatchResultEvent(BaseModel):
     result_type: Literal["FunctionResult", "GradientResult"]
 
 
+class RunModelRunpathEvent(RunModelEvent):
+    event_type: Literal["RunModelRunpathEvent"] = "RunModelRunpathEvent"
+    created: int
+    total: int
+
+
 class RunModelTimeEvent(RunModelEvent):
     event_type: Literal["RunModelTimeEvent"] = "RunModelTimeEvent"
     remaining_time: float
@@ -98,6 +104,7 @@ def write_as_csv(self, output_path: Path | None) -> None:
     | SnapshotUpdateEvent
     | RunModelErrorEvent
     | RunModelStatusEvent
+    | RunModelRunpathEvent
     | RunModelTimeEvent
     | RunModelUpdateBeginEvent
     | RunModelDataEvent
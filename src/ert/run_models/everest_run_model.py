@@ -55,6 +55,7 @@
 from ..run_arg import RunArg, create_run_arguments
 from ..storage.local_ensemble import EverestRealizationInfo
 from .base_run_model import BaseRunModel, StatusEvents
+from .evaluation_cache import EvaluationCacheIndex
 from .event import (
     EverestBatchResultEvent,
     EverestStatusEvent,
@@ -499,53 +500,21 @@ def _create_evaluation_infos(
         )
         evaluation_infos = []
 
-        cache_hits_df = None
+        cached_rows = np.full(len(model_realizations), -1)
         if all_results is not None:
-            # Will be used to search the cache
-            controls_to_evaluate_df = pl.DataFrame(
-                {
-                    "realization": list(range(len(model_realizations))),
-                    "model_realization": pl.Series(model_realizations, dtype=pl.UInt16),
-                    **{
-                        control_name: pl.Series(control_values[:, i], dtype=pl.Float64)
-                        for i, control_name in enumerate(control_names)
-                    },
-                }
+            cached_rows = EvaluationCacheIndex(
+                all_results,
+                control_names,
+                # Same as np.allclose with atol=float32 machine epsilon
+                tolerance=float(np.finfo(np.float32).eps),
+            ).lookup(control_values, model_realizations)
+            cached_objectives, cached_constraints = (
+                all_results.select(pl.col(name).cast(pl.Float64) for name in names)
+                .to_numpy()
+                .reshape(all_results.height, len(names))
+                for names in (objective_names, constraint_names)
             )
 
-            EPS = float(np.finfo(np.float32).eps)
-
-            left = all_results
-            right = controls_to_evaluate_df
-
-            # Note: asof join will approximate for floats, but
-            # only for one column at a time, this for loop
-            # will incrementally do the join, filtering out
-            # mismatching rows iteratively. If in the future, the `on` argument
-            # accepts multiple columns, we can drop this for loop.
-            # One control-value-column at a time,
-            # we filter out rows with control values
-            # that are not approximately matching the control value
-            # of our to-be-evaluated controls.
-            for control_name in control_names:
-                left = (
-                    left.sort(["model_realization", control_name])
-                    .join_asof(
-                        right.sort(["model_realization", control_name]),
-                        on=control_name,
-                        by="model_realization",  # pre-join by model realization
-                        tolerance=EPS,  # Same as np.allclose with atol=EPS
-                    )
-                    .filter(pl.col("realization_right").is_not_null())
-                )
-
-                left = left.drop([s for s in left.columns if s.endswith("_right")])
-
-                if left.is_empty():
-                    break
-
-            cache_hits_df = left if not left.is_empty() else None
-
         sim_id_counter = 0
         for flat_index, (
             control_vector,
@@ -576,35 +545,20 @@ def _create_evaluation_infos(
                 )
                 continue
 
-            if cache_hits_df is not None and not cache_hits_df.is_empty():
-                hit_row = cache_hits_df.filter(
-                    cache_hits_df["realization"] == flat_index
-                )
-
-                if not hit_row.is_empty():
-                    # Cache hit!
-                    row_dict = hit_row.to_dicts()[0]
-
-                    objectives = np.array(
-                        [row_dict[o] for o in objective_names], dtype=np.float64
-                    )
-                    constraints = np.array(
-                        [row_dict[c] for c in constraint_names], dtype=np.float64
-                    )
-
-                    evaluation_infos.append(
-                        _EvaluationInfo(
-                            control_vector=control_vector,
-                            status=_EvaluationStatus.CACHED,
-                            model_realization=model_realization,
-                            perturbation=perturbation,
-                            flat_index=flat_index,
-                            simulation_id=None,
-                            objectives=objectives,
-                            constraints=constraints,
-                        )
+            if (cached_row := cached_rows[flat_index]) >= 0:
+                evaluation_infos.append(
+                    _EvaluationInfo(
+                        control_vector=control_vector,
+                        status=_EvaluationStatus.CACHED,
+                        model_realization=model_realization,
+                        perturbation=perturbation,
+                        flat_index=flat_index,
+                        simulation_id=None,
+                        objectives=cached_objectives[cached_row],
+                        constraints=cached_constraints[cached_row],
                     )
-                    continue
+                )
+                continue
 
             evaluation_infos.append(
                 _EvaluationInfo(
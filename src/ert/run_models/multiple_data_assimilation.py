@@ -17,6 +17,7 @@
 )
 from ert.enkf_main import sample_prior, save_design_matrix_to_ensemble
 from ert.ensemble_evaluator import EvaluatorServerConfig
+from ert.mode_definitions import ES_MDA_DEFAULT_WEIGHTS
 from ert.storage import Ensemble, Storage
 from ert.trace import tracer
 
@@ -36,7 +37,7 @@ class MultipleDataAssimilation(UpdateRunModel):
     Run multiple data assimilation (MDA) ensemble smoother with custom weights.
     """
 
-    default_weights = "4, 2, 1"
+    default_weights = ES_MDA_DEFAULT_WEIGHTS
 
     def __init__(
         self,
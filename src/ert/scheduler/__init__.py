@@ -21,7 +21,7 @@
 def create_driver(queue_options: QueueOptions) -> Driver:
     match str(queue_options.name):
         case QueueSystem.LOCAL:
-            return LocalDriver()
+            return LocalDriver(**queue_options.driver_options)
         case QueueSystem.TORQUE:
             return OpenPBSDriver(**queue_options.driver_options)
         case QueueSystem.LSF:
@@ -2,10 +2,14 @@
 
 import asyncio
 import logging
+import os
 import shlex
+import stat
 from abc import ABC, abstractmethod
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
 from pathlib import Path
+from tempfile import NamedTemporaryFile
 
 from .event import Event
 
@@ -28,14 +32,99 @@ class FailedSubmit(RuntimeError):
     pass
 
 
+@dataclass
+class ArrayTask:
+    """A realization to be submitted as one task of an array job"""
+
+    iens: int
+    executable: str
+    args: tuple[str, ...]
+    name: str
+    runpath: Path
+    num_cpu: int | None = 1
+    realization_memory: int | None = 0
+
+
+def create_array_submit_script(
+    tasks: Sequence[ArrayTask],
+    task_index_variable: str,
+    activate_script: str,
+    output_suffixes: tuple[str, str] | None = None,
+) -> str:
+    """Submit script running tasks[i - 1] when the environment variable
+    task_index_variable is i. If output_suffixes is given, stdout and stderr
+    of each task is written to files with those suffixes in its runpath."""
+    script = f'#!/usr/bin/env bash\ncase "${{{task_index_variable}}}" in\n'
+    for index, task in enumerate(tasks, start=1):
+        body = create_submit_script(
+            task.runpath, task.executable, task.args, activate_script
+        ).removeprefix("#!/usr/bin/env bash\n")
+        if output_suffixes is not None:
+            stdout_file, stderr_file = (
+                task.name + suffix for suffix in output_suffixes
+            )
+            cd, rest = body.split("\n", 1)
+            body = (
+                f"{cd}\nexec >{shlex.quote(stdout_file)} 2>{shlex.quote(stderr_file)}\n"
+                f"{rest}"
+            )
+        script += f"{index})\n{body};;\n"
+    return (
+        script + "esac\n"
+        f'echo "No realization for array index ${{{task_index_variable}}}" >&2\n'
+        "exit 1\n"
+    )
+
+
+def array_job_name(tasks: Sequence[ArrayTask]) -> str:
+    return os.path.commonprefix([task.name for task in tasks]).rstrip("-_.") or "ert"
+
+
+def write_submit_script(directory: Path, prefix: str, script: str) -> Path:
+    try:
+        with NamedTemporaryFile(
+            dir=directory,
+            prefix=prefix,
+            suffix=".sh",
+            mode="w",
+            encoding="utf-8",
+            delete=False,
+        ) as script_handle:
+            script_handle.write(script)
+            script_path = Path(script_handle.name)
+    except OSError as err:
+        raise FailedSubmit(f"Could not create submit script: {err}") from err
+    script_path.chmod(script_path.stat().st_mode | stat.S_IEXEC)
+    return script_path
+
+
 class Driver(ABC):
     """Adapter for the HPC cluster."""
 
-    def __init__(self, activate_script: str = "") -> None:
+    def __init__(self, activate_script: str = "", array_job_size: int = 0) -> None:
+        """
+        Args:
+          activate_script: Shell command activating the environment of the job
+          array_job_size: If larger than one, realizations are submitted as
+            tasks of array jobs of at most this many tasks, instead of one
+            job per realization.
+        """
         self._event_queue: asyncio.Queue[Event] | None = None
         self._job_error_message_by_iens: dict[int, str] = {}
+        self._submit_locks: dict[int, asyncio.Lock] = {}
         self.activate_script = activate_script
 
+        self._array_job_size = array_job_size
+        self._array_job_delay = 1.0
+        self._array_tasks: dict[
+            tuple[int | None, int | None],
+            list[tuple[ArrayTask, asyncio.Future[None]]],
+        ] = {}
+        self._array_job_timers: dict[
+            tuple[int | None, int | None], asyncio.TimerHandle
+        ] = {}
+        self._array_job_submissions: set[asyncio.Task[None]] = set()
+
     @property
     def event_queue(self) -> asyncio.Queue[Event]:
         if self._event_queue is None:
@@ -83,6 +172,75 @@ async def poll(self) -> None:
     async def finish(self) -> None:
         """make sure that all the jobs / realizations are complete."""
 
+    @property
+    def uses_array_jobs(self) -> bool:
+        return self._array_job_size > 1
+
+    async def _submit_array_task(self, task: ArrayTask) -> None:
+        """Wait until task has been submitted as part of an array job.
+
+        Tasks with the same resource requirements that arrive within
+        _array_job_delay seconds of each other are submitted together by
+        _submit_array, in array jobs of at most _array_job_size tasks.
+        """
+        loop = asyncio.get_running_loop()
+        key = (task.num_cpu, task.realization_memory)
+        future: asyncio.Future[None] = loop.create_future()
+        self._submit_locks.setdefault(task.iens, asyncio.Lock())
+        self._array_tasks.setdefault(key, []).append((task, future))
+        if len(self._array_tasks[key]) >= self._array_job_size:
+            self._flush_array_tasks(key)
+        elif key not in self._array_job_timers:
+            self._array_job_timers[key] = loop.call_later(
+                self._array_job_delay, self._flush_array_tasks, key
+            )
+        try:
+            await future
+        except asyncio.CancelledError:
+            pending = self._array_tasks.get(key, [])
+            if (task, future) in pending:
+                pending.remove((task, future))
+            raise
+
+    def _flush_array_tasks(self, key: tuple[int | None, int | None]) -> None:
+        if (timer := self._array_job_timers.pop(key, None)) is not None:
+            timer.cancel()
+        batch = [
+            (task, future)
+            for task, future in self._array_tasks.pop(key, [])
+            if not future.done()
+        ]
+        if batch:
+            submission = asyncio.create_task(self._submit_array_job(batch))
+            self._array_job_submissions.add(submission)
+            submission.add_done_callback(self._array_job_submissions.discard)
+
+    async def _submit_array_job(
+        self, batch: list[tuple[ArrayTask, asyncio.Future[None]]]
+    ) -> None:
+        # Realizations can not be killed until their job ids are known
+        locks = [self._submit_locks[task.iens] for task, _ in batch]
+        for lock in locks:
+            await lock.acquire()
+        try:
+            await self._submit_array([task for task, _ in batch])
+        except Exception as err:
+            for task, future in batch:
+                self._job_error_message_by_iens[task.iens] = str(err)
+                if not future.done():
+                    future.set_exception(FailedSubmit(str(err)))
+        else:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
+        finally:
+            for lock in locks:
+                lock.release()
+
+    async def _submit_array(self, tasks: Sequence[ArrayTask]) -> None:
+        """Submit tasks as one array job, where tasks[i - 1] has index i"""
+        raise NotImplementedError(f"{type(self).__name__} does not support array jobs")
+
     def read_stdout_and_stderr_files(
         self, runpath: str, job_name: str, num_characters_to_read_from_end: int = 300
     ) -> str:
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import logging
 import time
 from collections import Counter
@@ -14,6 +13,7 @@
 from opentelemetry.trace import Status, StatusCode
 from pydantic_core._pydantic_core import ValidationError
 
+from _ert.checksum import verify_checksum
 from _ert.events import Id, RealizationTimeout, event_from_dict
 from ert.callbacks import forward_model_ok
 from ert.config import ForwardModelStep
@@ -77,6 +77,7 @@ def __init__(self, scheduler: Scheduler, real: Realization) -> None:
         self._requested_max_submit: int | None = None
         self._start_time: float | None = None
         self._end_time: float | None = None
+        self._queue_wait_time: float | None = None
 
     def unschedule(self, msg: str) -> None:
         self.state = JobState.ABORTED
@@ -131,10 +132,10 @@ async def _submit_and_run_once(self, sem: asyncio.BoundedSemaphore) -> None:
             await self._send(JobState.PENDING)
             await self.started.wait()
             self._start_time = time.time()
-            pending_time = self._start_time - submit_time
+            self._queue_wait_time = self._start_time - submit_time
             logger.info(
                 f"Pending time for realization {self.iens} "
-                f"was {pending_time:.2f} seconds "
+                f"was {self._queue_wait_time:.2f} seconds "
                 f"(num_cpu={self.real.num_cpu} realization_memory={self.real.realization_memory})"
             )
 
@@ -162,7 +163,7 @@ async def _submit_and_run_once(self, sem: asyncio.BoundedSemaphore) -> None:
     async def run(
         self,
         sem: asyncio.BoundedSemaphore,
-        forward_model_ok_lock: asyncio.Lock,
+        internalization_sem: asyncio.Semaphore,
         checksum_lock: asyncio.Lock,
         max_submit: int = 1,
     ) -> None:
@@ -178,7 +179,7 @@ async def run(
             if self.returncode.result() == 0:
                 if self._scheduler._manifest_queue is not None:
                     await self._verify_checksum(checksum_lock)
-                async with forward_model_ok_lock:
+                async with internalization_sem:
                     await self._handle_finished_forward_model()
                 break
 
@@ -246,19 +247,16 @@ async def _verify_checksum(
         async with checksum_lock:
             for info in valid_checksums:
                 file_path = Path(info["path"])
-                expected_md5sum = info.get("md5sum")
-                if file_path.exists() and expected_md5sum:
-                    actual_md5sum = hashlib.md5(file_path.read_bytes()).hexdigest()
-                    if expected_md5sum == actual_md5sum:
-                        logger.debug(f"File {file_path} checksum successful.")
-                    else:
-                        logger.warning(
-                            f"File {file_path} checksum verification failed."
-                        )
-                elif file_path.exists() and expected_md5sum is None:
+                if not file_path.exists():
+                    logger.error(f"Disk synchronization failed for {file_path}")
+                    continue
+                verified = await asyncio.to_thread(verify_checksum, file_path, info)
+                if verified is None:
                     logger.warning(f"Checksum not received for file {file_path}")
+                elif verified:
+                    logger.debug(f"File {file_path} checksum successful.")
                 else:
-                    logger.error(f"Disk synchronization failed for {file_path}")
+                    logger.warning(f"File {file_path} checksum verification failed.")
 
     async def _handle_finished_forward_model(self) -> None:
         callback_status, status_msg = await forward_model_ok(
@@ -266,6 +264,7 @@ async def _handle_finished_forward_model(self) -> None:
             realization=self.real.run_arg.iens,
             iter=self.real.run_arg.itr,
             ensemble=self.real.run_arg.ensemble_storage,
+            executor=self._scheduler._internalization_executor,
         )
         if self._message:
             self._message = status_msg
@@ -317,7 +316,9 @@ async def _send(self, state: JobState) -> None:
             "exec_hosts": self.exec_hosts,
         }
         self.state = state
-        if state == JobState.FAILED:
+        if state == JobState.RUNNING:
+            event_dict["queue_wait_time"] = self._queue_wait_time
+        elif state == JobState.FAILED:
             event_dict["message"] = self._message
             await self._handle_failure()
 
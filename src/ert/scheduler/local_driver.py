@@ -3,12 +3,17 @@
 import asyncio
 import contextlib
 import logging
+import os
 import signal
 from asyncio.subprocess import Process
-from collections.abc import MutableMapping
+from collections import deque
+from collections.abc import MutableMapping, Sequence
 from contextlib import suppress
+from dataclasses import dataclass
 from pathlib import Path
 
+import psutil
+
 from .driver import SIGNAL_OFFSET, Driver
 from .event import FinishedEvent, StartedEvent
 
@@ -17,11 +22,116 @@
 logger = logging.getLogger(__name__)
 
 
+def available_cpus() -> list[int]:
+    """The ids of the cpus this process is allowed to run on"""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(psutil.cpu_count() or 1))
+
+
+@dataclass
+class Allocation:
+    cpus: list[int]
+    memory: int
+
+
+class ResourcePool:
+    """
+    Keeps track of the cpus and memory (in bytes) that are not in use by
+    running realizations. Requests are granted in the order they are made,
+    but a request that fits may overtake one that is waiting for resources
+    to be released, so that cores are not left idle.
+
+    Requests larger than the pool are reduced to the size of the pool, so
+    that they run alone instead of waiting forever.
+    """
+
+    def __init__(self, cpus: Sequence[int], memory: int) -> None:
+        self.total_cpus = len(cpus)
+        self.total_memory = memory
+        self._free_cpus = list(cpus)
+        self._free_memory = memory
+        self._waiting: deque[tuple[int, int, asyncio.Future[Allocation]]] = deque()
+
+    @property
+    def free_cpus(self) -> int:
+        return len(self._free_cpus)
+
+    @property
+    def free_memory(self) -> int:
+        return self._free_memory
+
+    async def acquire(self, num_cpu: int, memory: int) -> Allocation:
+        if num_cpu > self.total_cpus or memory > self.total_memory:
+            logger.warning(
+                f"Requested {num_cpu} cpus and {memory} bytes of memory, "
+                f"but only {self.total_cpus} cpus and {self.total_memory} bytes "
+                "are available locally"
+            )
+        future: asyncio.Future[Allocation] = asyncio.get_running_loop().create_future()
+        self._waiting.append(
+            (
+                min(max(num_cpu, 1), self.total_cpus),
+                min(max(memory, 0), self.total_memory),
+                future,
+            )
+        )
+        self._grant()
+        try:
+            return await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self.release(future.result())
+            raise
+
+    def release(self, allocation: Allocation) -> None:
+        self._free_cpus.extend(allocation.cpus)
+        self._free_memory += allocation.memory
+        self._grant()
+
+    def _grant(self) -> None:
+        waiting: deque[tuple[int, int, asyncio.Future[Allocation]]] = deque()
+        for num_cpu, memory, future in self._waiting:
+            if future.done():
+                continue
+            if num_cpu <= len(self._free_cpus) and memory <= self._free_memory:
+                cpus = self._free_cpus[:num_cpu]
+                del self._free_cpus[:num_cpu]
+                self._free_memory -= memory
+                future.set_result(Allocation(cpus, memory))
+            else:
+                waiting.append((num_cpu, memory, future))
+        self._waiting = waiting
+
+
 class LocalDriver(Driver):
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        resource_aware: bool = False,
+        cpu_affinity: bool = False,
+        cpus: Sequence[int] | None = None,
+        memory: int | None = None,
+    ) -> None:
+        """
+        The local driver runs realizations as subprocesses.
+
+        If resource_aware is set, a realization is only started when its
+        num_cpu and realization_memory fit within the cpus and memory (in
+        bytes) not used by other realizations. These default to the cpus
+        this process may run on and the memory available when the driver
+        is created. With cpu_affinity, each realization is pinned to the
+        cpus it has been given.
+        """
         super().__init__()
         self._tasks: MutableMapping[int, asyncio.Task[None]] = {}
         self._sent_finished_events: set[int] = set()
+        self._cpu_affinity = cpu_affinity and hasattr(os, "sched_setaffinity")
+        self._resources: ResourcePool | None = None
+        if resource_aware:
+            self._resources = ResourcePool(
+                available_cpus() if cpus is None else cpus,
+                psutil.virtual_memory().available if memory is None else memory,
+            )
 
     async def submit(
         self,
@@ -35,7 +145,15 @@ async def submit(
         realization_memory: int | None = 0,
         activate_script: str = "",
     ) -> None:
-        self._tasks[iens] = asyncio.create_task(self._run(iens, executable, *args))
+        self._tasks[iens] = asyncio.create_task(
+            self._run(
+                iens,
+                executable,
+                *args,
+                num_cpu=num_cpu or 1,
+                realization_memory=realization_memory or 0,
+            )
+        )
         with suppress(KeyError):
             self._sent_finished_events.remove(iens)
 
@@ -63,7 +181,32 @@ async def finish(self) -> None:
                 raise result
         logger.info("All realization tasks finished")
 
-    async def _run(self, iens: int, executable: str, /, *args: str | Path) -> None:
+    async def _run(
+        self,
+        iens: int,
+        executable: str,
+        /,
+        *args: str | Path,
+        num_cpu: int = 1,
+        realization_memory: int = 0,
+    ) -> None:
+        if self._resources is None:
+            await self._run_process(iens, executable, *args)
+            return
+        allocation = await self._resources.acquire(num_cpu, realization_memory)
+        try:
+            await self._run_process(iens, executable, *args, cpus=allocation.cpus)
+        finally:
+            self._resources.release(allocation)
+
+    async def _run_process(
+        self,
+        iens: int,
+        executable: str,
+        /,
+        *args: str | Path,
+        cpus: list[int] | None = None,
+    ) -> None:
         logger.debug(
             f"Submitting realization {iens} as command '{executable} {' '.join(str(arg) for arg in args)}'"
         )
@@ -82,6 +225,9 @@ async def _run(self, iens: int, executable: str, /, *args: str | Path) -> None:
             await self._dispatch_finished_event(iens, 127)
             return
 
+        if cpus is not None and self._cpu_affinity:
+            self._set_cpu_affinity(proc, cpus)
+
         await self.event_queue.put(StartedEvent(iens=iens))
 
         returncode = 1
@@ -108,6 +254,15 @@ async def _init(iens: int, executable: str, /, *args: str | Path) -> Process:
             start_new_session=True,
         )
 
+    @staticmethod
+    def _set_cpu_affinity(proc: Process, cpus: list[int]) -> None:
+        # The forward model steps are started by the job dispatcher after
+        # this, so they inherit the affinity
+        try:
+            os.sched_setaffinity(proc.pid, cpus)
+        except OSError as err:
+            logger.warning(f"Could not set cpu affinity {cpus} for {proc.pid}: {err}")
+
     @staticmethod
     async def _wait(proc: Process) -> int:
         return await proc.wait()
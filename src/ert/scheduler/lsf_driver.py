@@ -19,7 +19,16 @@
     get_args,
 )
 
-from .driver import SIGNAL_OFFSET, Driver, FailedSubmit, create_submit_script
+from .driver import (
+    SIGNAL_OFFSET,
+    ArrayTask,
+    Driver,
+    FailedSubmit,
+    array_job_name,
+    create_array_submit_script,
+    create_submit_script,
+    write_submit_script,
+)
 from .event import Event, FinishedEvent, StartedEvent
 
 _POLL_PERIOD = 2.0  # seconds
@@ -127,6 +136,25 @@ def parse_bjobs(bjobs_output: str) -> dict[str, JobState]:
     return data
 
 
+def merge_bjobs_jobindex(bjobs_output: str) -> str:
+    """Merge the jobid and jobindex columns of bjobs output into the
+    job ids of array job elements, like 123[4]
+
+    >>> merge_bjobs_jobindex("123^4^RUN^-\\n124^0^PEND^-")
+    '123[4]^RUN^-\\n124^PEND^-'
+    """
+    lines = []
+    for line in bjobs_output.splitlines():
+        tokens = line.split(sep="^")
+        if len(tokens) == 4:
+            job_id, job_index, *tokens = tokens
+            if job_index not in {"0", "-"}:
+                job_id = f"{job_id}[{job_index}]"
+            tokens.insert(0, job_id)
+        lines.append("^".join(tokens))
+    return "\n".join(lines)
+
+
 def parse_bjobs_exec_hosts(bjobs_output: str) -> dict[str, str]:
     data: dict[str, str] = {}
     for line in bjobs_output.splitlines():
@@ -257,8 +285,9 @@ def __init__(
         bkill_cmd: str | None = None,
         bhist_cmd: str | None = None,
         activate_script: str = "",
+        array_job_size: int = 0,
     ) -> None:
-        super().__init__(activate_script)
+        super().__init__(activate_script, array_job_size)
         self._queue_name = queue_name
         self._project_code = project_code
         self._resource_requirement = resource_requirement
@@ -284,8 +313,6 @@ def __init__(
         self._bhist_required_cache_age: float = 4
         self._bhist_cache_timestamp: float = time.time()
 
-        self._submit_locks: MutableMapping[int, asyncio.Lock] = {}
-
     async def submit(
         self,
         iens: int,
@@ -302,6 +329,14 @@ async def submit(
         if name is None:
             name = Path(executable).name
 
+        if self.uses_array_jobs:
+            await self._submit_array_task(
+                ArrayTask(
+                    iens, executable, args, name, runpath, num_cpu, realization_memory
+                )
+            )
+            return
+
         arg_queue_name = ["-q", self._queue_name] if self._queue_name else []
         arg_project_code = ["-P", self._project_code] if self._project_code else []
         script = create_submit_script(runpath, executable, args, self.activate_script)
@@ -381,6 +416,68 @@ async def submit(
             )
             self._iens2jobid[iens] = job_id
 
+    async def _submit_array(self, tasks: Sequence[ArrayTask]) -> None:
+        name = array_job_name(tasks)
+        runpath = tasks[0].runpath
+        arg_queue_name = ["-q", self._queue_name] if self._queue_name else []
+        arg_project_code = ["-P", self._project_code] if self._project_code else []
+        script = create_array_submit_script(
+            tasks,
+            "LSB_JOBINDEX",
+            self.activate_script,
+            output_suffixes=(".LSF-stdout", ".LSF-stderr"),
+        )
+        script_path = write_submit_script(runpath, ".lsf_submit_", script)
+        bsub_with_args: list[str] = [
+            str(self._bsub_cmd),
+            *arg_queue_name,
+            *arg_project_code,
+            "-o",
+            str(runpath / (name + ".%I.LSF-stdout")),
+            "-e",
+            str(runpath / (name + ".%I.LSF-stderr")),
+            "-n",
+            str(tasks[0].num_cpu),
+            *self._build_resource_requirement_arg(
+                realization_memory=tasks[0].realization_memory or 0
+            ),
+            "-J",
+            f"{name}[1-{len(tasks)}]",
+            str(script_path),
+        ]
+        logger.debug(
+            f"Submitting array job to LSF with command {shlex.join(bsub_with_args)}"
+        )
+        process_success, process_message = await self._execute_with_retry(
+            bsub_with_args,
+            retry_on_empty_stdout=True,
+            retry_codes=(FLAKY_SSH_RETURNCODE,),
+            total_attempts=self._max_bsub_attempts,
+            retry_interval=self._sleep_time_between_cmd_retries,
+            error_on_msgs=BSUB_FAILURE_MESSAGES,
+        )
+        if not process_success:
+            raise FailedSubmit(process_message)
+
+        match = re.search(r"Job <([0-9]+)> is submitted to .*queue", process_message)
+        if match is None:
+            raise FailedSubmit(f"Could not understand '{process_message}' from bsub")
+        logger.info(
+            f"Realizations {[task.iens for task in tasks]} accepted by LSF "
+            f"as array job {match[1]}"
+        )
+        for index, task in enumerate(tasks, start=1):
+            job_id = f"{match[1]}[{index}]"
+            (task.runpath / LSF_INFO_JSON_FILENAME).write_text(
+                json.dumps({"job_id": job_id}), encoding="utf-8"
+            )
+            self._jobs[job_id] = JobData(
+                iens=task.iens,
+                job_state=QueuedJob(job_state="PEND"),
+                submitted_timestamp=time.time(),
+            )
+            self._iens2jobid[task.iens] = job_id
+
     async def kill(self, iens: int) -> None:
         if iens not in self._submit_locks:
             logger.error(
@@ -433,13 +530,19 @@ async def poll(self) -> None:
                 await asyncio.sleep(self._poll_period)
                 continue
             current_jobids = list(self._jobs.keys())
+            # Array job elements are only told apart by their jobindex
+            bjobs_fields = (
+                "jobid jobindex stat exec_host"
+                if self.uses_array_jobs
+                else "jobid stat exec_host"
+            )
 
             try:
                 process = await asyncio.create_subprocess_exec(
                     str(self._bjobs_cmd),
                     "-noheader",
                     "-o",
-                    "jobid stat exec_host delimiter='^'",
+                    f"{bjobs_fields} delimiter='^'",
                     *current_jobids,
                     stdout=asyncio.subprocess.PIPE,
                     stderr=asyncio.subprocess.PIPE,
@@ -456,10 +559,11 @@ async def poll(self) -> None:
                 logger.warning(
                     f"bjobs gave returncode {process.returncode} and error {stderr.decode()}"
                 )
-            bjobs_states = _parse_jobs_dict(parse_bjobs(stdout.decode(errors="ignore")))
-            self.update_and_log_exec_hosts(
-                parse_bjobs_exec_hosts(stdout.decode(errors="ignore"))
-            )
+            bjobs_output = stdout.decode(errors="ignore")
+            if self.uses_array_jobs:
+                bjobs_output = merge_bjobs_jobindex(bjobs_output)
+            bjobs_states = _parse_jobs_dict(parse_bjobs(bjobs_output))
+            self.update_and_log_exec_hosts(parse_bjobs_exec_hosts(bjobs_output))
 
             job_ids_found_in_bjobs_output = set(bjobs_states.keys())
             if (
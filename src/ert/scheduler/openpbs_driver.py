@@ -5,12 +5,19 @@
 import logging
 import shlex
 import shutil
-from collections.abc import Mapping, MutableMapping
+from collections.abc import Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Literal, cast, get_type_hints
 
-from .driver import Driver, FailedSubmit, create_submit_script
+from .driver import (
+    ArrayTask,
+    Driver,
+    FailedSubmit,
+    array_job_name,
+    create_array_submit_script,
+    create_submit_script,
+)
 from .event import Event, FinishedEvent, StartedEvent
 
 logger = logging.getLogger(__name__)
@@ -28,7 +35,7 @@
     "T",  # Transiting
     "U",  # User suspended
     "W",  # Waiting
-    "X",  # Expired (subjobs only)
+    "X",  # Expired, i.e. finished (subjobs only)
 ]
 
 QSUB_INVALID_CREDENTIAL = 171
@@ -41,7 +48,7 @@
 
 @dataclass(frozen=True)
 class IgnoredJobstates:
-    job_state: Literal["B", "M", "S", "T", "U", "W", "X"]
+    job_state: Literal["B", "M", "S", "T", "U", "W"]
 
 
 @dataclass(frozen=True)
@@ -56,7 +63,8 @@ class RunningJob:
 
 @dataclass(frozen=True)
 class FinishedJob:
-    job_state: Literal["E", "F"]
+    # Finished subjobs of array jobs are reported as expired
+    job_state: Literal["E", "F", "X"]
     returncode: int | None = None
 
 
@@ -75,7 +83,7 @@ def _create_job_class(job_dict: Mapping[str, str]) -> AnyJob:
     job_state = job_dict["job_state"]
     if job_state in get_type_hints(FinishedJob)["job_state"].__args__:
         return FinishedJob(
-            cast(Literal["E", "F"], job_state),
+            cast(Literal["E", "F", "X"], job_state),
             returncode=int(job_dict["Exit_status"])
             if "Exit_status" in job_dict
             else None,
@@ -85,9 +93,7 @@ def _create_job_class(job_dict: Mapping[str, str]) -> AnyJob:
     if job_state in get_type_hints(QueuedJob)["job_state"].__args__:
         return QueuedJob(cast(Literal["H", "Q"], job_state))
     if job_state in get_type_hints(IgnoredJobstates)["job_state"].__args__:
-        return IgnoredJobstates(
-            cast(Literal["B", "M", "S", "T", "U", "W", "X"], job_state)
-        )
+        return IgnoredJobstates(cast(Literal["B", "M", "S", "T", "U", "W"], job_state))
     raise TypeError(f"Invalid job state '{job_state}'")
 
 
@@ -130,8 +136,9 @@ def __init__(
         qstat_cmd: str | None = None,
         qdel_cmd: str | None = None,
         activate_script: str = "",
+        array_job_size: int = 0,
     ) -> None:
-        super().__init__(activate_script)
+        super().__init__(activate_script, array_job_size)
 
         self._queue_name = queue_name
         self._project_code = project_code
@@ -189,6 +196,27 @@ async def submit(
         if name is None:
             name = Path(executable).name
 
+        if self.uses_array_jobs:
+            await self._submit_array_task(
+                ArrayTask(
+                    iens, executable, args, name, runpath, num_cpu, realization_memory
+                )
+            )
+            return
+        await self._submit_job(
+            iens, executable, args, name, runpath, num_cpu, realization_memory
+        )
+
+    async def _submit_job(
+        self,
+        iens: int,
+        executable: str,
+        args: tuple[str, ...],
+        name: str,
+        runpath: Path,
+        num_cpu: int | None,
+        realization_memory: int | None,
+    ) -> None:
         arg_queue_name = ["-q", self._queue_name] if self._queue_name else []
         arg_project_code = ["-A", self._project_code] if self._project_code else []
         arg_keep_qsub_output = (
@@ -233,6 +261,73 @@ async def submit(
         self._iens2jobid[iens] = job_id_
         self._non_finished_job_ids.add(job_id_)
 
+    async def _submit_array(self, tasks: Sequence[ArrayTask]) -> None:
+        if len(tasks) == 1:
+            # PBS array jobs must have at least two subjobs
+            task = tasks[0]
+            await self._submit_job(
+                task.iens,
+                task.executable,
+                task.args,
+                task.name,
+                task.runpath,
+                task.num_cpu,
+                task.realization_memory,
+            )
+            return
+
+        arg_queue_name = ["-q", self._queue_name] if self._queue_name else []
+        arg_project_code = ["-A", self._project_code] if self._project_code else []
+        arg_keep_qsub_output = (
+            [] if self._keep_qsub_output else ["-o", "/dev/null", "-e", "/dev/null"]
+        )
+        script = create_array_submit_script(
+            tasks, "PBS_ARRAY_INDEX", self.activate_script
+        )
+        name_prefix = self._job_prefix or ""
+        qsub_with_args: list[str] = [
+            str(self._qsub_cmd),
+            # Array jobs can not be marked as not rerunnable
+            f"-N{name_prefix}{array_job_name(tasks)}",
+            "-J",
+            f"1-{len(tasks)}",
+            *arg_queue_name,
+            *arg_project_code,
+            *arg_keep_qsub_output,
+            *self._build_resource_string(
+                num_cpu=tasks[0].num_cpu or 1,
+                realization_memory=tasks[0].realization_memory or 0,
+            ),
+        ]
+        logger.debug(
+            f"Submitting array job to PBS with command {shlex.join(qsub_with_args)}"
+        )
+        process_success, process_message = await self._execute_with_retry(
+            qsub_with_args,
+            retry_codes=(
+                QSUB_INVALID_CREDENTIAL,
+                QSUB_PREMATURE_END_OF_MESSAGE,
+                QSUB_CONNECTION_REFUSED,
+            ),
+            stdin=script.encode(encoding="utf-8"),
+            total_attempts=self._max_pbs_cmd_attempts,
+            retry_interval=self._sleep_time_between_cmd_retries,
+            driverlogger=logger,
+        )
+        if not process_success:
+            raise FailedSubmit(process_message)
+
+        # The id of an array job is like 123[].server, and its subjobs 123[4].server
+        logger.debug(
+            f"Realizations {[task.iens for task in tasks]} accepted by PBS "
+            f"as array job {process_message}"
+        )
+        for index, task in enumerate(tasks, start=1):
+            job_id = process_message.replace("[]", f"[{index}]", 1)
+            self._jobs[job_id] = (task.iens, QueuedJob())
+            self._iens2jobid[task.iens] = job_id
+            self._non_finished_job_ids.add(job_id)
+
     async def kill(self, iens: int) -> None:
         if iens in self._finished_iens:
             return
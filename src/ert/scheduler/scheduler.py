@@ -7,9 +7,10 @@
 import traceback
 from collections import defaultdict
 from collections.abc import Iterable, MutableMapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import suppress
 from dataclasses import asdict
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 import orjson
 from pydantic.dataclasses import dataclass
@@ -69,6 +70,8 @@ def __init__(
         max_submit: int = 1,
         max_running: int = 1,
         submit_sleep: float = 0.0,
+        max_internalizations: int = 4,
+        internalization_executor: Literal["thread", "process"] = "thread",
         ens_id: str | None = None,
         ee_uri: str | None = None,
         ee_token: str | None = None,
@@ -102,6 +105,14 @@ def __init__(
             )
         self._max_submit = max_submit
         self._max_running = max_running
+        if max_internalizations < 1:
+            raise ValueError("max_internalizations needs to be a positive number")
+        # Number of finished realizations whose results are read into
+        # storage at the same time, and whether they are read by threads
+        # or processes.
+        self._max_internalizations = max_internalizations
+        self._internalization_executor_type = internalization_executor
+        self._internalization_executor: Executor | None = None
         self._ee_uri = ee_uri
         self._ens_id = ens_id
         self._ee_token = ee_token
@@ -263,9 +274,13 @@ async def execute(
             scheduling_tasks.append(asyncio.create_task(self._update_avg_job_runtime()))
 
         sem = asyncio.BoundedSemaphore(self._max_running or len(self._jobs))
-        # this lock is to assure that no more than 1 task
-        # does internalization at a time
-        forward_model_ok_lock = asyncio.Lock()
+        # bounds the number of tasks doing internalization at a time
+        internalization_sem = asyncio.BoundedSemaphore(self._max_internalizations)
+        self._internalization_executor = (
+            ProcessPoolExecutor
+            if self._internalization_executor_type == "process"
+            else ThreadPoolExecutor
+        )(max_workers=self._max_internalizations)
         verify_checksum_lock = asyncio.Lock()
         for iens, job in self._jobs.items():
             await asyncio.sleep(0)
@@ -273,7 +288,7 @@ async def execute(
                 self._job_tasks[iens] = asyncio.create_task(
                     job.run(
                         sem,
-                        forward_model_ok_lock,
+                        internalization_sem,
                         verify_checksum_lock,
                         self._max_submit,
                     ),
@@ -305,6 +320,8 @@ async def execute(
                 *scheduling_tasks,
                 return_exceptions=True,
             )
+            self._internalization_executor.shutdown(wait=False, cancel_futures=True)
+            self._internalization_executor = None
 
         if self._cancelled:
             logger.debug("Scheduler has been cancelled, jobs are stopped.")
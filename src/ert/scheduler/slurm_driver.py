@@ -7,13 +7,22 @@
 import shlex
 import stat
 import time
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
 from enum import Enum, auto
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 
-from .driver import SIGNAL_OFFSET, Driver, FailedSubmit, create_submit_script
+from .driver import (
+    SIGNAL_OFFSET,
+    ArrayTask,
+    Driver,
+    FailedSubmit,
+    array_job_name,
+    create_array_submit_script,
+    create_submit_script,
+    write_submit_script,
+)
 from .event import Event, FinishedEvent, StartedEvent
 
 SLURM_FAILED_EXIT_CODE_FETCH = SIGNAL_OFFSET + 66
@@ -72,9 +81,9 @@ def __init__(
         squeue_timeout: float = 2,
         project_code: str | None = None,
         activate_script: str = "",
+        array_job_size: int = 0,
     ) -> None:
-        super().__init__(activate_script)
-        self._submit_locks: dict[int, asyncio.Lock] = {}
+        super().__init__(activate_script, array_job_size)
         self._iens2jobid: dict[int, str] = {}
         self._jobs: dict[str, JobData] = {}
         self._job_error_message_by_iens: dict[int, str] = {}
@@ -110,15 +119,20 @@ def _submit_cmd(
         runpath: Path | None = None,
         num_cpu: int | None = 1,
         realization_memory: int | None = 0,
+        array_size: int | None = None,
     ) -> list[str]:
+        # Array tasks redirect their output to their own runpaths
+        output_name = f"{name}_%a" if array_size else name
         sbatch_with_args = [
             str(self._sbatch),
             f"--job-name={name}",
             f"--chdir={runpath}",
             "--parsable",
-            f"--output={name}.stdout",
-            f"--error={name}.stderr",
+            f"--output={output_name}.stdout",
+            f"--error={output_name}.stderr",
         ]
+        if array_size:
+            sbatch_with_args.append(f"--array=1-{array_size}")
         if num_cpu:
             sbatch_with_args.append(f"--ntasks={num_cpu}")
         if realization_memory and realization_memory > 0:
@@ -155,6 +169,14 @@ async def submit(
         if name is None:
             name = Path(executable).name
 
+        if self.uses_array_jobs:
+            await self._submit_array_task(
+                ArrayTask(
+                    iens, executable, args, name, runpath, num_cpu, realization_memory
+                )
+            )
+            return
+
         script = create_submit_script(runpath, executable, args, self.activate_script)
         script_path: Path | None = None
         try:
@@ -207,6 +229,50 @@ async def submit(
             )
             self._iens2jobid[iens] = job_id
 
+    async def _submit_array(self, tasks: Sequence[ArrayTask]) -> None:
+        name = array_job_name(tasks)
+        script = create_array_submit_script(
+            tasks,
+            "SLURM_ARRAY_TASK_ID",
+            self.activate_script,
+            output_suffixes=(".stdout", ".stderr"),
+        )
+        runpath = tasks[0].runpath
+        script_path = write_submit_script(runpath, ".slurm_submit_", script)
+        sbatch_with_args = [
+            *self._submit_cmd(
+                name,
+                runpath,
+                tasks[0].num_cpu,
+                tasks[0].realization_memory,
+                array_size=len(tasks),
+            ),
+            str(script_path),
+        ]
+        logger.debug(
+            f"Submitting array job to SLURM with command {shlex.join(sbatch_with_args)}"
+        )
+        process_success, process_message = await self._execute_with_retry(
+            sbatch_with_args,
+            retry_on_empty_stdout=True,
+            retry_codes=(),
+            total_attempts=self._max_sbatch_attempts,
+            retry_interval=self._sleep_time_between_cmd_retries,
+        )
+        if not process_success:
+            raise FailedSubmit(process_message)
+        if not process_message:
+            raise FailedSubmit("sbatch returned empty jobid")
+        array_job_id = process_message
+        logger.info(
+            f"Realizations {[task.iens for task in tasks]} accepted by SLURM "
+            f"as array job {array_job_id}"
+        )
+        for index, task in enumerate(tasks, start=1):
+            job_id = f"{array_job_id}_{index}"
+            self._jobs[job_id] = JobData(iens=task.iens)
+            self._iens2jobid[task.iens] = job_id
+
     async def kill(self, iens: int) -> None:
         if iens not in self._submit_locks:
             logger.error(f"scancel failed, realization {iens} has never been submitted")
@@ -235,6 +301,9 @@ async def poll(self) -> None:
                 await asyncio.sleep(self._poll_period)
                 continue
             arguments = ["-h", "--format=%i %T"]
+            if self.uses_array_jobs:
+                # Show pending array tasks on separate lines
+                arguments.append("--array")
             if self._user:
                 arguments.append(f"--user={self._user}")
             try:
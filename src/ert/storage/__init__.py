@@ -3,6 +3,9 @@
 import os
 from pathlib import Path
 
+# workaround for https://github.com/Unidata/netcdf4-python/issues/1343
+import netCDF4 as _netcdf4  # noqa
+
 from ert.storage.local_ensemble import LocalEnsemble
 from ert.storage.local_experiment import LocalExperiment
 from ert.storage.local_storage import LocalStorage
@@ -3,17 +3,19 @@
 import contextlib
 import logging
 import os
-from collections.abc import Iterable
+import shutil
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from functools import cache, lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 import numpy as np
 import pandas as pd
+import scipy.io
 import xarray as xr
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_serializer
 from typing_extensions import TypedDict, deprecated
 
 from ert.config import GenKwConfig
@@ -54,10 +56,107 @@ class _Failure(BaseModel):
     time: datetime
 
 
+class _Manifest(BaseModel):
+    """
+    The realizations each parameter group and response type is stored for,
+    and the type of any recorded failures, so that the state of an ensemble
+    is known without looking for the files of every realization. Also
+    records the realizations whose stored misfits are up to date with their
+    responses, and how many times responses have been saved for each
+    realization, so that misfits calculated from responses that have since
+    been replaced are not recorded as up to date.
+    """
+
+    parameters: dict[str, set[int]] = Field(default_factory=dict)
+    responses: dict[str, set[int]] = Field(default_factory=dict)
+    failures: dict[int, RealizationStorageState] = Field(default_factory=dict)
+    misfits: set[int] = Field(default_factory=set)
+    response_generations: dict[int, int] = Field(default_factory=dict)
+
+    @field_serializer("parameters", "responses")
+    def _serialize_realizations(
+        self, stored: dict[str, set[int]]
+    ) -> dict[str, list[int]]:
+        return {key: sorted(realizations) for key, realizations in stored.items()}
+
+    @field_serializer("misfits")
+    def _serialize_misfits(self, misfits: set[int]) -> list[int]:
+        return sorted(misfits)
+
+
 def _escape_filename(filename: str) -> str:
     return filename.replace("%", "%25").replace("/", "%2F")
 
 
+def _unescape_filename(filename: str) -> str:
+    return filename.replace("%2F", "/").replace("%25", "%")
+
+
+def _link_or_copy(source: Path, target: Path) -> None:
+    # Stored files are only ever replaced, never modified in place, so
+    # ensembles can safely share them through hard links
+    target.unlink(missing_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+
+
+def _read_mapped_values(
+    path: Path,
+    group: str,
+    columns: dict[int, int],
+    indices: npt.NDArray[np.int_] | None,
+    out: npt.NDArray[Any] | None,
+    num_columns: int,
+    dtype: npt.DTypeLike,
+) -> npt.NDArray[Any]:
+    """
+    Copies the 'values' of the given realizations from a parameter file,
+    written with the scipy engine, into columns of out. The file is memory
+    mapped, so only the pages holding the selected values are read.
+    """
+    netcdf = scipy.io.netcdf_file(path, mode="r", mmap=True)
+    try:
+        return _copy_values(netcdf, group, columns, indices, out, num_columns, dtype)
+    finally:
+        netcdf.close()
+
+
+def _copy_values(
+    netcdf: scipy.io.netcdf_file,
+    group: str,
+    columns: dict[int, int],
+    indices: npt.NDArray[np.int_] | None,
+    out: npt.NDArray[Any] | None,
+    num_columns: int,
+    dtype: npt.DTypeLike,
+) -> npt.NDArray[Any]:
+    variable = netcdf.variables["values"]
+    fill_value = getattr(variable, "_FillValue", None)
+    if out is None:
+        size = int(np.prod(variable.shape[1:])) if indices is None else len(indices)
+        out = np.empty((size, num_columns), dtype=dtype, order="F")
+
+    stored = netcdf.variables["realizations"].data.tolist()
+    if missing := set(columns) - set(stored):
+        raise KeyError(
+            f"No dataset '{group}' in storage for realization {min(missing)}"
+        )
+    for position, realization in enumerate(stored):
+        if realization not in columns:
+            continue
+        column = out[:, columns[realization]]
+        flat = variable.data[position].reshape(-1)
+        if indices is None:
+            column[:] = flat
+        else:
+            np.take(flat, indices, out=column)
+        if fill_value is not None and not np.isnan(fill_value):
+            column[column == fill_value] = np.nan
+    return out
+
+
 class LocalEnsemble(BaseMode):
     """
     Represents an ensemble within the local storage system of ERT.
@@ -71,6 +170,7 @@ def __init__(
         storage: LocalStorage,
         path: Path,
         mode: Mode,
+        index: _Index | None = None,
     ):
         """
         Initialize a LocalEnsemble instance.
@@ -83,15 +183,25 @@ def __init__(
             File system path to ensemble data.
         mode : Mode
             Access mode for the ensemble (read/write).
+        index : _Index, optional
+            The contents of the index file of the ensemble. Read from
+            path if not given.
         """
 
         super().__init__(mode)
         self._storage = storage
         self._path = path
-        self._index = _Index.model_validate_json(
-            (path / "index.json").read_text(encoding="utf-8")
+        self._index = (
+            index
+            if index is not None
+            else _Index.model_validate_json(
+                (path / "index.json").read_text(encoding="utf-8")
+            )
         )
         self._error_log_name = "error.json"
+        self._manifest_name = "manifest.json"
+        self._manifest: _Manifest | None = None
+        self._manifest_stat: tuple[int, int] | None = None
 
         @cache
         def create_realization_dir(realization: int) -> Path:
@@ -274,17 +384,16 @@ def is_initalized(self) -> list[int]:
             Returns the realization numbers with parameters
         """
 
+        manifest = self._get_manifest()
+        stored = [
+            manifest.parameters.get(parameter.name, set())
+            for parameter in self.experiment.parameter_configuration.values()
+            if not parameter.forward_init
+        ]
         return [
             i
             for i in range(self.ensemble_size)
-            if all(
-                (
-                    self._realization_dir(i)
-                    / (_escape_filename(parameter.name) + ".nc")
-                ).exists()
-                for parameter in self.experiment.parameter_configuration.values()
-                if not parameter.forward_init
-            )
+            if all(i in realizations for realizations in stored)
         ]
 
     def has_data(self) -> list[int]:
@@ -350,6 +459,11 @@ def set_failure(
             filename, error.model_dump_json(indent=2).encode("utf-8")
         )
 
+        def _add_failure(manifest: _Manifest) -> None:
+            manifest.failures[realization] = failure_type
+
+        self._update_manifest(_add_failure)
+
     def unset_failure(
         self,
         realization: int,
@@ -358,6 +472,11 @@ def unset_failure(
         if filename.exists():
             filename.unlink()
 
+        def _remove_failure(manifest: _Manifest) -> None:
+            manifest.failures.pop(realization, None)
+
+        self._update_manifest(_remove_failure)
+
     def has_failure(self, realization: int) -> bool:
         """
         Check if given realization has a recorded failure.
@@ -373,7 +492,7 @@ def has_failure(self, realization: int) -> bool:
             True if realization has a recorded failure.
         """
 
-        return (self._realization_dir(realization) / self._error_log_name).exists()
+        return realization in self._get_manifest().failures
 
     def get_failure(self, realization: int) -> _Failure | None:
         """
@@ -399,6 +518,7 @@ def get_failure(self, realization: int) -> _Failure | None:
         return None
 
     def refresh_ensemble_state(self) -> None:
+        self._manifest = None
         self.get_ensemble_state.cache_clear()
         self.get_ensemble_state()
 
@@ -413,91 +533,25 @@ def get_ensemble_state(self) -> list[set[RealizationStorageState]]:
             list of realization states.
         """
 
-        response_configs = self.experiment.response_configuration
-
-        def _parameters_exist_for_realization(realization: int) -> bool:
-            """
-            Returns true if all parameters in the experiment have
-            all been saved in the ensemble. If no parameters, return True
-
-            Parameters
-            ----------
-            realization : int
-                Realization index.
-
-            Returns
-            -------
-            exists : bool
-                True if parameters exist for realization.
-            """
-            if not self.experiment.parameter_configuration:
-                return True
-            path = self._realization_dir(realization)
-            return all(
-                (path / (_escape_filename(parameter) + ".nc")).exists()
-                for parameter in self.experiment.parameter_configuration
-            )
-
-        def _responses_exist_for_realization(
-            realization: int, key: str | None = None
-        ) -> bool:
-            """
-            Returns true if there are responses in the experiment and they have
-            all been saved in the ensemble
-
-            Parameters
-            ----------
-            realization : int
-                Realization index.
-            key : str, optional
-                Response key to filter realizations. If None, all responses are considered.
-
-            Returns
-            -------
-            exists : bool
-                True if responses exist for realization.
-            """
-
-            if not response_configs:
-                return True
-            path = self._realization_dir(realization)
-
-            def _has_response(key_: str) -> bool:
-                if key_ in self.experiment.response_key_to_response_type:
-                    response_type = self.experiment.response_key_to_response_type[key_]
-                    return (path / f"{response_type}.parquet").exists()
-
-                return (path / f"{key_}.parquet").exists()
-
-            if key:
-                return _has_response(key)
-
-            is_expecting_any_responses = any(
-                bool(config.keys) for config in response_configs.values()
-            )
-
-            if not is_expecting_any_responses:
-                return True
-
-            non_empty_response_configs = [
-                response
-                for response, config in response_configs.items()
-                if bool(config.keys)
-            ]
-
-            return all(
-                _has_response(response) for response in non_empty_response_configs
-            )
+        manifest = self._get_manifest()
+        stored_parameters = [
+            manifest.parameters.get(parameter, set())
+            for parameter in self.experiment.parameter_configuration
+        ]
+        # Response types without any keys are not expected to be stored
+        stored_responses = [
+            manifest.responses.get(response_type, set())
+            for response_type, config in self.experiment.response_configuration.items()
+            if config.keys
+        ]
 
         def _find_state(realization: int) -> set[RealizationStorageState]:
             state = set()
-            if self.has_failure(realization):
-                failure = self.get_failure(realization)
-                assert failure
-                state.add(failure.type)
-            if _responses_exist_for_realization(realization):
+            if realization in manifest.failures:
+                state.add(manifest.failures[realization])
+            if all(realization in stored for stored in stored_responses):
                 state.add(RealizationStorageState.RESPONSES_LOADED)
-            if _parameters_exist_for_realization(realization):
+            if all(realization in stored for stored in stored_parameters):
                 state.add(RealizationStorageState.PARAMETERS_LOADED)
 
             if len(state) == 0:
@@ -507,22 +561,160 @@ def _find_state(realization: int) -> set[RealizationStorageState]:
 
         return [_find_state(i) for i in range(self.ensemble_size)]
 
+    def _get_manifest(self) -> _Manifest:
+        """
+        The manifest of the ensemble, read from disk on first use and again
+        whenever it has been written by another instance of the ensemble.
+        Ensembles written before the manifest was introduced have it built
+        from the stored files instead.
+        """
+        manifest = self._manifest
+        stat = self._get_manifest_stat()
+        if manifest is None or stat != self._manifest_stat:
+            if stat is not None:
+                manifest = _Manifest.model_validate_json(
+                    (self._path / self._manifest_name).read_text(encoding="utf-8")
+                )
+                self._manifest_stat = stat
+            else:
+                manifest = self._scan_manifest()
+                if self.can_write:
+                    self._write_manifest(manifest)
+            self._manifest = manifest
+        return manifest
+
+    def _get_manifest_stat(self) -> tuple[int, int] | None:
+        # The manifest is replaced on write, so the inode changes even when
+        # two writes fall within the resolution of the modification time
+        try:
+            stat = (self._path / self._manifest_name).stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _scan_manifest(self) -> _Manifest:
+        manifest = _Manifest()
+        for path in (self._path / "parameters").glob("*.nc"):
+            group = _unescape_filename(path.stem)
+            manifest.parameters[group] = self._stored_parameter_realizations(group)
+        for path in self._path.glob("realization-*/*"):
+            realization = int(path.parent.name.removeprefix("realization-"))
+            if path.name == self._error_log_name:
+                manifest.failures[realization] = _Failure.model_validate_json(
+                    path.read_text(encoding="utf-8")
+                ).type
+            elif path.suffix == ".nc":
+                manifest.parameters.setdefault(
+                    _unescape_filename(path.stem), set()
+                ).add(realization)
+            elif path.suffix == ".parquet":
+                manifest.responses.setdefault(path.stem, set()).add(realization)
+        return manifest
+
+    def _write_manifest(self, manifest: _Manifest) -> None:
+        self._storage._write_transaction(
+            self._path / self._manifest_name,
+            manifest.model_dump_json().encode("utf-8"),
+        )
+        self._manifest_stat = self._get_manifest_stat()
+
+    def _update_manifest(self, update: Callable[[_Manifest], None]) -> None:
+        # Other instances of this ensemble may have updated the manifest, so
+        # it is read again if it has changed, under the lock of the storage
+        with self._storage._manifest_lock:
+            manifest = self._get_manifest()
+            update(manifest)
+            self._write_manifest(manifest)
+        self.get_ensemble_state.cache_clear()
+
+    @require_write
+    def rebuild_manifest(self) -> None:
+        """
+        Rebuilds the manifest from the files stored in the ensemble. Used to
+        recover when files have been written or removed behind the back of
+        the ensemble, see verify_manifest.
+        """
+        with self._storage._manifest_lock:
+            self._manifest = self._scan_manifest()
+            self._write_manifest(self._manifest)
+        self.get_ensemble_state.cache_clear()
+
+    def verify_manifest(self) -> list[str]:
+        """
+        Compares the manifest with the files stored in the ensemble.
+
+        Returns
+        -------
+        discrepancies : list of str
+            Description of each parameter group, response type or failure
+            where the manifest does not match the stored files. Empty if
+            the manifest is up to date.
+        """
+        manifest = self._get_manifest()
+        scanned = self._scan_manifest()
+        discrepancies = []
+        for kind, recorded, stored in [
+            ("Parameter group", manifest.parameters, scanned.parameters),
+            ("Response type", manifest.responses, scanned.responses),
+        ]:
+            for key in sorted(recorded.keys() | stored.keys()):
+                if missing := sorted(stored.get(key, set()) - recorded.get(key, set())):
+                    discrepancies.append(
+                        f"{kind} {key} is stored but not in the manifest "
+                        f"for realizations {missing}"
+                    )
+                if extra := sorted(recorded.get(key, set()) - stored.get(key, set())):
+                    discrepancies.append(
+                        f"{kind} {key} is in the manifest but not stored "
+                        f"for realizations {extra}"
+                    )
+        if manifest.failures != scanned.failures:
+            discrepancies.append(
+                f"Failures in the manifest {manifest.failures} do not match "
+                f"the stored failures {scanned.failures}"
+            )
+        return discrepancies
+
+    def _parameter_group_path(self, group: str) -> Path:
+        return self._path / "parameters" / f"{_escape_filename(group)}.nc"
+
+    def _realization_parameter_path(self, group: str, realization: int) -> Path:
+        return self._realization_dir(realization) / f"{_escape_filename(group)}.nc"
+
+    def _load_group_dataset(self, group: str) -> xr.Dataset | None:
+        """
+        Opens the consolidated store of a parameter group, which holds all
+        realizations written through save_parameters_many. Returns None if
+        nothing has been written to it.
+        """
+        try:
+            return xr.open_dataset(self._parameter_group_path(group), engine="scipy")
+        except FileNotFoundError:
+            return None
+
+    def _stored_parameter_realizations(self, group: str) -> set[int]:
+        path = self._parameter_group_path(group)
+        if not path.exists():
+            return set()
+        with xr.open_dataset(path, engine="scipy") as ds:
+            return set(ds["realizations"].values.tolist())
+
     def _load_single_dataset(
         self,
         group: str,
         realization: int,
     ) -> xr.Dataset:
-        try:
-            return xr.open_dataset(
-                self.mount_point
-                / f"realization-{realization}"
-                / f"{_escape_filename(group)}.nc",
-                engine="scipy",
-            )
-        except FileNotFoundError as e:
-            raise KeyError(
-                f"No dataset '{group}' in storage for realization {realization}"
-            ) from e
+        path = self._realization_parameter_path(group, realization)
+        if path.exists():
+            with xr.open_dataset(path, engine="scipy") as ds:
+                return ds.load()
+
+        stored = self._load_group_dataset(group)
+        if stored is not None:
+            with stored:
+                if realization in stored["realizations"]:
+                    return stored.sel(realizations=[realization]).load()
+        raise KeyError(f"No dataset '{group}' in storage for realization {realization}")
 
     def _load_dataset(
         self,
@@ -534,16 +726,50 @@ def _load_dataset(
                 realizations=0, drop=True
             )
 
+        # Single realization writes are stored next to the realization and
+        # take precedence over the consolidated group store
         if realizations is None:
-            datasets = [
-                xr.open_dataset(p, engine="scipy")
-                for p in sorted(
-                    self.mount_point.glob(f"realization-*/{_escape_filename(group)}.nc")
+            single_files = {
+                int(p.parent.name.removeprefix("realization-")): p
+                for p in self.mount_point.glob(
+                    f"realization-*/{_escape_filename(group)}.nc"
                 )
-            ]
+            }
+            selected = sorted(
+                self._stored_parameter_realizations(group) | single_files.keys()
+            )
         else:
-            datasets = [self._load_single_dataset(group, i) for i in realizations]
-        return xr.combine_nested(datasets, concat_dim="realizations")
+            selected = [int(i) for i in realizations]
+            single_files = {
+                i: path
+                for i in selected
+                if (path := self._realization_parameter_path(group, i)).exists()
+            }
+
+        datasets = []
+        if from_store := [i for i in selected if i not in single_files]:
+            stored = self._load_group_dataset(group)
+            if stored is None:
+                raise KeyError(
+                    f"No dataset '{group}' in storage for realization {from_store[0]}"
+                )
+            with stored:
+                stored_realizations = set(stored["realizations"].values.tolist())
+                if missing := [i for i in from_store if i not in stored_realizations]:
+                    raise KeyError(
+                        f"No dataset '{group}' in storage for realization {missing[0]}"
+                    )
+                datasets.append(stored.sel(realizations=from_store).load())
+        for i in selected:
+            if i in single_files:
+                with xr.open_dataset(single_files[i], engine="scipy") as ds:
+                    datasets.append(ds.load())
+
+        if not datasets:
+            return xr.Dataset()
+        if len(datasets) == 1:
+            return datasets[0]
+        return xr.concat(datasets, dim="realizations").sel(realizations=selected)
 
     def load_parameters(
         self, group: str, realizations: int | npt.NDArray[np.int_] | None = None
@@ -566,6 +792,69 @@ def load_parameters(
 
         return self._load_dataset(group, realizations)
 
+    def load_parameter_values(
+        self,
+        group: str,
+        realizations: Iterable[int] | npt.NDArray[np.int_],
+        indices: npt.NDArray[np.int_] | None = None,
+        dtype: npt.DTypeLike = np.float32,
+    ) -> npt.NDArray[Any]:
+        """
+        Load the 'values' variable of a parameter group into one
+        (n_values, n_realizations) array. The parameter files are memory
+        mapped, and only the selected values are copied into the result.
+
+        Parameters
+        ----------
+        group : str
+            Name of parameter group to load.
+        realizations : iterable of int
+            Realization indices to load, one column per realization.
+        indices : ndarray of int, optional
+            Indices into the flattened values to load, e.g. the active cells
+            of a field. If None, all values are loaded.
+        dtype : data-type
+            Data type of the returned array.
+
+        Returns
+        -------
+        values : ndarray
+            Fortran ordered array with the values of each realization as a
+            column.
+        """
+        columns = {int(i): column for column, i in enumerate(realizations)}
+        values: npt.NDArray[Any] | None = None
+        from_store: dict[int, int] = {}
+        for realization, column in columns.items():
+            path = self._realization_parameter_path(group, realization)
+            if path.exists():
+                values = _read_mapped_values(
+                    path,
+                    group,
+                    {realization: column},
+                    indices,
+                    values,
+                    len(columns),
+                    dtype,
+                )
+            else:
+                from_store[realization] = column
+
+        if from_store:
+            path = self._parameter_group_path(group)
+            if not path.exists():
+                raise KeyError(
+                    f"No dataset '{group}' in storage for realization "
+                    f"{next(iter(from_store))}"
+                )
+            values = _read_mapped_values(
+                path, group, from_store, indices, values, len(columns), dtype
+            )
+
+        if values is None:
+            return np.empty((0 if indices is None else len(indices), 0), dtype=dtype)
+        return values
+
     def load_cross_correlations(self) -> xr.Dataset:
         input_path = self.mount_point / "corr_XY.nc"
 
@@ -810,6 +1099,87 @@ def save_parameters(
             a 1d-vector. When saving multiple realizations, dataset must
             have a 'realizations' dimension.
         """
+        self._validate_parameters(group, dataset)
+
+        path = self._realization_parameter_path(group, realization)
+        path.parent.mkdir(exist_ok=True)
+        if "realizations" in dataset.dims:
+            data_to_save = dataset.sel(realizations=[realization])
+        else:
+            data_to_save = dataset.expand_dims(realizations=[realization])
+        self._storage._to_netcdf_transaction(path, data_to_save)
+        self._add_to_manifest("parameters", group, [realization])
+
+    @require_write
+    def save_parameters_many(
+        self,
+        group: str,
+        realizations: Iterable[int] | npt.NDArray[np.int_],
+        dataset: xr.Dataset,
+    ) -> None:
+        """
+        Saves the provided dataset for several realizations of a parameter group
+        in one write to the consolidated group store. Realizations already in
+        the store, but not in the dataset, are kept.
+
+        Parameters
+        ----------
+        group : str
+            Parameter group name for saving dataset.
+        realizations : iterable of int
+            Realization indices, in the order they appear along the
+            'realizations' dimension of the dataset.
+        dataset : Dataset
+            Dataset to save. It must contain a variable named 'values' and
+            have a 'realizations' dimension.
+        """
+        self._validate_parameters(group, dataset)
+        if "realizations" not in dataset.dims:
+            raise ValueError(
+                f"Dataset for parameter group '{group}' must have a 'realizations' dimension"
+            )
+
+        selected = [int(i) for i in realizations]
+        if "realizations" in dataset.coords:
+            data_to_save = dataset.sel(realizations=selected)
+        else:
+            data_to_save = dataset.assign_coords(realizations=selected)
+
+        stored = self._load_group_dataset(group)
+        if stored is not None:
+            with stored:
+                kept = stored.drop_sel(
+                    realizations=[
+                        i for i in selected if i in stored["realizations"].values
+                    ]
+                )
+                if kept.sizes["realizations"] > 0:
+                    data_to_save = xr.concat(
+                        [kept, data_to_save], dim="realizations"
+                    ).sortby("realizations")
+                data_to_save = data_to_save.load()
+
+        # Realizations are stored along the record dimension, so that each
+        # realization is laid out contiguously and can be read on its own
+        data_to_save.encoding["unlimited_dims"] = {"realizations"}
+        path = self._parameter_group_path(group)
+        path.parent.mkdir(exist_ok=True)
+        self._storage._to_netcdf_transaction(path, data_to_save)
+
+        for i in selected:
+            self._realization_parameter_path(group, i).unlink(missing_ok=True)
+        self._add_to_manifest("parameters", group, selected)
+
+    def _add_to_manifest(
+        self, kind: str, key: str, realizations: Iterable[int]
+    ) -> None:
+        def _add(manifest: _Manifest) -> None:
+            stored: dict[str, set[int]] = getattr(manifest, kind)
+            stored.setdefault(key, set()).update(realizations)
+
+        self._update_manifest(_add)
+
+    def _validate_parameters(self, group: str, dataset: xr.Dataset) -> None:
         if "values" not in dataset.variables:
             raise ValueError(
                 f"Dataset for parameter group '{group}' must contain a 'values' variable"
@@ -821,13 +1191,85 @@ def save_parameters(
         if group not in self.experiment.parameter_configuration:
             raise ValueError(f"{group} is not registered to the experiment.")
 
-        path = self._realization_dir(realization) / f"{_escape_filename(group)}.nc"
-        path.parent.mkdir(exist_ok=True)
-        if "realizations" in dataset.dims:
-            data_to_save = dataset.sel(realizations=[realization])
-        else:
-            data_to_save = dataset.expand_dims(realizations=[realization])
-        self._storage._to_netcdf_transaction(path, data_to_save)
+    @require_write
+    def consolidate_parameters(self, group: str | None = None) -> None:
+        """
+        Moves parameters saved for single realizations into the consolidated
+        store of their group, so that they can be loaded in one read.
+
+        Parameters
+        ----------
+        group : str, optional
+            Parameter group to consolidate. If None, all groups are consolidated.
+        """
+        groups = (
+            [group] if group is not None else self.experiment.parameter_configuration
+        )
+        for name in groups:
+            single_files = sorted(
+                self.mount_point.glob(f"realization-*/{_escape_filename(name)}.nc")
+            )
+            if not single_files:
+                continue
+            realizations = [
+                int(p.parent.name.removeprefix("realization-")) for p in single_files
+            ]
+            dataset = self._load_dataset(name, np.array(realizations)).load()
+            self.save_parameters_many(name, realizations, dataset)
+
+    @require_write
+    def copy_parameters(
+        self,
+        source: LocalEnsemble,
+        group: str,
+        realizations: Iterable[int] | npt.NDArray[np.int_],
+    ) -> None:
+        """
+        Copies the stored parameters of a group for the given realizations
+        from another ensemble. Parameter files are hard linked instead of
+        decoded and written again whenever their content can be shared as is.
+
+        Parameters
+        ----------
+        source : LocalEnsemble
+            Ensemble to copy the parameters from.
+        group : str
+            Parameter group to copy.
+        realizations : iterable of int
+            Realization indices to copy.
+        """
+        selected = [int(i) for i in realizations]
+        single_files = {
+            i: path
+            for i in selected
+            if (path := source._realization_parameter_path(group, i)).exists()
+        }
+        from_store = [i for i in selected if i not in single_files]
+
+        if from_store:
+            if (
+                set(from_store) == source._stored_parameter_realizations(group)
+                and not self._parameter_group_path(group).exists()
+            ):
+                self._parameter_group_path(group).parent.mkdir(exist_ok=True)
+                _link_or_copy(
+                    source._parameter_group_path(group),
+                    self._parameter_group_path(group),
+                )
+                for i in from_store:
+                    self._realization_parameter_path(group, i).unlink(missing_ok=True)
+            else:
+                self.save_parameters_many(
+                    group,
+                    from_store,
+                    source.load_parameters(group, np.array(from_store)).load(),
+                )
+
+        for i, path in single_files.items():
+            target = self._realization_parameter_path(group, i)
+            target.parent.mkdir(exist_ok=True)
+            _link_or_copy(path, target)
+        self._add_to_manifest("parameters", group, selected)
 
     @require_write
     def save_response(
@@ -872,9 +1314,20 @@ def save_response(
             output_path / f"{response_type}.parquet", data
         )
 
-        if not self.experiment._has_finalized_response_keys(response_type):
-            response_keys = data["response_key"].unique().to_list()
-            self.experiment._update_response_keys(response_type, response_keys)
+        def _add_response(manifest: _Manifest) -> None:
+            manifest.responses.setdefault(response_type, set()).add(realization)
+            manifest.misfits.discard(realization)
+            manifest.response_generations[realization] = (
+                manifest.response_generations.get(realization, 0) + 1
+            )
+
+        self._update_manifest(_add_response)
+
+        # Responses may be saved for several realizations at the same time
+        with self.experiment._response_keys_lock:
+            if not self.experiment._has_finalized_response_keys(response_type):
+                response_keys = data["response_key"].unique().to_list()
+                self.experiment._update_response_keys(response_type, response_keys)
 
     def calculate_std_dev_for_parameter(self, parameter_group: str) -> xr.Dataset:
         if parameter_group not in self.experiment.parameter_configuration:
@@ -886,10 +1339,10 @@ def calculate_std_dev_for_parameter(self, parameter_group: str) -> xr.Dataset:
     def get_parameter_state(
         self, realization: int
     ) -> dict[str, RealizationStorageState]:
-        path = self._realization_dir(realization)
+        stored = self._get_manifest().parameters
         return {
             e: RealizationStorageState.PARAMETERS_LOADED
-            if (path / (_escape_filename(e) + ".nc")).exists()
+            if realization in stored.get(e, set())
             else RealizationStorageState.UNDEFINED
             for e in self.experiment.parameter_configuration
         }
@@ -897,155 +1350,292 @@ def get_parameter_state(
     def get_response_state(
         self, realization: int
     ) -> dict[str, RealizationStorageState]:
-        response_configs = self.experiment.response_configuration
-        path = self._realization_dir(realization)
+        stored = self._get_manifest().responses
         return {
             e: RealizationStorageState.RESPONSES_LOADED
-            if (path / f"{e}.parquet").exists()
+            if realization in stored.get(e, set())
             else RealizationStorageState.UNDEFINED
-            for e in response_configs
+            for e in self.experiment.response_configuration
         }
 
+    def load_misfits(self, realization_chunk_size: int = 100) -> pl.DataFrame:
+        """
+        The misfit of each observation key for each realization with responses.
+
+        The misfit of an observation key is the sum of
+        ((observation - response) / std)**2 over its observations, where
+        observations without a matching response are left out. Misfits are
+        stored in the ensemble when it is writable, and are only calculated
+        again for realizations whose responses have been saved since.
+
+        Parameters
+        ----------
+        realization_chunk_size : int
+            Maximum number of realizations to calculate misfits for at a
+            time, bounding the memory used for the responses.
+
+        Returns
+        -------
+        misfits : DataFrame
+            Columns realization, observation_key and misfit, ordered by
+            realization and then by observation key, with the keys of each
+            response type sorted and the response types in the order of the
+            experiment.
+        """
+        observations_by_type = self.experiment.observations
+        observation_keys = [
+            key
+            for response_type in self.experiment.response_configuration
+            if response_type in observations_by_type
+            for key in sorted(
+                observations_by_type[response_type]["observation_key"].unique()
+            )
+        ]
+        realizations = self.get_realization_list_with_responses()
+        schema = {
+            "realization": pl.Int64,
+            "observation_key": pl.Enum(observation_keys),
+            "misfit": pl.Float32,
+        }
+        if not observation_keys or not realizations:
+            return pl.DataFrame(schema=schema)
+
+        path = self.mount_point / "misfits.parquet"
+        with self._storage._manifest_lock:
+            manifest = self._get_manifest()
+            generations = {
+                real: manifest.response_generations.get(real, 0)
+                for real in realizations
+            }
+            up_to_date = manifest.misfits.intersection(realizations)
+            misfits = [
+                pl.read_parquet(path)
+                .cast(schema)  # type: ignore
+                .filter(pl.col("realization").is_in(up_to_date))
+                if up_to_date and path.exists()
+                else pl.DataFrame(schema=schema)
+            ]
+        outdated = np.array(sorted(set(realizations) - up_to_date), dtype=np.int_)
+        for start in range(0, outdated.size, realization_chunk_size):
+            chunk = outdated[start : start + realization_chunk_size]
+            observations, responses = self.get_observations_and_response_matrix(
+                observation_keys, chunk, realization_chunk_size
+            )
+            residuals = (
+                observations["observations"].to_numpy()[:, np.newaxis] - responses
+            ) / observations["std"].to_numpy()[:, np.newaxis]
+            misfits.append(
+                pl.DataFrame(
+                    residuals**2,
+                    schema=[str(real) for real in chunk],
+                    orient="row",
+                )
+                .with_columns(observations["observation_key"])
+                .group_by("observation_key")
+                .agg(pl.all().fill_nan(None).cast(pl.Float64).sum())
+                .unpivot(
+                    index="observation_key",
+                    variable_name="realization",
+                    value_name="misfit",
+                )
+                .cast(schema)  # type: ignore
+                .select(*schema)
+            )
+
+        result = pl.concat(misfits).sort(["realization", "observation_key"])
+        if outdated.size and self.can_write:
+
+            def _add_misfits(manifest: _Manifest) -> None:
+                # Realizations whose responses were saved again while the
+                # misfits were calculated are left to be calculated again
+                current = {
+                    real
+                    for real, generation in generations.items()
+                    if manifest.response_generations.get(real, 0) == generation
+                }
+                self._storage._to_parquet_transaction(
+                    path, result.filter(pl.col("realization").is_in(current))
+                )
+                manifest.misfits = current
+
+            self._update_manifest(_add_misfits)
+        return result
+
     def get_observations_and_responses(
         self,
         selected_observations: Iterable[str],
         iens_active_index: npt.NDArray[np.int_],
     ) -> pl.DataFrame:
         """Fetches and aligns selected observations with their corresponding simulated responses from an ensemble."""
-        observations_by_type = self.experiment.observations
+        observations, responses = self.get_observations_and_response_matrix(
+            selected_observations, iens_active_index
+        )
+        return pl.concat(
+            [
+                observations,
+                pl.DataFrame(
+                    responses,
+                    schema=[str(real) for real in np.unique(iens_active_index)],
+                    orient="row",
+                ),
+            ],
+            how="horizontal",
+        )
 
-        with pl.StringCache():
-            dfs_per_response_type = []
-            for (
-                response_type,
-                response_cls,
-            ) in self.experiment.response_configuration.items():
-                if response_type not in observations_by_type:
-                    continue
-
-                observations_for_type = (
-                    observations_by_type[response_type]
-                    .filter(
-                        pl.col("observation_key").is_in(list(selected_observations))
-                    )
-                    .with_columns(
-                        [
-                            pl.col("response_key")
-                            .cast(pl.Categorical)
-                            .alias("response_key")
-                        ]
-                    )
-                )
+    def get_observations_and_response_matrix(
+        self,
+        selected_observations: Iterable[str],
+        iens_active_index: npt.NDArray[np.int_],
+        realization_chunk_size: int = 100,
+    ) -> tuple[pl.DataFrame, npt.NDArray[np.float32]]:
+        """
+        Align selected observations with the simulated responses of an ensemble.
 
-                observed_cols = {
-                    k: observations_for_type[k].unique()
-                    for k in ["response_key", *response_cls.primary_key]
-                }
+        The responses of each response type are read for many realizations at
+        a time in a single query, filtered to the observed keys and aligned to
+        the observations once per chunk of realizations.
 
-                reals = iens_active_index.tolist()
-                reals.sort()
-                # too much memory to do it all at once, go per realization
-                first_columns: pl.DataFrame | None = None
-                realization_columns: list[pl.DataFrame] = []
-                for real in reals:
-                    responses = self._load_responses_lazy(
-                        response_type, (real,)
-                    ).with_columns(
-                        [
-                            pl.col("response_key")
-                            .cast(pl.Categorical)
-                            .alias("response_key")
-                        ]
-                    )
+        Parameters
+        ----------
+        selected_observations : iterable of str
+            Keys of the observations to include.
+        iens_active_index : array of int
+            Realizations to fetch responses for.
+        realization_chunk_size : int
+            Maximum number of realizations read at a time, bounding the memory
+            used for the responses.
 
-                    # Filter out responses without observations
-                    for col, observed_values in observed_cols.items():
-                        if col != "time":
-                            responses = responses.filter(
-                                pl.col(col).is_in(observed_values)
-                            )
-
-                    pivoted = responses.collect().pivot(
-                        on="realization",
-                        index=["response_key", *response_cls.primary_key],
-                        values="values",
-                        aggregate_function="mean",
-                    )
+        Returns
+        -------
+        observations : DataFrame
+            Observations with the columns response_key, index, observation_key,
+            observations and std.
+        responses : ndarray
+            C-contiguous float32 array with one row per observation and one
+            column per realization in ascending order. Observations without a
+            matching response are NaN.
+        """
+        observations_by_type = self.experiment.observations
+        selected = list(selected_observations)
+        reals = np.unique(iens_active_index)
+
+        to_align: list[tuple[str, list[str], pl.DataFrame]] = []
+        for (
+            response_type,
+            response_cls,
+        ) in self.experiment.response_configuration.items():
+            if response_type not in observations_by_type or reals.size == 0:
+                continue
+            to_align.append(
+                (
+                    response_type,
+                    response_cls.primary_key,
+                    observations_by_type[response_type].filter(
+                        pl.col("observation_key").is_in(selected)
+                    ),
+                )
+            )
 
-                    if pivoted.is_empty():
-                        # There are no responses for this realization,
-                        # so we explicitly create a column of nans
-                        # to represent this. We are basically saying that
-                        # for this realization, each observation points
-                        # to a NaN response.
-                        joined = observations_for_type.with_columns(
-                            pl.Series(
-                                str(real),
-                                [np.nan] * len(observations_for_type),
-                                dtype=pl.Float32,
-                            )
-                        )
-                    elif "time" in pivoted:
-                        joined = observations_for_type.join_asof(
-                            pivoted,
-                            by=[
-                                "response_key",
-                                *[k for k in response_cls.primary_key if k != "time"],
-                            ],
-                            on="time",
-                            strategy="nearest",
-                            tolerance="1s",
-                        )
-                    else:
-                        joined = observations_for_type.join(
-                            pivoted,
-                            how="left",
-                            on=["response_key", *response_cls.primary_key],
-                        )
-
-                    joined = (
-                        joined.with_columns(
-                            pl.concat_str(
-                                response_cls.primary_key, separator=", "
-                            ).alias(
-                                "__tmp_index_key__"
-                                # Avoid potential collisions w/ primary key
-                            )
-                        )
-                        .drop(response_cls.primary_key)
-                        .rename({"__tmp_index_key__": "index"})
-                    )
+        S = np.full(
+            (sum(obs.height for _, _, obs in to_align), reals.size),
+            np.nan,
+            dtype=np.float32,
+        )
+        observation_frames = []
+        row = 0
+        for response_type, primary_key, observations in to_align:
+            block = S[row : row + observations.height]
+            for start in range(0, reals.size, realization_chunk_size):
+                chunk = reals[start : start + realization_chunk_size]
+                self._align_responses_to_observations(
+                    response_type,
+                    primary_key,
+                    observations,
+                    chunk,
+                    block[:, start : start + chunk.size],
+                )
+            row += observations.height
+            observation_frames.append(
+                observations.select(
+                    pl.col("response_key").cast(pl.String),
+                    pl.concat_str(primary_key, separator=", ").alias("index"),
+                    "observation_key",
+                    "observations",
+                    "std",
+                )
+            )
+
+        if not observation_frames:
+            return pl.DataFrame(
+                schema={
+                    "response_key": pl.String,
+                    "index": pl.String,
+                    "observation_key": pl.String,
+                    "observations": pl.Float32,
+                    "std": pl.Float32,
+                }
+            ), S
+        return pl.concat(observation_frames, how="vertical"), S
 
-                    if first_columns is None:
-                        # The "leftmost" index columns are not yet collected.
-                        # They are the same for all iterations, and indexed the same
-                        # because we do a left join for the observations.
-                        # Hence, we select these columns only once.
-                        first_columns = joined.select(
-                            [
-                                "response_key",
-                                "index",
-                                "observation_key",
-                                "observations",
-                                "std",
-                            ]
-                        )
-
-                    realization_columns.append(joined.select(str(real)))
-
-                if first_columns is None:
-                    # Not a single realization had any responses to the
-                    # observations. Hence, there is no need to include
-                    # it in the dataset
-                    continue
-
-                dfs_per_response_type.append(
-                    pl.concat([first_columns, *realization_columns], how="horizontal")
+    def _align_responses_to_observations(
+        self,
+        response_type: str,
+        primary_key: list[str],
+        observations: pl.DataFrame,
+        realizations: npt.NDArray[np.int_],
+        out: npt.NDArray[np.float32],
+    ) -> None:
+        paths = []
+        for realization in realizations:
+            path = self._realization_dir(realization) / f"{response_type}.parquet"
+            if not path.exists():
+                raise KeyError(
+                    f"No response for key {response_type}, realization: {realization}"
                 )
+            paths.append(path)
 
-            return pl.concat(dfs_per_response_type, how="vertical").with_columns(
-                pl.col("response_key").cast(pl.String).alias("response_key")
+        keys = ["response_key", *primary_key]
+        responses = pl.scan_parquet(paths).select(
+            pl.col("realization").cast(pl.Int64), *keys, "values"
+        )
+        # Filter out responses without observations
+        for key in keys:
+            if key != "time":
+                responses = responses.filter(
+                    pl.col(key).is_in(observations[key].unique())
+                )
+        responses = (
+            responses.group_by(["realization", *keys])
+            .agg(pl.col("values").mean())
+            .collect()
+        )
+        if responses.is_empty():
+            return
+
+        targets = observations.select(keys).with_row_index("__row")
+        if "time" in primary_key:
+            joined = (
+                targets.join(
+                    pl.DataFrame({"realization": realizations.astype(np.int64)}),
+                    how="cross",
+                )
+                .sort("time")
+                .join_asof(
+                    responses.sort("time"),
+                    by=["realization", *[k for k in keys if k != "time"]],
+                    on="time",
+                    strategy="nearest",
+                    tolerance="1s",
+                )
             )
+        else:
+            joined = targets.join(responses, on=keys, how="inner")
+
+        joined = joined.filter(pl.col("values").is_not_null())
+        out[
+            joined["__row"].to_numpy(),
+            np.searchsorted(realizations, joined["realization"].to_numpy()),
+        ] = joined["values"].to_numpy()
 
     @property
     def everest_realization_info(self) -> dict[int, EverestRealizationInfo] | None:
@@ -1085,6 +1675,7 @@ def save_everest_realization_info(
         self._storage._write_transaction(
             self._path / "index.json", self._index.model_dump_json().encode("utf-8")
         )
+        self._storage._update_catalog(self._index)
 
     @property
     def all_parameters_and_gen_data(self) -> pl.DataFrame | None:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from collections.abc import Generator
 from datetime import datetime
 from functools import cached_property
@@ -54,6 +55,7 @@ def __init__(
         storage: LocalStorage,
         path: Path,
         mode: Mode,
+        index: _Index | None = None,
     ) -> None:
         """
         Initialize a LocalExperiment instance.
@@ -66,14 +68,22 @@ def __init__(
             The file system path to the experiment data.
         mode : Mode
             The access mode for the experiment (read/write).
+        index : _Index, optional
+            The contents of the index file of the experiment. Read from
+            path if not given.
         """
 
         super().__init__(mode)
         self._storage = storage
         self._path = path
-        self._index = _Index.model_validate_json(
-            (path / "index.json").read_text(encoding="utf-8")
+        self._index = (
+            index
+            if index is not None
+            else _Index.model_validate_json(
+                (path / "index.json").read_text(encoding="utf-8")
+            )
         )
+        self._response_keys_lock = threading.Lock()
 
     @classmethod
     def create(
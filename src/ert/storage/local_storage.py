@@ -5,6 +5,7 @@
 import logging
 import os
 import shutil
+import threading
 from collections.abc import Generator, MutableSequence
 from datetime import datetime
 from functools import cached_property
@@ -18,18 +19,20 @@
 import polars as pl
 import xarray as xr
 from filelock import FileLock, Timeout
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 from ert.config import ErtConfig, ParameterConfig, ResponseConfig
 from ert.shared import __version__
 from ert.storage.local_ensemble import LocalEnsemble
+from ert.storage.local_ensemble import _Index as _EnsembleIndex
 from ert.storage.local_experiment import LocalExperiment
+from ert.storage.local_experiment import _Index as _ExperimentIndex
 from ert.storage.mode import BaseMode, Mode, require_write
 from ert.storage.realization_storage_state import RealizationStorageState
 
 logger = logging.getLogger(__name__)
 
-_LOCAL_STORAGE_VERSION = 9
+_LOCAL_STORAGE_VERSION = 11
 
 
 class _Migrations(BaseModel):
@@ -44,6 +47,19 @@ class _Index(BaseModel):
     migrations: MutableSequence[_Migrations] = Field(default_factory=list)
 
 
+class _Catalog(BaseModel):
+    """
+    The index files of all experiments and ensembles in the storage, so that
+    opening the storage does not read one file per ensemble. Index files are
+    only written through the storage holding the write lock, which saves the
+    catalog whenever it writes one.
+    """
+
+    version: int = _LOCAL_STORAGE_VERSION
+    experiments: dict[UUID, _ExperimentIndex] = Field(default_factory=dict)
+    ensembles: dict[UUID, _EnsembleIndex] = Field(default_factory=dict)
+
+
 class LocalStorage(BaseMode):
     """
     A class representing the local storage for ERT experiments and ensembles.
@@ -58,6 +74,7 @@ class LocalStorage(BaseMode):
     EXPERIMENTS_PATH = "experiments"
     ENSEMBLES_PATH = "ensembles"
     SWAP_PATH = "swp"
+    CATALOG_FILE = "catalog.json"
 
     def __init__(
         self,
@@ -82,8 +99,15 @@ def __init__(
         super().__init__(mode)
         self.path = Path(path).absolute()
 
-        self._experiments: dict[UUID, LocalExperiment]
-        self._ensembles: dict[UUID, LocalEnsemble]
+        # Experiments and ensembles are created from the catalog the first
+        # time they are accessed
+        self._experiments: dict[UUID, LocalExperiment] = {}
+        self._ensembles: dict[UUID, LocalEnsemble] = {}
+        self._catalog: _Catalog | None = None
+        self._catalog_stat: tuple[int, int] | None = None
+        # An ensemble can have several instances, e.g. from before and after
+        # a refresh, so their manifest updates are serialized here
+        self._manifest_lock = threading.Lock()
         self._index: _Index
 
         try:
@@ -124,15 +148,22 @@ def refresh(self) -> None:
 
         This method is used to refresh the state of the storage to reflect any
         changes made to the underlying file system since the storage was last
-        accessed.
+        accessed. Only the index files of experiments and ensembles that
+        are new since the last refresh are read.
         """
 
         self._index = self._load_index()
-        self._ensembles = self._load_ensembles()
-        self._experiments = self._load_experiments()
+        if self._catalog is None or self._catalog_stat != self._get_catalog_stat():
+            self._catalog = self._load_catalog()
+        catalog_changed = self._refresh_catalog(self._catalog)
 
-        for ens in self._ensembles.values():
-            ens.refresh_ensemble_state()
+        # Experiments and ensembles are cheap to recreate from the catalog,
+        # and recreating them drops anything they have cached from disk
+        self._ensembles.clear()
+        self._experiments.clear()
+
+        if catalog_changed and self.can_write:
+            self._save_catalog()
 
     def get_experiment(self, uuid: UUID) -> LocalExperiment:
         """
@@ -149,6 +180,13 @@ def get_experiment(self, uuid: UUID) -> LocalExperiment:
             The experiment associated with the given UUID.
         """
 
+        if uuid not in self._experiments:
+            self._experiments[uuid] = LocalExperiment(
+                self,
+                self._experiment_path(uuid),
+                self.mode,
+                index=self._get_catalog().experiments[uuid],
+            )
         return self._experiments[uuid]
 
     def get_experiment_by_name(self, name: str) -> LocalExperiment:
@@ -167,9 +205,9 @@ def get_experiment_by_name(self, name: str) -> LocalExperiment:
         KeyError
             If no experiment with the given name is found.
         """
-        for exp in self._experiments.values():
-            if exp.name == name:
-                return exp
+        for exp_id, index in self._get_catalog().experiments.items():
+            if index.name == name:
+                return self.get_experiment(exp_id)
         raise KeyError(f"Experiment with name '{name}' not found")
 
     def get_ensemble(self, uuid: UUID | str) -> LocalEnsemble:
@@ -187,15 +225,32 @@ def get_ensemble(self, uuid: UUID | str) -> LocalEnsemble:
         """
         if isinstance(uuid, str):
             uuid = UUID(uuid)
+        if uuid not in self._ensembles:
+            self._ensembles[uuid] = LocalEnsemble(
+                self,
+                self._ensemble_path(uuid),
+                self.mode,
+                index=self._get_catalog().ensembles[uuid],
+            )
         return self._ensembles[uuid]
 
     @property
     def experiments(self) -> Generator[LocalExperiment]:
-        yield from self._experiments.values()
+        yield from (
+            self.get_experiment(exp_id)
+            for exp_id in list(self._get_catalog().experiments)
+        )
 
     @property
     def ensembles(self) -> Generator[LocalEnsemble]:
-        yield from self._ensembles.values()
+        yield from (
+            self.get_ensemble(ens_id) for ens_id in list(self._get_catalog().ensembles)
+        )
+
+    def _get_catalog(self) -> _Catalog:
+        if self._catalog is None:
+            raise RuntimeError(f"Storage at {self.path} is closed")
+        return self._catalog
 
     def _load_index(self) -> _Index:
         try:
@@ -205,32 +260,100 @@ def _load_index(self) -> _Index:
         except FileNotFoundError:
             return _Index()
 
-    def _load_ensembles(self) -> dict[UUID, LocalEnsemble]:
-        if not (self.path / "ensembles").exists():
-            return {}
-        ensembles: list[LocalEnsemble] = []
-        for ensemble_path in (self.path / "ensembles").iterdir():
+    def _get_catalog_stat(self) -> tuple[int, int] | None:
+        # The catalog is replaced on write, so the inode changes even when
+        # two writes fall within the resolution of the modification time
+        try:
+            stat = (self.path / self.CATALOG_FILE).stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def _load_catalog(self) -> _Catalog:
+        self._catalog_stat = self._get_catalog_stat()
+        try:
+            catalog = _Catalog.model_validate_json(
+                (self.path / self.CATALOG_FILE).read_text(encoding="utf-8")
+            )
+        except FileNotFoundError:
+            return _Catalog()
+        except ValidationError:
+            logger.warning(f"Ignoring invalid storage catalog in {self.path}")
+            return _Catalog()
+        # Migrations may rewrite the index files
+        if catalog.version != self._index.version:
+            return _Catalog()
+        return catalog
+
+    def _refresh_catalog(self, catalog: _Catalog) -> bool:
+        """
+        Add the ensembles that have been created and remove the ones that
+        have been deleted since the catalog was last refreshed, and returns
+        whether the catalog changed.
+        """
+        changed = False
+        ensemble_paths: dict[UUID, Path] = {}
+        if (self.path / self.ENSEMBLES_PATH).exists():
+            for ensemble_path in (self.path / self.ENSEMBLES_PATH).iterdir():
+                try:
+                    ensemble_paths[UUID(ensemble_path.name)] = ensemble_path
+                except ValueError:
+                    logger.warning(f"Ignoring unknown ensemble path: {ensemble_path}")
+
+        ensembles = {
+            ens_id: index
+            for ens_id, index in catalog.ensembles.items()
+            if ens_id in ensemble_paths
+        }
+        changed |= len(ensembles) != len(catalog.ensembles)
+        for ens_id, ensemble_path in ensemble_paths.items():
+            if ens_id in ensembles:
+                continue
             try:
-                ensemble = LocalEnsemble(self, ensemble_path, self.mode)
-                ensembles.append(ensemble)
+                ensembles[ens_id] = _EnsembleIndex.model_validate_json(
+                    (ensemble_path / "index.json").read_text(encoding="utf-8")
+                )
+                changed = True
             except FileNotFoundError:
                 logger.exception(
                     "Failed to load an ensemble from path: %s", ensemble_path
                 )
-                continue
         # Make sure that the ensembles are sorted by name in reverse. Given
         # multiple ensembles with a common name, iterating over the ensemble
         # dictionary will yield the newest ensemble first.
-        return {
-            x.id: x for x in sorted(ensembles, key=lambda x: x.started_at, reverse=True)
-        }
+        catalog.ensembles = dict(
+            sorted(ensembles.items(), key=lambda x: x[1].started_at, reverse=True)
+        )
 
-    def _load_experiments(self) -> dict[UUID, LocalExperiment]:
-        experiment_ids = {ens.experiment_id for ens in self._ensembles.values()}
-        return {
-            exp_id: LocalExperiment(self, self._experiment_path(exp_id), self.mode)
-            for exp_id in experiment_ids
+        experiment_ids = {index.experiment_id for index in ensembles.values()}
+        experiments = {
+            exp_id: index
+            for exp_id, index in catalog.experiments.items()
+            if exp_id in experiment_ids
         }
+        changed |= len(experiments) != len(catalog.experiments)
+        for exp_id in experiment_ids - experiments.keys():
+            experiments[exp_id] = _ExperimentIndex.model_validate_json(
+                (self._experiment_path(exp_id) / "index.json").read_text(
+                    encoding="utf-8"
+                )
+            )
+            changed = True
+        catalog.experiments = experiments
+        return changed
+
+    @require_write
+    def _save_catalog(self) -> None:
+        self._write_transaction(
+            self.path / self.CATALOG_FILE,
+            self._get_catalog().model_dump_json().encode("utf-8"),
+        )
+        self._catalog_stat = self._get_catalog_stat()
+
+    @require_write
+    def _update_catalog(self, index: _EnsembleIndex) -> None:
+        self._get_catalog().ensembles[index.id] = index
+        self._save_catalog()
 
     def _ensemble_path(self, ensemble_id: UUID) -> Path:
         return self.path / self.ENSEMBLES_PATH / str(ensemble_id)
@@ -282,15 +405,16 @@ def close(self) -> None:
         the storage.
         """
 
+        if self.can_write:
+            self._save_index()
+            if self._catalog is not None:
+                self._save_catalog()
+            self._release_lock()
+
+        self._catalog = None
         self._ensembles.clear()
         self._experiments.clear()
 
-        if not self.can_write:
-            return
-
-        self._save_index()
-        self._release_lock()
-
     def _release_lock(self) -> None:
         if self._lock.is_locked:
             self._lock.release()
@@ -342,6 +466,8 @@ def create_experiment(
             name=name,
         )
 
+        self._get_catalog().experiments[exp.id] = exp._index
+        self._save_catalog()
         self._experiments[exp.id] = exp
         return exp
 
@@ -422,6 +548,7 @@ def create_ensemble(
                         f"Failure from prior: {state}",
                     )
 
+        self._update_catalog(ens._index)
         self._ensembles[ens.id] = ens
         return ens
 
@@ -456,6 +583,8 @@ def _migrate(self, version: int) -> None:
             to7,
             to8,
             to9,
+            to10,
+            to11,
         )
 
         try:
@@ -500,7 +629,10 @@ def _migrate(self, version: int) -> None:
 
             elif version < _LOCAL_STORAGE_VERSION:
                 migrations = list(
-                    enumerate([to2, to3, to4, to5, to6, to7, to8, to9], start=1)
+                    enumerate(
+                        [to2, to3, to4, to5, to6, to7, to8, to9, to10, to11],
+                        start=1,
+                    )
                 )
                 for from_version, migration in migrations[version - 1 :]:
                     print(f"* Updating storage to version: {from_version + 1}")
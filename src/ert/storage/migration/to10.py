@@ -0,0 +1,52 @@
+import json
+import os
+from pathlib import Path
+
+import xarray as xr
+
+info = "Consolidate parameters into one file per parameter group"
+
+
+def _consolidate_group(ensemble: Path, filename: str) -> None:
+    files = sorted(
+        ensemble.glob(f"realization-*/{filename}"),
+        key=lambda p: int(p.parent.name.removeprefix("realization-")),
+    )
+    datasets = []
+    for p in files:
+        with xr.open_dataset(p, engine="scipy") as ds:
+            datasets.append(ds.load())
+    try:
+        dataset = xr.concat(datasets, dim="realizations")
+    except ValueError:
+        # Parameters with inconsistent layout across realizations can still be
+        # read from the realization directories, so they are left untouched.
+        return
+
+    dataset.encoding["unlimited_dims"] = {"realizations"}
+    (ensemble / "parameters").mkdir(exist_ok=True)
+    dataset.to_netcdf(ensemble / "parameters" / filename, engine="scipy")
+
+    for p in files:
+        os.remove(p)
+
+
+def migrate(path: Path) -> None:
+    for experiment in path.glob("experiments/*"):
+        with open(experiment / "parameter.json", encoding="utf-8") as f:
+            parameters = json.load(f)
+
+        with open(experiment / "index.json", encoding="utf-8") as f:
+            experiment_id = json.load(f)["id"]
+
+        for ens in path.glob("ensembles/*"):
+            with open(ens / "index.json", encoding="utf-8") as f:
+                if json.load(f)["experiment_id"] != experiment_id:
+                    continue
+
+            for group in parameters:
+                filename = group.replace("%", "%25").replace("/", "%2F") + ".nc"
+                if (ens / "parameters" / filename).exists():
+                    continue
+                if any(ens.glob(f"realization-*/{filename}")):
+                    _consolidate_group(ens, filename)
@@ -0,0 +1,40 @@
+import json
+from pathlib import Path
+
+import xarray as xr
+
+info = "Add manifest of stored parameters, responses and failures to ensembles"
+
+
+def _build_manifest(ensemble: Path) -> dict[str, dict[str, list[int]]]:
+    parameters: dict[str, set[int]] = {}
+    responses: dict[str, set[int]] = {}
+    failures: dict[str, int] = {}
+
+    for path in (ensemble / "parameters").glob("*.nc"):
+        group = path.stem.replace("%2F", "/").replace("%25", "%")
+        with xr.open_dataset(path, engine="scipy") as ds:
+            parameters[group] = set(ds["realizations"].values.tolist())
+
+    for path in ensemble.glob("realization-*/*"):
+        realization = int(path.parent.name.removeprefix("realization-"))
+        if path.name == "error.json":
+            with open(path, encoding="utf-8") as f:
+                failures[str(realization)] = json.load(f)["type"]
+        elif path.suffix == ".nc":
+            group = path.stem.replace("%2F", "/").replace("%25", "%")
+            parameters.setdefault(group, set()).add(realization)
+        elif path.suffix == ".parquet":
+            responses.setdefault(path.stem, set()).add(realization)
+
+    return {
+        "parameters": {k: sorted(v) for k, v in parameters.items()},
+        "responses": {k: sorted(v) for k, v in responses.items()},
+        "failures": failures,
+    }
+
+
+def migrate(path: Path) -> None:
+    for ens in path.glob("ensembles/*"):
+        with open(ens / "manifest.json", "w", encoding="utf-8") as f:
+            json.dump(_build_manifest(ens), f)
@@ -7,15 +7,6 @@
     from ert.shared.version import __version__ as everest_version
 except ImportError:
     everest_version = "0.0.0"
-from everest.bin.config_branch_script import config_branch_entry
-from everest.bin.everconfigdump_script import config_dump_entry
-from everest.bin.everest_script import everest_entry
-from everest.bin.everexport_script import everexport_entry
-from everest.bin.everlint_script import lint_entry
-from everest.bin.kill_script import kill_entry
-from everest.bin.monitor_script import monitor_entry
-from everest.bin.visualization_script import visualization_entry
-from everest.plugins.everest_plugin_manager import EverestPluginManager
 
 
 def _build_args_parser() -> argparse.ArgumentParser:
@@ -48,6 +39,10 @@ def __init__(self, args: list[str]) -> None:
             parser.error("Unrecognized command")
 
         # Setup logging from plugins:
+        from everest.plugins.everest_plugin_manager import (  # noqa: PLC0415
+            EverestPluginManager,
+        )
+
         EverestPluginManager().add_log_handle_to_root()
         logger = logging.getLogger(__name__)
         logger.info(f"Started everest with {parsed_args}")
@@ -66,16 +61,24 @@ def methods_help(cls) -> str:
         ]
         return "\n".join(doclist)
 
+    # The sub commands import their entry points when they are run, so that
+    # only the one that is used is imported
     def run(self, args: list[str]) -> None:
         """Start an optimization case base on given config file"""
+        from everest.bin.everest_script import everest_entry  # noqa: PLC0415
+
         everest_entry(args)
 
     def monitor(self, args: list[str]) -> None:
         """Monitor a running optimization case base on given config file"""
+        from everest.bin.monitor_script import monitor_entry  # noqa: PLC0415
+
         monitor_entry(args)
 
     def kill(self, args: list[str]) -> None:
         """Kill a running optimization case base on given config file"""
+        from everest.bin.kill_script import kill_entry  # noqa: PLC0415
+
         kill_entry(args)
 
     def gui(self, _: list[str]) -> None:
@@ -84,22 +87,36 @@ def gui(self, _: list[str]) -> None:
 
     def export(self, args: list[str]) -> None:
         """Export data from a completed optimization case"""
+        from everest.bin.everexport_script import everexport_entry  # noqa: PLC0415
+
         everexport_entry(args)
 
     def lint(self, args: list[str]) -> None:
         """Validate a config file"""
+        from everest.bin.everlint_script import lint_entry  # noqa: PLC0415
+
         lint_entry(args)
 
     def render(self, args: list[str]) -> None:
         """Display the configuration data loaded from a config file"""
+        from everest.bin.everconfigdump_script import config_dump_entry  # noqa: PLC0415
+
         config_dump_entry(args)
 
     def branch(self, args: list[str]) -> None:
         """Construct possible restart config file"""
+        from everest.bin.config_branch_script import (  # noqa: PLC0415
+            config_branch_entry,
+        )
+
         config_branch_entry(args)
 
     def results(self, args: list[str]) -> None:
         """Start everest visualization plugin"""
+        from everest.bin.visualization_script import (  # noqa: PLC0415
+            visualization_entry,
+        )
+
         visualization_entry(args)
 
 
@@ -257,6 +257,18 @@ def hide_window(request):
         os.environ["QT_QPA_PLATFORM"] = old_value
 
 
+@pytest.fixture(scope="session", autouse=True)
+def no_config_cache():
+    """Tests parse their configs anew unless they opt in to the config cache"""
+    old_value = os.environ.get("ERT_CONFIG_CACHE_DIR")
+    os.environ["ERT_CONFIG_CACHE_DIR"] = ""
+    yield
+    if old_value is None:
+        del os.environ["ERT_CONFIG_CACHE_DIR"]
+    else:
+        os.environ["ERT_CONFIG_CACHE_DIR"] = old_value
+
+
 @pytest.fixture
 def _qt_excepthook(monkeypatch):
     """Hook into Python's unhandled exception handler and quit Qt if it's
@@ -0,0 +1,43 @@
+import numpy as np
+import polars as pl
+
+from ert.run_models.evaluation_cache import EvaluationCacheIndex
+
+EPS = float(np.finfo(np.float32).eps)
+
+
+def test_and_benchmark_lookup_of_batch_in_evaluation_cache(benchmark):
+    rng = np.random.default_rng(42)
+    num_cached, num_controls, batch_size = 5000, 200, 500
+    control_names = [f"point.x{i}" for i in range(num_controls)]
+    cached_values = rng.uniform(0, 1, size=(num_cached, num_controls))
+    cached_realizations = rng.integers(0, 10, size=num_cached)
+    cached = pl.DataFrame(
+        {
+            "model_realization": pl.Series(cached_realizations, dtype=pl.UInt16),
+            **dict(zip(control_names, cached_values.T, strict=True)),
+        }
+    )
+
+    # Half of the batch was evaluated before, with values rounded as when
+    # stored in single precision
+    hits = rng.choice(num_cached, size=batch_size // 2, replace=False)
+    values = np.concatenate(
+        [
+            cached_values[hits].astype(np.float32).astype(np.float64),
+            rng.uniform(0, 1, size=(batch_size - hits.size, num_controls)),
+        ]
+    )
+    realizations = np.concatenate(
+        [cached_realizations[hits], rng.integers(0, 10, size=batch_size - hits.size)]
+    )
+
+    def lookup():
+        return EvaluationCacheIndex(cached, control_names, EPS).lookup(
+            values, realizations
+        )
+
+    rows = benchmark(lookup)
+
+    np.testing.assert_array_equal(rows[: hits.size], hits)
+    assert np.all(rows[hits.size :] == -1)
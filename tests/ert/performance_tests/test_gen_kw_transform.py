@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from ert.config import GenKwConfig
+from ert.config.gen_kw_config import TransformFunctionDefinition
+
+DISTRIBUTIONS = [
+    ("NORMAL", [1, 2]),
+    ("LOGNORMAL", [0, 0.5]),
+    ("TRUNCATED_NORMAL", [0, 1, -0.5, 0.5]),
+    ("TRIANGULAR", [0, 1, 4]),
+    ("UNIFORM", [0, 1]),
+    ("DUNIF", [5, 1, 5]),
+    ("ERRF", [1, 2, 0.1, 0.5]),
+    ("DERRF", [10, 1, 2, 0.1, 0.5]),
+    ("LOGUNIF", [0.00001, 1]),
+    ("CONST", [5]),
+]
+
+
+@pytest.fixture
+def gen_kw_config():
+    return GenKwConfig(
+        name="KW",
+        forward_init=False,
+        template_file=None,
+        output_file=None,
+        transform_function_definitions=[
+            TransformFunctionDefinition(f"KEY_{i}", *DISTRIBUTIONS[i % 10])
+            for i in range(1000)
+        ],
+        update=True,
+    )
+
+
+def test_and_benchmark_transform_of_parameter_block(gen_kw_config, benchmark):
+    values = np.random.default_rng(42).standard_normal((1000, 1000))
+
+    transformed = benchmark(gen_kw_config.transform, values)
+
+    assert transformed.shape == (1000, 1000)
+    for realization in [0, 999]:
+        np.testing.assert_array_equal(
+            transformed[:, realization], gen_kw_config.transform(values[:, realization])
+        )
@@ -0,0 +1,54 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = [
+    "ert.cli.main",
+    "ert.config",
+    "ert.run_models",
+    "ert.storage",
+    "netCDF4",
+    "pandas",
+    "polars",
+    "xarray",
+]
+
+
+def import_times(module: str) -> dict[str, int]:
+    """Cumulative import time in microseconds of every module imported
+    by a fresh interpreter importing module"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize("module", ["ert", "ert.__main__"])
+def test_that_entry_points_do_not_import_heavy_modules(module):
+    imported = import_times(module)
+    assert not [heavy for heavy in HEAVY_MODULES if heavy in imported]
+
+
+def test_that_plugins_do_not_import_config():
+    assert "ert.config" not in import_times("ert.plugins")
+
+
+@pytest.mark.parametrize(
+    "module, budget_seconds",
+    [("ert", 0.1), ("ert.__main__", 2.0)],
+)
+def test_that_import_time_of_entry_point_is_within_budget(module, budget_seconds):
+    # The fastest of several imports is the least affected by other load on
+    # the machine, and the budgets leave a wide margin above typical times
+    fastest = min(import_times(module)[module] for _ in range(5))
+    assert fastest / 1e6 < budget_seconds
@@ -695,7 +695,9 @@ def test_temporary_parameter_storage_with_inactive_fields(
                 "values": (
                     ["x", "y", "z"],
                     np.ma.MaskedArray(
-                        data=rng.random(size=(shape.nx, shape.ny, shape.nz)),
+                        data=rng.random(
+                            size=(shape.nx, shape.ny, shape.nz), dtype=np.float32
+                        ),
                         fill_value=np.nan,
                         mask=[~mask_list],
                     ).filled(),
@@ -730,10 +732,8 @@ def test_temporary_parameter_storage_with_inactive_fields(
         ensemble, param_ensemble_array, param_group, realization_list
     )
     for iens in range(prior_ensemble.ensemble_size):
-        ds = xr.open_dataset(
-            ensemble._path / f"realization-{iens}" / f"{param_group}.nc", engine="scipy"
-        )
-        np.testing.assert_array_equal(ds["values"].values[0], fields[iens]["values"])
+        ds = ensemble.load_parameters(param_group, iens)
+        np.testing.assert_array_equal(ds["values"].values, fields[iens]["values"])
 
 
 def _mock_load_observations_and_responses(
@@ -747,12 +747,17 @@ def _mock_load_observations_and_responses(
 ):
     """
     Runs through _load_observations_and_responses with mocked values for
-     _get_observations_and_responses
+     get_observations_and_response_matrix
     """
     with patch(
-        "ert.storage.LocalEnsemble.get_observations_and_responses"
+        "ert.storage.LocalEnsemble.get_observations_and_response_matrix"
     ) as mock_obs_n_responses:
-        mock_obs_n_responses.return_value = observations_and_responses
+        mock_obs_n_responses.return_value = (
+            observations_and_responses.select(observations_and_responses.columns[:5]),
+            observations_and_responses.select(
+                observations_and_responses.columns[5:]
+            ).to_numpy(),
+        )
 
         return _load_observations_and_responses(
             ensemble=ensemble,
@@ -0,0 +1,304 @@
+import os
+import pickle
+import stat
+import warnings
+from pathlib import Path
+from textwrap import dedent
+
+import numpy as np
+import pytest
+import xtgeo
+from lark import Token
+
+from ert.config import ConfigWarning, ErtConfig
+from ert.config._config_cache import ConfigCache
+from ert.config.parsing.context_values import ContextFloat, ContextInt, ContextString
+from ert.config.parsing.file_context_token import FileContextToken
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    cache_dir = tmp_path / "config_cache"
+    monkeypatch.setenv("ERT_CONFIG_CACHE_DIR", str(cache_dir))
+    return cache_dir
+
+
+def cached_config(config_file="config.ert"):
+    return ConfigCache(Path(os.environ["ERT_CONFIG_CACHE_DIR"])).load(
+        ErtConfig, config_file
+    )
+
+
+@pytest.fixture
+def config_with_include():
+    Path("config.ert").write_text(
+        dedent(
+            """
+            NUM_REALIZATIONS 3
+            INCLUDE include_me
+            """
+        ),
+        encoding="utf-8",
+    )
+    Path("include_me").write_text("RANDOM_SEED 1234\n", encoding="utf-8")
+
+
+@pytest.mark.usefixtures("use_tmpdir", "config_with_include")
+def test_that_the_cached_config_is_equal_to_the_parsed_config(cache_dir):
+    config = ErtConfig.from_file("config.ert", use_cache=True)
+
+    assert config == ErtConfig.from_file("config.ert")
+    assert cached_config() == config
+    assert ErtConfig.from_file("config.ert", use_cache=True) == config
+
+
+@pytest.mark.usefixtures("use_tmpdir", "config_with_include")
+def test_that_configs_are_not_cached_by_default(cache_dir):
+    ErtConfig.from_file("config.ert")
+
+    assert cached_config() is None
+
+
+@pytest.mark.usefixtures("use_tmpdir", "config_with_include")
+def test_that_changing_an_included_file_invalidates_the_cached_config(cache_dir):
+    ErtConfig.from_file("config.ert", use_cache=True)
+    Path("include_me").write_text("RANDOM_SEED 4321\n", encoding="utf-8")
+
+    assert cached_config() is None
+    assert ErtConfig.from_file("config.ert", use_cache=True).random_seed == 4321
+
+
+@pytest.mark.usefixtures("use_tmpdir", "config_with_include")
+def test_that_running_in_the_config_directory_keeps_the_cached_config(cache_dir):
+    ErtConfig.from_file("config.ert", use_cache=True)
+    Path("storage").mkdir()
+    Path("logs").mkdir()
+
+    assert cached_config() is not None
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_changing_an_observation_file_invalidates_the_cached_config(cache_dir):
+    Path("config.ert").write_text(
+        dedent(
+            """
+            NUM_REALIZATIONS 1
+            GEN_DATA GEN RESULT_FILE:gen%d.txt REPORT_STEPS:1
+            OBS_CONFIG observations
+            """
+        ),
+        encoding="utf-8",
+    )
+    Path("observations").write_text(
+        dedent(
+            """
+            GENERAL_OBSERVATION OBS {
+                DATA       = GEN;
+                RESTART    = 1;
+                OBS_FILE   = obs_data.txt;
+            };
+            """
+        ),
+        encoding="utf-8",
+    )
+    Path("obs_data.txt").write_text("1.0 0.1\n", encoding="utf-8")
+    ErtConfig.from_file("config.ert", use_cache=True)
+    Path("obs_data.txt").write_text("2.0 0.1\n", encoding="utf-8")
+
+    assert cached_config() is None
+    config = ErtConfig.from_file("config.ert", use_cache=True)
+    assert config.observations["gen_data"]["observations"].to_list() == [2.0]
+
+
+@pytest.mark.usefixtures("use_tmpdir", "config_with_include")
+def test_that_changing_the_environment_invalidates_the_cached_config(
+    cache_dir, monkeypatch
+):
+    ErtConfig.from_file("config.ert", use_cache=True)
+    monkeypatch.setenv("SOME_CONFIG_VARIABLE", "changed")
+
+    assert cached_config() is None
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_warnings_are_given_again_for_cached_configs(cache_dir):
+    Path("templates").mkdir()
+    Path("templates/ECLDECK.DATA").touch()
+    Path("config.ert").write_text(
+        dedent(
+            """
+            NUM_REALIZATIONS 1
+            ECLBASE ECLIPSEDECK-<IENS>
+            RUN_TEMPLATE templates/ECLDECK.DATA <ECLBASE>.DATA
+            """
+        ),
+        encoding="utf-8",
+    )
+    with pytest.warns(ConfigWarning, match="Use DATA_FILE instead of"):
+        ErtConfig.from_file("config.ert", use_cache=True)
+
+    with pytest.warns(ConfigWarning, match="Use DATA_FILE instead of"):
+        assert cached_config() is not None
+
+
+@pytest.mark.usefixtures("use_tmpdir", "config_with_include")
+def test_that_an_empty_cache_dir_disables_the_cache(cache_dir, monkeypatch):
+    monkeypatch.setenv("ERT_CONFIG_CACHE_DIR", "")
+    ErtConfig.from_file("config.ert", use_cache=True)
+
+    assert not cache_dir.exists()
+
+
+@pytest.mark.usefixtures("use_tmpdir", "config_with_include")
+def test_that_only_the_most_recently_used_configs_are_kept(cache_dir):
+    cache = ConfigCache(cache_dir, max_entries=2)
+    for i in range(3):
+        config_file = f"config_{i}.ert"
+        Path(config_file).write_text("NUM_REALIZATIONS 1\n", encoding="utf-8")
+        config = ErtConfig.from_file(config_file)
+        cache.store(config, config_file, {}, [])
+        os.utime(cache._path(cache._key(ErtConfig, config_file)), (i, i))
+
+    assert len(list(cache_dir.glob("*.pickle"))) == 2
+    assert cache.load(ErtConfig, "config_0.ert") is None
+    assert cache.load(ErtConfig, "config_2.ert") is not None
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_changing_a_nested_include_invalidates_the_cached_config(cache_dir):
+    Path("include").mkdir()
+    Path("config.ert").write_text(
+        "NUM_REALIZATIONS 1\nINCLUDE include/outer\n", encoding="utf-8"
+    )
+    Path("include/outer").write_text("INCLUDE inner\n", encoding="utf-8")
+    Path("include/inner").write_text("RANDOM_SEED 1234\n", encoding="utf-8")
+    ErtConfig.from_file("config.ert", use_cache=True)
+    Path("include/inner").write_text("RANDOM_SEED 4321\n", encoding="utf-8")
+
+    assert cached_config() is None
+
+
+@pytest.mark.usefixtures("use_tmpdir", "config_with_include")
+def test_that_changing_the_site_config_invalidates_the_cached_config(
+    cache_dir, monkeypatch
+):
+    Path("site_config").write_text("QUEUE_SYSTEM LOCAL\n", encoding="utf-8")
+    monkeypatch.setenv("ERT_SITE_CONFIG", os.path.abspath("site_config"))
+    ErtConfig.from_file("config.ert", use_cache=True)
+    Path("site_config").write_text("QUEUE_SYSTEM LOCAL\n-- \n", encoding="utf-8")
+
+    assert cached_config() is None
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_changing_a_base_surface_invalidates_the_cached_config(cache_dir):
+    def write_surface(value):
+        xtgeo.RegularSurface(
+            ncol=2, nrow=3, xinc=1, yinc=1, values=np.full((2, 3), value)
+        ).to_file("base_surface.irap", fformat="irap_ascii")
+
+    write_surface(1.0)
+    Path("config.ert").write_text(
+        dedent(
+            """
+            NUM_REALIZATIONS 1
+            SURFACE TOP OUTPUT_FILE:surf.irap INIT_FILES:surf%d.irap BASE_SURFACE:base_surface.irap
+            """
+        ),
+        encoding="utf-8",
+    )
+    ErtConfig.from_file("config.ert", use_cache=True)
+    write_surface(2.0)
+
+    assert cached_config() is None
+
+
+def test_that_context_values_keep_their_token_when_pickled():
+    token = FileContextToken(Token("UNQUOTED", "value", 3, 2, 1, 2, 6, 8), "config.ert")
+    values = [
+        ContextString("value", token, "keyword"),
+        ContextInt(1, token, "keyword"),
+        ContextFloat(1.5, token, "keyword"),
+    ]
+    for value in values:
+        unpickled = pickle.loads(pickle.dumps(value))
+        assert unpickled == value
+        assert type(unpickled) is type(value)
+        assert unpickled.token == value.token
+        assert unpickled.token.filename == "config.ert"
+        assert (unpickled.token.line, unpickled.token.end_column) == (2, 6)
+        assert unpickled.keyword_token == "keyword"
+
+
+def test_that_warnings_are_not_given_for_a_missing_cache(tmp_path):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert ConfigCache(tmp_path).load(ErtConfig, "config.ert") is None
+
+
+@pytest.mark.usefixtures("use_tmpdir", "config_with_include")
+def test_that_the_cache_dir_is_private_to_the_user(cache_dir):
+    ErtConfig.from_file("config.ert", use_cache=True)
+
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+    for path in cache_dir.iterdir():
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+@pytest.mark.parametrize(
+    "writable_by", [stat.S_IWGRP, stat.S_IWOTH], ids=["group", "others"]
+)
+@pytest.mark.usefixtures("use_tmpdir", "config_with_include")
+def test_that_cached_configs_others_can_write_to_are_not_used(cache_dir, writable_by):
+    ErtConfig.from_file("config.ert", use_cache=True)
+    (cached_file,) = cache_dir.glob("*.pickle")
+
+    cached_file.chmod(0o600 | writable_by)
+    assert cached_config() is None
+
+    cached_file.chmod(0o600)
+    cache_dir.chmod(0o700 | writable_by)
+    assert cached_config() is None
+
+    cached_file.unlink()
+    ErtConfig.from_file("config.ert", use_cache=True)
+    assert not list(cache_dir.iterdir())
+
+
+@pytest.mark.usefixtures("use_tmpdir", "config_with_include")
+def test_that_cached_configs_owned_by_others_are_not_used(cache_dir, monkeypatch):
+    ErtConfig.from_file("config.ert", use_cache=True)
+    monkeypatch.setattr(os, "getuid", lambda: cache_dir.stat().st_uid + 1)
+
+    assert cached_config() is None
+
+
+@pytest.mark.parametrize(
+    "keyword, installed_jobs",
+    [
+        ("INSTALL_JOB_DIRECTORY", "installed_forward_model_steps"),
+        ("WORKFLOW_JOB_DIRECTORY", "workflow_jobs"),
+    ],
+)
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_changing_a_job_directory_invalidates_the_cached_config(
+    cache_dir, keyword, installed_jobs
+):
+    Path("jobs").mkdir()
+    Path("script.sh").write_text("#!/bin/sh\n", encoding="utf-8")
+    Path("script.sh").chmod(0o755)
+    Path("jobs/JOB_A").write_text("EXECUTABLE ../script.sh\n", encoding="utf-8")
+    Path("config.ert").write_text(
+        f"NUM_REALIZATIONS 1\n{keyword} jobs\n", encoding="utf-8"
+    )
+    ErtConfig.from_file("config.ert", use_cache=True)
+
+    Path("jobs/JOB_B").write_text("EXECUTABLE ../script.sh\n", encoding="utf-8")
+    assert cached_config() is None
+    config = ErtConfig.from_file("config.ert", use_cache=True)
+    assert {"JOB_A", "JOB_B"} <= set(getattr(config, installed_jobs))
+
+    Path("jobs/JOB_B").write_text(
+        "EXECUTABLE ../script.sh\nMIN_ARG 1\n", encoding="utf-8"
+    )
+    assert cached_config() is None
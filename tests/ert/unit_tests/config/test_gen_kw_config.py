@@ -36,6 +36,34 @@ def test_gen_kw_config():
     assert len(conf.transform_functions) == 3
 
 
+def test_that_sampling_many_realizations_matches_sampling_each_realization():
+    conf = GenKwConfig(
+        name="KEY",
+        forward_init=False,
+        template_file="",
+        transform_function_definitions=[
+            TransformFunctionDefinition("KEY1", "UNIFORM", [0, 1]),
+            TransformFunctionDefinition("KEY2", "NORMAL", [2, 3]),
+            TransformFunctionDefinition("KEY3", "TRIANGULAR", [0, 1, 4]),
+        ],
+        output_file="kw.txt",
+        update=True,
+    )
+    realizations = [4, 0, 7, 2]
+
+    sampled = conf.sample_many(realizations, random_seed=1234)
+
+    for i, realization in enumerate(realizations):
+        expected = conf.sample_or_load(realization, random_seed=1234, ensemble_size=8)
+        assert (
+            sampled["values"].values[i].tolist() == expected["values"].values.tolist()
+        )
+        assert (
+            sampled["transformed_values"].values[i].tolist()
+            == expected["transformed_values"].values.tolist()
+        )
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 def test_gen_kw_config_duplicate_keys_raises():
     with pytest.raises(
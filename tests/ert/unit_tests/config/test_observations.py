@@ -15,6 +15,7 @@
 )
 from ert.config.general_observation import GenObservation
 from ert.config.observation_vector import ObsVector
+from ert.config.summary_observation import SummaryObservationColumns
 
 
 def run_simulator():
@@ -170,6 +171,39 @@ def test_summary_obs_invalid_observation_std(std):
         SummaryObservation("summary_key", "observation_key", 1.0, std)
 
 
+@pytest.mark.parametrize("std", [[1.0, -1.0], [0], [0.0, 1.0]])
+def test_summary_obs_columns_invalid_observation_std(std):
+    dates = [datetime(2000, 1, 1) + timedelta(days=i) for i in range(len(std))]
+    with pytest.raises(ValueError, match="must be strictly > 0"):
+        SummaryObservationColumns("FOPR", "FOPR", dates, [1.0] * len(std), std)
+
+
+@pytest.mark.parametrize("active_list", [[], [0, 2]])
+def test_that_summary_obs_columns_give_the_same_dataset_as_observations(
+    active_list,
+):
+    dates = [datetime(2000, 1, 1) + timedelta(days=i, seconds=0.5) for i in range(4)]
+    values = [1.0, 2.5, -3.0, 1e6]
+    std = [0.1, 0.2, 0.3, 0.4]
+    columns = SummaryObservationColumns("FOPR", "FOPR", dates, values, std)
+    observations = {
+        date: SummaryObservation("FOPR", "FOPR", value, error)
+        for date, value, error in zip(dates, values, std, strict=True)
+    }
+
+    assert columns == observations
+    assert list(columns) == dates
+    assert (
+        ObsVector(ObservationType.SUMMARY, "FOPR", "summary", columns)
+        .to_dataset(active_list)
+        .equals(
+            ObsVector(
+                ObservationType.SUMMARY, "FOPR", "summary", observations
+            ).to_dataset(active_list)
+        )
+    )
+
+
 @pytest.mark.parametrize("std", [[-1.0], [0], [0.0], [1.0, 0]])
 def test_gen_obs_invalid_observation_std(std):
     with pytest.raises(ValueError, match="must be strictly > 0"):
@@ -7,12 +7,14 @@
 from hypothesis import given
 from resdata.summary import Summary, SummaryVarType
 
-from ert.config import InvalidResponseFile
+from ert.config import InvalidResponseFile, _read_summary
 from ert.config._read_summary import make_summary_key, read_summary
 from ert.summary_key_type import SummaryKeyType
 
 from .summary_generator import (
     inter_region_summary_variables,
+    simple_smspec,
+    simple_unsmry,
     summaries,
     summary_variables,
 )
@@ -487,3 +489,24 @@ def test_that_ambiguous_case_restart_raises_an_informative_error(tmp_path):
         match="Ambiguous reference to unified summary",
     ):
         read_summary(str(tmp_path / "test"), ["*"])
+
+
+def test_that_summary_specifications_with_the_same_content_are_read_once(
+    tmp_path, mocker
+):
+    spy = mocker.spy(_read_summary, "_parse_spec")
+    results = []
+    for realization in range(3):
+        run_path = tmp_path / f"realization-{realization}"
+        run_path.mkdir()
+        simple_smspec().to_file(run_path / "TEST.SMSPEC")
+        simple_unsmry().to_file(run_path / "TEST.UNSMRY")
+        results.append(
+            read_summary(str(run_path / "TEST"), [f"FOPR{realization}", "FOPR"])
+        )
+        results.append(read_summary(str(run_path / "TEST"), ["FOPR"]))
+
+    assert spy.call_count == 4
+    for _, keys, _, data in results:
+        assert keys == ["FOPR"]
+        assert data.tolist() == [[pytest.approx(5.629901e16)]]
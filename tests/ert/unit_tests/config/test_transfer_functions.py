@@ -7,6 +7,7 @@
 from scipy.stats import norm
 
 from ert.config import TransformFunction
+from ert.config.gen_kw_config import PRIOR_FUNCTIONS
 
 
 @pytest.fixture(autouse=True)
@@ -232,3 +233,31 @@ def test_that_triangular_is_monotonic(args):
             assert y1 >= y2
         else:
             assert y1 <= y2
+
+
+@pytest.mark.parametrize(
+    "name, arg",
+    [
+        ("NORMAL", [1.0, 2.0]),
+        ("LOGNORMAL", [0.0, 0.5]),
+        ("TRUNCATED_NORMAL", [0.0, 1.0, -0.5, 0.5]),
+        ("TRIANGULAR", [0.0, 1.0, 4.0]),
+        ("UNIFORM", [0.0, 1.0]),
+        ("DUNIF", [5.0, 1.0, 5.0]),
+        ("ERRF", [1.0, 2.0, 0.1, 0.5]),
+        ("DERRF", [10.0, 1.0, 2.0, 0.1, 0.5]),
+        ("LOGUNIF", [0.00001, 1.0]),
+        ("CONST", [5.0]),
+        ("RAW", []),
+    ],
+)
+def test_that_transform_functions_on_arrays_match_scalar_transforms(name, arg):
+    func = PRIOR_FUNCTIONS[name]
+    x = np.random.default_rng(0).standard_normal((3, 50))
+
+    result = func(x, arg)
+
+    assert result.shape == x.shape
+    np.testing.assert_array_equal(
+        result, [[func(value, arg) for value in row] for row in x]
+    )
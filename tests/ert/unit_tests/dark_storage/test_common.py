@@ -1,11 +1,12 @@
 import datetime
 
+import numpy as np
 import pandas as pd
 import polars as pl
 import pytest
 
 from ert.config import GenDataConfig, SummaryConfig
-from ert.dark_storage.common import data_for_key
+from ert.dark_storage.common import data_for_key, statistics_for_key
 from ert.storage import open_storage
 from tests.ert.unit_tests.config.summary_generator import (
     Date,
@@ -129,3 +130,92 @@ def test_data_for_key_returns_empty_gen_data_config(tmp_path):
         ensemble.refresh_ensemble_state()
         data = data_for_key(ensemble, "response@0")
         assert not data.empty
+
+
+def test_statistics_for_key_matches_statistics_of_data_for_key(tmp_path):
+    rng = np.random.default_rng(42)
+    dates = [datetime.datetime(2000, 1, day) for day in range(1, 6)]
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        summary_config = SummaryConfig(
+            name="summary", input_files=["CASE"], keys=["FOPR"]
+        )
+        gen_data_config = GenDataConfig(keys=["response"])
+        experiment = storage.create_experiment(
+            responses=[summary_config, gen_data_config]
+        )
+        ensemble = experiment.create_ensemble(name="ensemble", ensemble_size=7)
+        for realization in range(7):
+            ensemble.save_response(
+                "summary",
+                pl.DataFrame(
+                    {
+                        "response_key": "FOPR",
+                        "time": pl.Series(dates, dtype=pl.Datetime("ms")),
+                        "values": pl.Series(rng.random(5), dtype=pl.Float32),
+                    }
+                ),
+                realization,
+            )
+            ensemble.save_response(
+                "gen_data",
+                pl.DataFrame(
+                    {
+                        "response_key": "response",
+                        "report_step": pl.Series([0] * 3, dtype=pl.UInt16),
+                        "index": pl.Series([0, 1, 2], dtype=pl.UInt16),
+                        "values": pl.Series(rng.random(3), dtype=pl.Float32),
+                    }
+                ),
+                realization,
+            )
+        ensemble.refresh_ensemble_state()
+
+        for key in ["FOPR", "response@0"]:
+            data = data_for_key(ensemble, key)
+            expected = pd.DataFrame(
+                {
+                    "Minimum": data.min(),
+                    "Maximum": data.max(),
+                    "Mean": data.mean(),
+                    "p10": data.quantile(0.1),
+                    "p33": data.quantile(0.33),
+                    "p50": data.quantile(0.5),
+                    "p67": data.quantile(0.67),
+                    "p90": data.quantile(0.9),
+                    "std": data.std(),
+                }
+            ).T
+            pd.testing.assert_frame_equal(
+                statistics_for_key(ensemble, key), expected, check_names=False
+            )
+        assert statistics_for_key(ensemble, "FOPRH").empty
+
+
+def test_that_statistics_for_key_are_recomputed_when_responses_change(tmp_path):
+    with open_storage(tmp_path / "storage", mode="w") as storage:
+        summary_config = SummaryConfig(
+            name="summary", input_files=["CASE"], keys=["FGPR"]
+        )
+        experiment = storage.create_experiment(responses=[summary_config])
+        ensemble = experiment.create_ensemble(name="ensemble", ensemble_size=2)
+
+        def save_response(realization, value):
+            ensemble.save_response(
+                "summary",
+                pl.DataFrame(
+                    {
+                        "response_key": ["FGPR"],
+                        "time": pl.Series(
+                            [datetime.datetime(2000, 1, 1)], dtype=pl.Datetime("ms")
+                        ),
+                        "values": pl.Series([value], dtype=pl.Float32),
+                    }
+                ),
+                realization,
+            )
+            ensemble.refresh_ensemble_state()
+
+        save_response(0, 1.0)
+        assert statistics_for_key(ensemble, "FGPR").loc["Maximum"].tolist() == [1.0]
+        save_response(1, 3.0)
+        assert statistics_for_key(ensemble, "FGPR").loc["Maximum"].tolist() == [3.0]
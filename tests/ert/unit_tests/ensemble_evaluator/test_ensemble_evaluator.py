@@ -21,7 +21,9 @@
     ForwardModelStepSuccess,
     Id,
     RealizationSuccess,
+    event_from_bytes,
     event_from_dict,
+    event_to_bytes,
     event_to_json,
 )
 from _ert.forward_model_runner.client import (
@@ -175,7 +177,6 @@ async def new_connection():
 async def evaluator_to_use_fixture(make_ee_config):
     ensemble = TestEnsemble(0, 2, 2, id_="0")
     evaluator = EnsembleEvaluator(ensemble, make_ee_config(use_token=False))
-    evaluator._batching_interval = 0.5  # batching can be faster for tests
     run_task = asyncio.create_task(evaluator.run_and_get_successful_realizations())
     await evaluator._server_started
     yield evaluator
@@ -745,3 +746,109 @@ def is_completed_snapshot(snapshot: EnsembleSnapshot) -> bool:
                 break
 
         assert was_completed
+
+
+async def test_that_batching_adapts_to_the_event_rate(make_ee_config):
+    evaluator = EnsembleEvaluator(
+        TestEnsemble(0, 2, 2, id_="0"), make_ee_config(use_token=False)
+    )
+    evaluator._adapt_batching(batch_size=1, elapsed=1.0)
+    assert evaluator._batching_interval == evaluator._min_batching_interval
+    assert evaluator._max_batch_size == evaluator._min_batch_size
+
+    for _ in range(20):
+        evaluator._adapt_batching(batch_size=5000, elapsed=0.5)
+    assert evaluator._batching_interval == evaluator._max_batching_interval
+    assert evaluator._max_batch_size == evaluator._batch_size_limit
+
+
+@pytest.mark.timeout(10)
+async def test_that_evaluator_counts_handled_events(evaluator_to_use):
+    evaluator = evaluator_to_use
+    evaluator._batching_interval = 0.1
+    for real in ("0", "1"):
+        await evaluator._events.put(
+            ForwardModelStepRunning(
+                ensemble=evaluator.ensemble.id_,
+                real=real,
+                fm_step="0",
+                current_memory_usage=1000,
+            )
+        )
+    await evaluator._events.join()
+    await evaluator._complete_batch.wait()
+    await evaluator._batch_processing_queue.join()
+
+    assert evaluator.metrics.events == 2
+    assert evaluator.metrics.batches == 1
+    assert evaluator.metrics.largest_batch == 2
+    assert evaluator.metrics.mean_batch_size == 2
+    assert evaluator.metrics.mean_handler_latency > 0
+
+
+@pytest.mark.parametrize("wire_format", ["json", "msgpack"])
+def test_that_events_survive_the_wire_format(wire_format):
+    event = ForwardModelStepRunning(
+        ensemble="1", real="0", fm_step="0", current_memory_usage=1000
+    )
+    assert event_from_bytes(event_to_bytes(event, wire_format)) == event
+
+
+def test_that_unknown_wire_format_versions_are_rejected():
+    raw_msg = event_to_bytes(EnsembleStarted(ensemble="1"), "msgpack")
+    with pytest.raises(ValueError, match="Unsupported wire format version"):
+        event_from_bytes(raw_msg[:1] + b"\xff" + raw_msg[2:])
+
+
+@pytest.mark.integration_test
+@pytest.mark.timeout(20)
+async def test_that_binary_and_json_clients_can_be_mixed(evaluator_to_use):
+    evaluator = evaluator_to_use
+    token = evaluator._config.token
+    url = evaluator._config.get_uri()
+
+    async with (
+        Monitor(url, token) as binary_monitor,
+        Monitor(url, token, wire_format="json") as json_monitor,
+    ):
+        binary_events = binary_monitor.track()
+        json_events = json_monitor.track()
+        assert type(await anext(binary_events)) is EESnapshot
+        assert type(await anext(json_events)) is EESnapshot
+        assert binary_monitor._peer_wire_format == "msgpack"
+        assert json_monitor._peer_wire_format == "msgpack"
+
+        async with (
+            Client(url, token=token) as binary_dispatch,
+            Client(url, token=token, wire_format="json") as json_dispatch,
+        ):
+            await binary_dispatch.send_event(
+                ForwardModelStepRunning(
+                    ensemble=evaluator.ensemble.id_,
+                    real="0",
+                    fm_step="0",
+                    current_memory_usage=1000,
+                )
+            )
+            await json_dispatch.send_event(
+                ForwardModelStepRunning(
+                    ensemble=evaluator.ensemble.id_,
+                    real="1",
+                    fm_step="0",
+                    current_memory_usage=1000,
+                )
+            )
+
+        for events in (binary_events, json_events):
+            snapshot = EnsembleSnapshot()
+            while len(snapshot.get_all_fm_steps()) < 2:
+                event = await anext(events)
+                assert type(event) is EESnapshotUpdate
+                snapshot.merge_snapshot(
+                    EnsembleSnapshot.from_nested_dict(event.snapshot)
+                )
+            assert {
+                real: fm_step["status"]
+                for (real, _), fm_step in snapshot.get_all_fm_steps().items()
+            } == {"0": FORWARD_MODEL_STATE_RUNNING, "1": FORWARD_MODEL_STATE_RUNNING}
+        await binary_monitor.signal_done()
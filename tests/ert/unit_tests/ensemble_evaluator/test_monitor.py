@@ -101,6 +101,30 @@ async def mock_event_handler(router_socket):
     assert connected is False
 
 
+async def test_that_monitor_sends_json_to_evaluators_without_the_binary_format(
+    unused_tcp_port,
+):
+    received = []
+
+    async def mock_event_handler(router_socket):
+        while True:
+            dealer, _, frame = await router_socket.recv_multipart()
+            await router_socket.send_multipart([dealer, b"", ACK_MSG])
+            if frame == DISCONNECT_MSG:
+                return
+            if frame != CONNECT_MSG:
+                received.append(event_from_json(frame.decode("utf-8")))
+
+    websocket_server_task = asyncio.create_task(
+        async_zmq_server(unused_tcp_port, mock_event_handler)
+    )
+    async with Monitor(localhost_uri(unused_tcp_port)) as monitor:
+        assert monitor.wire_format == "msgpack"
+        await monitor.signal_done()
+    await websocket_server_task
+    assert [type(event) for event in received] == [EEUserDone]
+
+
 @pytest.mark.integration_test
 async def test_unexpected_close_after_connection_successful(
     monkeypatch, unused_tcp_port
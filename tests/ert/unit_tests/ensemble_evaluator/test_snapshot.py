@@ -4,6 +4,7 @@
     ForwardModelStepFailure,
     ForwardModelStepRunning,
     ForwardModelStepSuccess,
+    RealizationRunning,
     RealizationSuccess,
 )
 from ert.ensemble_evaluator import state
@@ -100,3 +101,88 @@ def test_that_realization_success_message_updates_state():
     assert (
         snapshot.to_dict()["reals"]["0"]["status"] == state.REALIZATION_STATE_FINISHED
     )
+
+
+def test_that_queue_wait_time_is_kept_when_realization_finishes():
+    snapshot = SnapshotBuilder().build(["0"], status="Unknown")
+    snapshot.update_from_event(
+        RealizationRunning(ensemble="0", real="0", queue_wait_time=12.5)
+    )
+    snapshot.update_from_event(RealizationSuccess(ensemble="0", real="0"))
+    assert snapshot.get_real("0")["queue_wait_time"] == 12.5
+
+
+def test_that_writes_to_a_copied_snapshot_are_not_seen_by_the_original():
+    snapshot = (
+        SnapshotBuilder()
+        .add_fm_step(
+            fm_step_id="0", index="0", name="fm", status=state.FORWARD_MODEL_STATE_INIT
+        )
+        .build(["0", "1"], status=state.REALIZATION_STATE_WAITING)
+    )
+    original = snapshot.to_dict()
+    copied = snapshot.copy()
+    assert copied == snapshot
+
+    copied.update_from_event(RealizationSuccess(ensemble="0", real="0"))
+    copied.update_from_event(
+        ForwardModelStepSuccess(ensemble="0", real="0", fm_step="0")
+    )
+    assert snapshot.to_dict() == original
+    assert copied.get_real("0")["status"] == state.REALIZATION_STATE_FINISHED
+
+    snapshot.update_from_event(RealizationRunning(ensemble="0", real="1"))
+    assert copied.get_real("1")["status"] == state.REALIZATION_STATE_WAITING
+    assert copied.get_fm_step("1", "0")["status"] == state.FORWARD_MODEL_STATE_INIT
+    assert snapshot.get_fm_step("0", "0")["status"] == state.FORWARD_MODEL_STATE_INIT
+
+
+def test_that_step_failures_in_a_copied_snapshot_are_seen_through_reals():
+    snapshot = (
+        SnapshotBuilder()
+        .add_fm_step(
+            fm_step_id="0",
+            index="0",
+            name="fm",
+            status=state.FORWARD_MODEL_STATE_RUNNING,
+        )
+        .build(["0"], status=state.REALIZATION_STATE_RUNNING)
+    )
+    copied = snapshot.copy()
+
+    copied.update_from_event(
+        ForwardModelStepFailure(ensemble="0", real="0", fm_step="0", error_msg="failed")
+    )
+
+    assert copied.get_fm_step("0", "0")["status"] == state.FORWARD_MODEL_STATE_FAILURE
+    fm_step = copied.reals["0"]["fm_steps"]["0"]
+    assert fm_step["status"] == state.FORWARD_MODEL_STATE_FAILURE
+    assert fm_step["error"] == "failed"
+    assert (
+        snapshot.reals["0"]["fm_steps"]["0"]["status"]
+        == state.FORWARD_MODEL_STATE_RUNNING
+    )
+    assert snapshot.get_fm_step("0", "0")["status"] == state.FORWARD_MODEL_STATE_RUNNING
+
+
+def test_that_realization_states_are_counted_as_they_change():
+    snapshot = SnapshotBuilder().build(
+        ["0", "1", "2"], status=state.REALIZATION_STATE_WAITING
+    )
+    assert snapshot.aggregate_real_states() == {state.REALIZATION_STATE_WAITING: 3}
+
+    snapshot.update_from_event(RealizationRunning(ensemble="0", real="0"))
+    update = EnsembleSnapshot().update_from_event(
+        RealizationSuccess(ensemble="0", real="1")
+    )
+    copied = snapshot.copy()
+    snapshot.merge_snapshot(update)
+    assert snapshot.aggregate_real_states() == {
+        state.REALIZATION_STATE_WAITING: 1,
+        state.REALIZATION_STATE_RUNNING: 1,
+        state.REALIZATION_STATE_FINISHED: 1,
+    }
+    assert copied.aggregate_real_states() == {
+        state.REALIZATION_STATE_WAITING: 2,
+        state.REALIZATION_STATE_RUNNING: 1,
+    }
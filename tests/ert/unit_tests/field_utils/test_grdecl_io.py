@@ -100,3 +100,33 @@ def test_that_text_export_and_import_are_inverses(array, name, tmp_path):
         atol=1e-6,
     )
     assert not np.isnan(result).any()
+
+
+def test_that_import_expands_repeated_values_and_skips_comments(tmp_path):
+    (tmp_path / "test.grdecl").write_text(
+        "-- A comment\nPORO ignored\n 1.0 2*0.5 -- 9.0\n3*2.0 / 7.0\nPERMX\n 1 /\n"
+    )
+    assert import_grdecl(
+        tmp_path / "test.grdecl", "PORO", (6, 1, 1)
+    ).ravel().tolist() == [1.0, 0.5, 0.5, 2.0, 2.0, 2.0]
+
+
+def test_that_import_of_non_numeric_grdecl_values_fails(tmp_path):
+    (tmp_path / "test.grdecl").write_text("PORO\n 1.0 abc /\n")
+    with pytest.raises(ValueError, match="could not convert"):
+        import_grdecl(tmp_path / "test.grdecl", "PORO", (2, 1, 1))
+
+
+def test_that_text_export_writes_six_values_per_line(tmp_path):
+    export_grdecl(
+        np.arange(7, dtype=np.float32).reshape((7, 1, 1)),
+        tmp_path / "test.grdecl",
+        "PORO",
+        binary=False,
+    )
+    assert (tmp_path / "test.grdecl").read_text() == (
+        "PORO\n"
+        " 0.000000e+00 1.000000e+00 2.000000e+00"
+        " 3.000000e+00 4.000000e+00 5.000000e+00\n"
+        " 6.000000e+00 /\n"
+    )
@@ -1,11 +1,15 @@
+import hashlib
 import json
 import os
 import os.path
 import stat
 import textwrap
+import zlib
+from pathlib import Path
 
 import pytest
 
+from _ert.checksum import MANIFEST_CHECKSUM_KEY, file_checksum, verify_checksum
 from _ert.forward_model_runner.reporting.message import Checksum, Exited, Start
 from _ert.forward_model_runner.runner import ForwardModelRunner
 from ert.config import ErtConfig, ForwardModelStep
@@ -184,6 +188,47 @@ def test_when_manifest_file_is_not_created_by_fm_runner_checksum_contains_error(
     )
 
 
+@pytest.mark.parametrize(
+    "settings, expected_keys",
+    [
+        ({}, {"md5sum"}),
+        ({"algorithm": "md5"}, {"md5sum"}),
+        ({"algorithm": "crc32"}, {"checksum", "checksum_algorithm"}),
+        ({"algorithm": "not_supported"}, {"md5sum"}),
+        ({"algorithm": "crc32", "size_limit": 10}, {"size", "mtime_ns"}),
+        (
+            {"algorithm": "crc32", "size_limit": 1000},
+            {"checksum", "checksum_algorithm"},
+        ),
+    ],
+)
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_checksum_settings_are_read_from_the_manifest(settings, expected_keys):
+    Path("output").write_bytes(b"x" * 100)
+    with open("manifest.json", "w", encoding="utf-8") as f:
+        json.dump({"file_1": "output", MANIFEST_CHECKSUM_KEY: settings}, f)
+
+    fmr = ForwardModelRunner(create_jobs_json([]))
+
+    checksum_msg = [s for s in list(fmr.run([])) if isinstance(s, Checksum)]
+    assert len(checksum_msg) == 1
+    info = checksum_msg[0].data["file_1"]
+    assert set(info) == {"type", "path"} | expected_keys
+    assert verify_checksum("output", info)
+    Path("output").write_bytes(b"y" * 101)
+    assert not verify_checksum("output", info)
+
+
+def test_that_streamed_checksums_match_whole_file_checksums(tmp_path):
+    path = tmp_path / "output"
+    content = os.urandom(10_000)
+    path.write_bytes(content)
+    assert (
+        file_checksum(path, "md5", buffer_size=64) == hashlib.md5(content).hexdigest()
+    )
+    assert file_checksum(path, "crc32", buffer_size=64) == f"{zlib.crc32(content):08x}"
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 def test_run_multiple_fail_only_runs_one():
     fm_step_list = []
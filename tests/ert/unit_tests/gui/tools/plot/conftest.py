@@ -44,6 +44,7 @@ def session(project: str):
         os.chdir("test_data")
         api = PlotApi(test_data_dir)
         yield api
+        api.close()
 
 
 def mocked_requests_get(*args, **kwargs):
@@ -17,7 +17,10 @@
 from ert.gui.tools.plot.plot_api import PlotApi, PlotApiKeyDefinition
 from ert.services import StorageService
 from ert.storage import open_storage
-from tests.ert.unit_tests.gui.tools.plot.conftest import MockResponse
+from tests.ert.unit_tests.gui.tools.plot.conftest import (
+    MockResponse,
+    mocked_requests_get,
+)
 
 
 @pytest.fixture(autouse=True)
@@ -118,6 +121,51 @@ def test_can_load_data_and_observations(api):
         assert not data.empty
 
 
+@pytest.fixture
+def spy_get(mocker):
+    return mocker.patch(
+        "tests.ert.unit_tests.gui.tools.plot.conftest.mocked_requests_get",
+        side_effect=mocked_requests_get,
+    )
+
+
+def test_that_data_for_key_is_served_from_cache(spy_get, api):
+    ensemble = next(x for x in api.get_all_ensembles() if x.name == "default_0")
+    spy_get.reset_mock()
+
+    first = api.data_for_key(ensemble.id, "FOPR")
+    first.iloc[0, 0] = -1.0
+    second = api.data_for_key(ensemble.id, "FOPR")
+    assert spy_get.call_count == 1
+    assert second.iloc[0, 0] != -1.0
+
+    api.refresh()
+    api.get_all_ensembles()
+    spy_get.reset_mock()
+    api.data_for_key(ensemble.id, "FOPR")
+    assert spy_get.call_count == 1
+
+
+def test_that_plot_data_cache_evicts_least_recently_used(spy_get, api):
+    ensemble = next(x for x in api.get_all_ensembles() if x.name == "default_0")
+    api.prefetch(["FOPR", "FOPRH"], [ensemble.id])
+    api._cache.max_bytes = sum(
+        api.data_for_key(ensemble.id, key).memory_usage(deep=True).sum()
+        for key in ["FOPR", "FOPRH"]
+    )
+    api.data_for_key(ensemble.id, "BPR:1,3,8")
+    api.data_for_key(ensemble.id, "FOPRH")
+
+    assert len(api._cache) == 2
+    assert api._cache.size <= api._cache.max_bytes
+    spy_get.reset_mock()
+    api.data_for_key(ensemble.id, "BPR:1,3,8")
+    api.data_for_key(ensemble.id, "FOPRH")
+    assert spy_get.call_count == 0
+    api.data_for_key(ensemble.id, "FOPR")
+    assert spy_get.call_count == 1
+
+
 def test_all_data_type_keys(api):
     keys = [e.key for e in api.all_data_type_keys()]
     assert keys == [
@@ -190,6 +238,7 @@ def api_and_storage(monkeypatch, tmp_path):
         monkeypatch.setenv("ERT_STORAGE_ENS_PATH", str(storage.path))
         api = PlotApi(ens_path)
         yield api, storage
+        api.close()
     if enkf._storage is not None:
         enkf._storage.close()
     enkf._storage = None
@@ -0,0 +1,68 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ert import LibresFacade
+from ert.plugins.hook_implementations.workflows.csv_export import (
+    CSVExportJob,
+    _CSVWriter,
+)
+
+
+def test_csv_export_of_snake_oil_ensemble(snake_oil_storage):
+    ensemble = snake_oil_storage.get_experiment_by_name(
+        "ensemble-experiment"
+    ).get_ensemble_by_name("default_0")
+
+    message = CSVExportJob().run(
+        snake_oil_storage,
+        ["output.csv", json.dumps({str(ensemble.id): ensemble.name})],
+    )
+
+    data = pd.read_csv("output.csv", index_col=[0, 1, 2, 3])
+    realizations = ensemble.get_realization_list_with_responses()
+    summary = ensemble.load_responses("summary", tuple(realizations))
+    assert message == (
+        f"Exported {len(data)} rows and {len(data.columns)} columns to output.csv."
+    )
+    assert list(data.index.names) == ["Realization", "Iteration", "Date", "Ensemble"]
+    assert len(data) == summary.select("realization", "time").n_unique()
+    assert set(summary["response_key"]) <= set(data.columns)
+    assert "SNAKE_OIL_PARAM:OP1_OFFSET" in data.columns
+
+    misfit = LibresFacade.load_all_misfit_data(ensemble)
+    exported_misfit = data[misfit.columns].groupby(level="Realization").first()
+    np.testing.assert_allclose(exported_misfit, misfit, atol=1e-6)
+
+
+def _frame(ensemble, columns):
+    index = pd.MultiIndex.from_product(
+        [range(3), [0], [None], [ensemble]],
+        names=["Realization", "Iteration", "Date", "Ensemble"],
+    )
+    return pd.DataFrame(columns, index=index)
+
+
+@pytest.mark.parametrize("drop_const_cols", [False, True])
+def test_that_csv_writer_writes_frames_as_if_concatenated(tmp_path, drop_const_cols):
+    frames = [
+        _frame("a", {"x": [1.0, 2.0, 3.0], "const": [5.0] * 3, "y": [1.0] * 3}),
+        _frame("b", {"const": [5.0] * 3, "x": [1.0] * 3, "z": [7.0] * 3}),
+        _frame("c", {"const": [5.0] * 3, "nan": [np.nan] * 3}),
+    ]
+    writer = _CSVWriter(tmp_path)
+    for frame in frames:
+        writer.add(frame)
+
+    rows, columns = writer.write(str(tmp_path / "output.csv"), drop_const_cols)
+
+    data = pd.concat(frames)
+    if drop_const_cols:
+        data = data.loc[:, (data != data.iloc[0]).any()]
+    assert (rows, columns) == data.shape
+    assert (tmp_path / "output.csv").read_text(encoding="utf-8") == data.to_csv(
+        float_format="%.6f"
+    )
+    assert not list(tmp_path.glob("*.pickle"))
@@ -0,0 +1,134 @@
+import numpy as np
+import polars as pl
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from ert.run_models.evaluation_cache import (
+    _CELL_OFFSET,
+    _CELL_SIZE,
+    EvaluationCacheIndex,
+)
+
+EPS = float(np.finfo(np.float32).eps)
+
+
+def cached_evaluations(control_values, model_realizations):
+    control_values = np.asarray(control_values, dtype=np.float64)
+    return pl.DataFrame(
+        {
+            "model_realization": pl.Series(model_realizations, dtype=pl.UInt16),
+            **{
+                f"point.x{i}": control_values[:, i]
+                for i in range(control_values.shape[1])
+            },
+            "distance": np.arange(control_values.shape[0], dtype=np.float64),
+        }
+    )
+
+
+def reference_lookup(cached_values, cached_realizations, values, realizations):
+    rows = []
+    for vector, realization in zip(values, realizations, strict=True):
+        matching = [
+            row
+            for row, (cached, cached_realization) in enumerate(
+                zip(cached_values, cached_realizations, strict=True)
+            )
+            if cached_realization == realization
+            and np.allclose(cached, vector, rtol=0, atol=EPS)
+        ]
+        rows.append(matching[0] if matching else -1)
+    return rows
+
+
+CONTROL_NAMES = ["point.x0", "point.x1", "point.x2"]
+
+
+def test_that_control_vectors_within_tolerance_are_found():
+    cached = [[0.1, 0.2, 0.3], [0.5, 0.5, 0.5], [0.1, 0.2, 0.3]]
+    index = EvaluationCacheIndex(
+        cached_evaluations(cached, [0, 0, 1]), CONTROL_NAMES, EPS
+    )
+
+    rows = index.lookup(
+        [
+            [0.1, 0.2, 0.3],
+            [0.1, 0.2, 0.3],
+            [0.5 + EPS / 2, 0.5 - EPS / 2, 0.5],
+            [0.5 + 2 * EPS, 0.5, 0.5],
+            [0.5, 0.5, 0.5],
+        ],
+        [1, 0, 0, 0, 2],
+    )
+
+    assert rows.tolist() == [2, 0, 1, -1, -1]
+
+
+def test_that_the_first_of_equal_cached_control_vectors_is_found():
+    cached = [[0.5, 0.5, 0.5]] * 3
+    index = EvaluationCacheIndex(
+        cached_evaluations(cached, [0, 0, 0]), CONTROL_NAMES, EPS
+    )
+
+    assert index.lookup([[0.5, 0.5, 0.5]], [0]).tolist() == [0]
+
+
+def test_that_control_vectors_are_found_across_cell_edges():
+    edge = 7 * _CELL_SIZE - _CELL_OFFSET
+    cached = [[edge - EPS / 2, 0.5, 0.5]]
+    index = EvaluationCacheIndex(cached_evaluations(cached, [0]), CONTROL_NAMES, EPS)
+
+    assert index.lookup([[edge + EPS / 2, 0.5, 0.5]], [0]).tolist() == [0]
+
+
+def test_that_an_empty_cache_finds_nothing():
+    index = EvaluationCacheIndex(
+        cached_evaluations(np.empty((0, 3)), []), CONTROL_NAMES, EPS
+    )
+
+    assert index.lookup([[0.5, 0.5, 0.5]], [0]).tolist() == [-1]
+
+
+@pytest.mark.parametrize("num_controls", [1, 5])
+@settings(max_examples=50)
+@given(data=st.data())
+def test_that_lookup_is_the_same_as_comparing_all_cached_evaluations(
+    num_controls, data
+):
+    # Values are close to a few points near cell edges, so that vectors are
+    # often just within or just outside the tolerance of each other
+    points = np.array([0.0, 1.0, 3 * _CELL_SIZE - _CELL_OFFSET, 0.25])
+    vectors = st.lists(
+        st.tuples(
+            st.integers(0, 1),
+            st.lists(
+                st.tuples(
+                    st.sampled_from(points), st.integers(-3, 3).map(lambda k: k * EPS)
+                ).map(sum),
+                min_size=num_controls,
+                max_size=num_controls,
+            ),
+        ),
+        max_size=10,
+    )
+    cached = data.draw(vectors)
+    evaluated = data.draw(vectors)
+    cached_realizations = [realization for realization, _ in cached]
+    cached_values = np.array(
+        [values for _, values in cached], dtype=np.float64
+    ).reshape(-1, num_controls)
+    realizations = [realization for realization, _ in evaluated]
+    values = np.array([values for _, values in evaluated], dtype=np.float64).reshape(
+        -1, num_controls
+    )
+
+    index = EvaluationCacheIndex(
+        cached_evaluations(cached_values, cached_realizations),
+        [f"point.x{i}" for i in range(num_controls)],
+        EPS,
+    )
+
+    assert index.lookup(values, realizations).tolist() == reference_lookup(
+        cached_values, cached_realizations, values, realizations
+    )
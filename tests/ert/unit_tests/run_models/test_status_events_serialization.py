@@ -13,6 +13,7 @@
     EndEvent,
     FullSnapshotEvent,
     RunModelDataEvent,
+    RunModelRunpathEvent,
     RunModelStatusEvent,
     RunModelTimeEvent,
     RunModelUpdateBeginEvent,
@@ -134,6 +135,12 @@
             RunModelStatusEvent(iteration=1, run_id=uuid.uuid1(), msg="Hello"),
             id="RunModelStatusEvent",
         ),
+        pytest.param(
+            RunModelRunpathEvent(
+                iteration=1, run_id=uuid.uuid1(), created=10, total=100
+            ),
+            id="RunModelRunpathEvent",
+        ),
         pytest.param(
             RunModelTimeEvent(
                 iteration=1,
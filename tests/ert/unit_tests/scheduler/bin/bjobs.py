@@ -26,7 +26,17 @@ def get_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def bjobs_formatter(jobstats: list[Job]) -> str:
+def bjobs_formatter(jobstats: list[Job], with_jobindex: bool = False) -> str:
+    if with_jobindex:
+        # Array job elements have ids like 123[4]
+        return "".join(
+            [
+                f"{job.job_id.split('[')[0]}^"
+                f"{job.job_id.split('[')[1].rstrip(']') if '[' in job.job_id else 0}^"
+                f"{job.job_state}^-\n"
+                for job in jobstats
+            ]
+        )
     return "".join([f"{job.job_id}^{job.job_state}^-\n" for job in jobstats])
 
 
@@ -59,7 +69,7 @@ def main() -> None:
 
         jobs_output.append(Job(job_id=job, job_state=state))
 
-    print(bjobs_formatter(jobs_output))
+    print(bjobs_formatter(jobs_output, "jobindex" in args.o))
 
 
 if __name__ == "__main__":
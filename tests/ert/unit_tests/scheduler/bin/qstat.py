@@ -50,7 +50,8 @@ def main() -> None:
 
         state = "Q"
         if returncode is not None:
-            state = random.choice("EF")
+            # Finished subjobs of array jobs are expired
+            state = "X" if "[" in job else random.choice("EF")
         elif pid is not None:
             state = "R"
 
@@ -20,36 +20,59 @@ def get_parser() -> argparse.ArgumentParser:
     parser.add_argument("--parsable", action="store_true")
     parser.add_argument("--output", type=str)
     parser.add_argument("--error", type=str)
+    parser.add_argument("--array", type=str)
     parser.add_argument("script", type=str)
     return parser
 
 
-def main() -> None:
-    args = get_parser().parse_args()
-
-    jobid = random.randint(1, 2**15)
-    jobdir = Path(os.getenv("PYTEST_TMP_PATH", "."))
-    (jobdir / "mock_jobs").mkdir(parents=True, exist_ok=True)
+def start_job(
+    jobdir: Path,
+    jobid: str,
+    args: argparse.Namespace,
+    env: str,
+    output: str,
+    error: str,
+) -> None:
     (jobdir / "mock_jobs" / f"{jobid}.script").write_text(args.script, encoding="utf-8")
     (jobdir / "mock_jobs" / f"{jobid}.name").write_text(args.job_name, encoding="utf-8")
     env_file = jobdir / "mock_jobs" / f"{jobid}.env"
 
     if args.ntasks:
-        env_file.write_text(
+        env += (
             f"export SLURM_JOB_CPUS_PER_NODE={args.ntasks}\n"
-            f"export SLURM_CPUS_ON_NODE={args.ntasks}",
-            encoding="utf-8",
+            f"export SLURM_CPUS_ON_NODE={args.ntasks}"
         )
-    else:
-        env_file.touch()
+    env_file.write_text(env, encoding="utf-8")
 
     subprocess.Popen(
         [str(Path(__file__).parent / "runner"), f"{jobdir}/mock_jobs/{jobid}"],
         start_new_session=True,
-        stdout=open(args.output, "w", encoding="utf-8"),  # noqa: SIM115
-        stderr=open(args.error, "w", encoding="utf-8"),  # noqa: SIM115
+        stdout=open(output, "w", encoding="utf-8"),  # noqa: SIM115
+        stderr=open(error, "w", encoding="utf-8"),  # noqa: SIM115
     )
 
+
+def main() -> None:
+    args = get_parser().parse_args()
+
+    jobid = random.randint(1, 2**15)
+    jobdir = Path(os.getenv("PYTEST_TMP_PATH", "."))
+    (jobdir / "mock_jobs").mkdir(parents=True, exist_ok=True)
+
+    if args.array:
+        first, last = (int(index) for index in args.array.split("-"))
+        for index in range(first, last + 1):
+            start_job(
+                jobdir,
+                f"{jobid}_{index}",
+                args,
+                f"export SLURM_ARRAY_TASK_ID={index}\n",
+                args.output.replace("%a", str(index)),
+                args.error.replace("%a", str(index)),
+            )
+    else:
+        start_job(jobdir, str(jobid), args, "", args.output, args.error)
+
     if args.parsable:
         print(jobid)
     else:
@@ -24,6 +24,7 @@ def get_parser() -> argparse.ArgumentParser:
         type=str,
     )
     parser.add_argument("-w", action="store_true")
+    parser.add_argument("-r", "--array", action="store_true")
     return parser
 
 
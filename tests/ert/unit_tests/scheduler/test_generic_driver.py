@@ -240,3 +240,66 @@ async def test_poll_ignores_filenotfounderror(driver: Driver, caplog):
     )
     assert "No such file or directory" in str(caplog.text)
     assert "/usr/bin/foo" in str(caplog.text)
+
+
+@pytest.mark.integration_test
+async def test_array_job_submit(driver: Driver, tmp_path, job_name):
+    if isinstance(driver, LocalDriver):
+        pytest.skip("LocalDriver does not submit array jobs")
+    os.chdir(tmp_path)
+    driver._array_job_size = 3
+    driver._array_job_delay = 0.1
+    num_realizations = 5
+    runpaths = [tmp_path / f"realization-{iens}" for iens in range(num_realizations)]
+    for runpath in runpaths:
+        runpath.mkdir()
+
+    finished_iens = set()
+
+    async def finished(iens, returncode):
+        assert returncode == 0
+        finished_iens.add(iens)
+
+    await asyncio.gather(
+        *(
+            driver.submit(
+                iens,
+                "sh",
+                "-c",
+                f"echo {iens} > {runpath}/iens",
+                runpath=runpath,
+                name=f"{job_name}-{iens}",
+            )
+            for iens, runpath in enumerate(runpaths)
+        )
+    )
+    await poll(driver, set(range(num_realizations)), finished=finished)
+
+    assert finished_iens == set(range(num_realizations))
+    for iens, runpath in enumerate(runpaths):
+        assert (runpath / "iens").read_text(encoding="utf-8") == f"{iens}\n"
+
+
+@pytest.mark.integration_test
+@pytest.mark.flaky(reruns=5)
+async def test_kill_array_job_task(driver: Driver, tmp_path):
+    if isinstance(driver, LocalDriver):
+        pytest.skip("LocalDriver does not submit array jobs")
+    os.chdir(tmp_path)
+    driver._array_job_size = 2
+    driver._array_job_delay = 0.1
+
+    async def kill_first_task_once_started(iens):
+        if iens == 0:
+            await driver.kill(iens)
+
+    await asyncio.gather(
+        driver.submit(
+            0, "sh", "-c", f"sleep 10; touch {tmp_path}/survived", name="kill_me"
+        ),
+        driver.submit(1, "sh", "-c", f"touch {tmp_path}/finished", name="keep_me"),
+    )
+    await poll(driver, {0, 1}, started=kill_first_task_once_started)
+
+    assert Path("finished").exists()
+    assert not Path("survived").exists(), "Array task should have been killed"
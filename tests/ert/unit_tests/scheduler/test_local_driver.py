@@ -8,7 +8,7 @@
 from ert.scheduler import local_driver
 from ert.scheduler.driver import SIGNAL_OFFSET
 from ert.scheduler.event import FinishedEvent, StartedEvent
-from ert.scheduler.local_driver import LocalDriver
+from ert.scheduler.local_driver import LocalDriver, ResourcePool
 
 
 async def test_success(tmp_path):
@@ -141,3 +141,65 @@ async def test_path_as_argument_is_valid(tmp_path):
     assert await driver.event_queue.get() == FinishedEvent(iens=42, returncode=0)
 
     assert Path("testfile").exists()
+
+
+async def test_that_resource_pool_grants_requests_that_fit():
+    pool = ResourcePool(cpus=[0, 1, 2, 3], memory=100)
+    first = await pool.acquire(num_cpu=3, memory=10)
+    assert first.cpus == [0, 1, 2]
+    assert (pool.free_cpus, pool.free_memory) == (1, 90)
+
+    waiting_for_cpus = asyncio.create_task(pool.acquire(num_cpu=2, memory=10))
+    await asyncio.sleep(0)
+    fits = await pool.acquire(num_cpu=1, memory=80)
+    assert fits.cpus == [3]
+    assert not waiting_for_cpus.done()
+
+    pool.release(first)
+    assert (await waiting_for_cpus).cpus == [0, 1]
+    assert (pool.free_cpus, pool.free_memory) == (1, 10)
+
+
+async def test_that_resource_pool_reduces_requests_larger_than_the_pool():
+    pool = ResourcePool(cpus=[0, 1], memory=100)
+    allocation = await pool.acquire(num_cpu=8, memory=1000)
+    assert allocation.cpus == [0, 1]
+    assert allocation.memory == 100
+
+
+async def test_that_cancelled_resource_requests_are_not_granted():
+    pool = ResourcePool(cpus=[0], memory=0)
+    allocation = await pool.acquire(num_cpu=1, memory=0)
+    waiting = asyncio.create_task(pool.acquire(num_cpu=1, memory=0))
+    await asyncio.sleep(0)
+    waiting.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiting
+    pool.release(allocation)
+    assert pool.free_cpus == 1
+
+
+@pytest.mark.timeout(10)
+@pytest.mark.integration_test
+async def test_resource_aware_driver_does_not_oversubscribe_cpus():
+    driver = LocalDriver(resource_aware=True, cpus=[0, 1, 2], memory=0)
+    num_cpu = {0: 2, 1: 2, 2: 1, 3: 1}
+    for iens, cpus in num_cpu.items():
+        await driver.submit(iens, "/usr/bin/env", "sleep", "0.2", num_cpu=cpus)
+
+    running: set[int] = set()
+    started_order = []
+    finished: set[int] = set()
+    while len(finished) < len(num_cpu):
+        event = await driver.event_queue.get()
+        if isinstance(event, StartedEvent):
+            running.add(event.iens)
+            started_order.append(event.iens)
+            assert sum(num_cpu[iens] for iens in running) <= 3
+        else:
+            assert event.returncode == 0
+            running.remove(event.iens)
+            finished.add(event.iens)
+
+    # Realization 2 fits next to realization 0 while realization 1 waits
+    assert started_order[:2] == [0, 2]
@@ -53,7 +53,7 @@ async def test_events_produced_from_jobstate_updates(jobstate_sequence: list[str
     finished = False
     if "R" in jobstate_sequence:
         started = True
-    if "F" in jobstate_sequence or "E" in jobstate_sequence:
+    if {"E", "F", "X"} & set(jobstate_sequence):
         finished = True
 
     driver = OpenPBSDriver()
@@ -72,7 +72,7 @@ async def mocked_submit(self, iens, *_args, **_kwargs):
         jobstate = _parse_jobs_dict({"1": {"job_state": statestr, "Exit_status": 0}})[
             "1"
         ]
-        if statestr in {"E", "F"} and "1" in driver._non_finished_job_ids:
+        if statestr in {"E", "F", "X"} and "1" in driver._non_finished_job_ids:
             driver._non_finished_job_ids.remove("1")
             driver._finished_job_ids.add("1")
         await driver._process_job_update("1", jobstate)
@@ -540,6 +540,12 @@ def test_create_job_class_raises_error_on_invalid_state():
         _create_job_class(invalid_job_dict)
 
 
+def test_that_expired_subjobs_are_finished():
+    assert _create_job_class({"job_state": "X", "Exit_status": "1"}) == FinishedJob(
+        job_state="X", returncode=1
+    )
+
+
 @pytest.mark.usefixtures("capturing_qsub")
 async def test_submit_project_code():
     project_code = "testing+testing123"
@@ -4,6 +4,7 @@
 import random
 import shutil
 import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from pathlib import Path
 from unittest.mock import AsyncMock
@@ -291,6 +292,49 @@ async def wait():
         assert max_running_observed == ensemble_size
 
 
+@pytest.mark.parametrize("max_internalizations", [1, 3])
+async def test_max_internalizations(
+    max_internalizations, mock_driver, storage, tmp_path, monkeypatch
+):
+    internalizing = 0
+    max_internalizing_observed = 0
+    executors = set()
+
+    async def mocked_forward_model_ok(*args, executor, **kwargs):
+        nonlocal internalizing, max_internalizing_observed
+        executors.add(executor)
+        internalizing += 1
+        max_internalizing_observed = max(max_internalizing_observed, internalizing)
+        await asyncio.sleep(0.01)
+        internalizing -= 1
+        return LoadResult(LoadStatus.LOAD_SUCCESSFUL, "")
+
+    monkeypatch.setattr(job, "forward_model_ok", mocked_forward_model_ok)
+    ensemble_size = 10
+    ensemble = storage.create_experiment().create_ensemble(
+        name="foo", ensemble_size=ensemble_size
+    )
+    realizations = [
+        create_stub_realization(ensemble, tmp_path, iens)
+        for iens in range(ensemble_size)
+    ]
+
+    sch = scheduler.Scheduler(
+        mock_driver(), realizations, max_internalizations=max_internalizations
+    )
+
+    assert await sch.execute() == Id.ENSEMBLE_SUCCEEDED
+    assert max_internalizing_observed == max_internalizations
+    assert len(executors) == 1
+    assert isinstance(executors.pop(), ThreadPoolExecutor)
+    assert sch._internalization_executor is None
+
+
+def test_that_max_internalizations_must_be_positive(mock_driver):
+    with pytest.raises(ValueError, match="max_internalizations"):
+        scheduler.Scheduler(mock_driver(), max_internalizations=0)
+
+
 @pytest.mark.integration_test
 @pytest.mark.timeout(6)
 async def test_max_runtime_while_killing(realization, mock_driver):
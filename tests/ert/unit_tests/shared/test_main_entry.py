@@ -15,7 +15,7 @@ def test_main_logging(monkeypatch, caplog):
     parser_mock.func.side_effect = ValueError("This is a test")
     monkeypatch.setattr(logging.config, "dictConfig", MagicMock())
     monkeypatch.setattr(main, "ert_parser", MagicMock(return_value=parser_mock))
-    monkeypatch.setattr(main, "ErtPluginContext", MagicMock())
+    monkeypatch.setattr(ert.plugins, "ErtPluginContext", MagicMock())
     monkeypatch.setattr(sys, "argv", ["ert", "test_run", "config.ert"])
     with pytest.raises(
         SystemExit, match='ERT crashed unexpectedly with "This is a test"'
@@ -29,7 +29,7 @@ def test_main_logging_argparse(monkeypatch, caplog):
     monkeypatch.setattr(logging.config, "dictConfig", MagicMock())
     monkeypatch.setattr(main, "valid_file", MagicMock(return_value=True))
     monkeypatch.setattr(main, "run_cli", MagicMock())
-    monkeypatch.setattr(main, "ErtPluginContext", MagicMock())
+    monkeypatch.setattr(ert.plugins, "ErtPluginContext", MagicMock())
     monkeypatch.setattr(sys, "argv", ["ert", "test_run", "config.ert"])
     with caplog.at_level(logging.INFO):
         main.main()
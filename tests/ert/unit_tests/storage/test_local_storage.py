@@ -254,6 +254,344 @@ def test_that_load_parameters_throws_exception(tmp_path):
             ensemble.load_parameters("I_DONT_EXIST", 1)
 
 
+def _gen_kw_dataset(values):
+    return xr.Dataset(
+        {
+            "values": (["realizations", "names"], values),
+            "transformed_values": (["realizations", "names"], values),
+            "names": ["KEY1", "KEY2"],
+        }
+    )
+
+
+@pytest.fixture
+def gen_kw_experiment(storage):
+    return storage.create_experiment(
+        parameters=[
+            GenKwConfig(
+                name="PARAMETER",
+                forward_init=False,
+                template_file="",
+                transform_function_definitions=[
+                    TransformFunctionDefinition("KEY1", "UNIFORM", [0, 1]),
+                    TransformFunctionDefinition("KEY2", "UNIFORM", [0, 1]),
+                ],
+                output_file="kw.txt",
+                update=True,
+            )
+        ]
+    )
+
+
+def test_that_parameters_saved_for_many_realizations_are_consolidated(
+    gen_kw_experiment,
+):
+    ensemble = gen_kw_experiment.create_ensemble(ensemble_size=5, name="prior")
+    values = np.arange(8, dtype=float).reshape(4, 2)
+    ensemble.save_parameters_many("PARAMETER", [0, 1, 3, 4], _gen_kw_dataset(values))
+
+    assert (ensemble.mount_point / "parameters" / "PARAMETER.nc").exists()
+    assert not list(ensemble.mount_point.glob("realization-*/PARAMETER.nc"))
+    assert ensemble.is_initalized() == [0, 1, 3, 4]
+    np.testing.assert_array_equal(
+        ensemble.load_parameters("PARAMETER")["values"].values, values
+    )
+    np.testing.assert_array_equal(
+        ensemble.load_parameters("PARAMETER", np.array([4, 0]))["values"].values,
+        values[[3, 0]],
+    )
+    np.testing.assert_array_equal(
+        ensemble.load_parameters("PARAMETER", 3)["values"].values, values[2]
+    )
+    with pytest.raises(KeyError, match="for realization 2"):
+        ensemble.load_parameters("PARAMETER", np.array([1, 2]))
+
+
+def test_that_loading_parameters_closes_the_opened_files(
+    gen_kw_experiment, monkeypatch
+):
+    ensemble = gen_kw_experiment.create_ensemble(ensemble_size=3, name="prior")
+    ensemble.save_parameters_many(
+        "PARAMETER", [0, 1], _gen_kw_dataset(np.zeros((2, 2)))
+    )
+    ensemble.save_parameters(
+        "PARAMETER", 2, _gen_kw_dataset(np.ones((1, 2))).isel(realizations=0)
+    )
+
+    open_dataset = xr.open_dataset
+    opened = []
+
+    def tracking_open_dataset(path, *args, **kwargs):
+        dataset = open_dataset(path, *args, **kwargs)
+        opened.append(Path(path).parent.name)
+        close = dataset._close
+        dataset.set_close(lambda: (opened.remove(Path(path).parent.name), close()))
+        return dataset
+
+    monkeypatch.setattr(xr, "open_dataset", tracking_open_dataset)
+
+    ensemble.load_parameters("PARAMETER")
+    ensemble.load_parameters("PARAMETER", 0)
+    ensemble.load_parameters("PARAMETER", 2)
+    assert opened == []
+
+    monkeypatch.setattr(
+        ensemble, "_load_group_dataset", lambda group: pytest.fail("store opened")
+    )
+    np.testing.assert_array_equal(
+        ensemble.load_parameters("PARAMETER", np.array([2]))["values"].values,
+        [[1.0, 1.0]],
+    )
+
+
+def test_that_single_realization_saves_take_precedence_until_consolidated(
+    gen_kw_experiment,
+):
+    ensemble = gen_kw_experiment.create_ensemble(ensemble_size=3, name="prior")
+    ensemble.save_parameters_many(
+        "PARAMETER", [0, 1], _gen_kw_dataset(np.zeros((2, 2)))
+    )
+    ensemble.save_parameters(
+        "PARAMETER", 1, _gen_kw_dataset(np.ones((1, 2))).isel(realizations=0)
+    )
+    ensemble.save_parameters(
+        "PARAMETER", 2, _gen_kw_dataset(np.full((1, 2), 2.0)).isel(realizations=0)
+    )
+    expected = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 2.0]])
+
+    np.testing.assert_array_equal(
+        ensemble.load_parameters("PARAMETER")["values"].values, expected
+    )
+    assert ensemble.get_parameter_state(2) == {
+        "PARAMETER": RealizationStorageState.PARAMETERS_LOADED
+    }
+
+    ensemble.consolidate_parameters()
+    assert not list(ensemble.mount_point.glob("realization-*/PARAMETER.nc"))
+    np.testing.assert_array_equal(
+        ensemble.load_parameters("PARAMETER")["values"].values, expected
+    )
+    np.testing.assert_array_equal(
+        ensemble.load_parameters("PARAMETER", np.array([2, 1]))["values"].values,
+        expected[[2, 1]],
+    )
+
+
+def test_that_parameter_values_are_loaded_into_one_array(gen_kw_experiment):
+    ensemble = gen_kw_experiment.create_ensemble(ensemble_size=3, name="prior")
+    values = np.arange(6, dtype=float).reshape(3, 2)
+    ensemble.save_parameters_many("PARAMETER", [0, 2], _gen_kw_dataset(values[[0, 2]]))
+    ensemble.save_parameters(
+        "PARAMETER", 1, _gen_kw_dataset(values[[1]]).isel(realizations=0)
+    )
+
+    loaded = ensemble.load_parameter_values("PARAMETER", [2, 0, 1])
+    assert loaded.dtype == np.float32
+    assert loaded.flags.f_contiguous
+    np.testing.assert_array_equal(loaded, values[[2, 0, 1]].T)
+
+    np.testing.assert_array_equal(
+        ensemble.load_parameter_values(
+            "PARAMETER", np.array([1, 2]), indices=np.array([1]), dtype=np.float64
+        ),
+        values[[1, 2]][:, [1]].T,
+    )
+    with pytest.raises(KeyError, match="No dataset 'PARAMETER'"):
+        ensemble.load_parameter_values("PARAMETER", [0, 3])
+    with pytest.raises(IndexError):
+        ensemble.load_parameter_values("PARAMETER", [0], indices=np.array([2]))
+
+
+def test_that_copied_parameters_share_files_with_the_source(storage, gen_kw_experiment):
+    prior = gen_kw_experiment.create_ensemble(ensemble_size=3, name="prior")
+    values = np.arange(6, dtype=float).reshape(3, 2)
+    prior.save_parameters_many("PARAMETER", [0, 1], _gen_kw_dataset(values[:2]))
+    prior.save_parameters(
+        "PARAMETER", 2, _gen_kw_dataset(values[[2]]).isel(realizations=0)
+    )
+    posterior = storage.create_ensemble(
+        gen_kw_experiment, ensemble_size=3, name="posterior", prior_ensemble=prior
+    )
+
+    posterior.copy_parameters(prior, "PARAMETER", [0, 1, 2])
+
+    assert os.path.samefile(
+        posterior.mount_point / "parameters" / "PARAMETER.nc",
+        prior.mount_point / "parameters" / "PARAMETER.nc",
+    )
+    np.testing.assert_array_equal(
+        posterior.load_parameters("PARAMETER")["values"].values, values
+    )
+
+    subset = storage.create_ensemble(
+        gen_kw_experiment, ensemble_size=3, name="subset", prior_ensemble=prior
+    )
+    subset.copy_parameters(prior, "PARAMETER", [1])
+    assert subset.is_initalized() == [1]
+    np.testing.assert_array_equal(
+        subset.load_parameters("PARAMETER", 1)["values"].values, values[1]
+    )
+
+
+def test_that_migration_consolidates_parameters_stored_per_realization(tmp_path):
+    values = np.arange(6, dtype=float).reshape(3, 2)
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(
+            parameters=[
+                GenKwConfig(
+                    name="PARAMETER",
+                    forward_init=False,
+                    template_file="",
+                    transform_function_definitions=[
+                        TransformFunctionDefinition("KEY1", "UNIFORM", [0, 1]),
+                        TransformFunctionDefinition("KEY2", "UNIFORM", [0, 1]),
+                    ],
+                    output_file="kw.txt",
+                    update=True,
+                )
+            ]
+        )
+        ensemble = experiment.create_ensemble(ensemble_size=3, name="prior")
+        for realization in range(3):
+            ensemble.save_parameters(
+                "PARAMETER",
+                realization,
+                _gen_kw_dataset(values).isel(realizations=realization),
+            )
+        storage._index.version = 9
+        storage._save_index()
+
+    with open_storage(tmp_path, mode="w") as storage:
+        ensemble = storage.get_ensemble(ensemble.id)
+        assert (ensemble.mount_point / "parameters" / "PARAMETER.nc").exists()
+        assert not list(ensemble.mount_point.glob("realization-*/PARAMETER.nc"))
+        np.testing.assert_array_equal(
+            ensemble.load_parameters("PARAMETER")["values"].values, values
+        )
+        assert ensemble.verify_manifest() == []
+
+
+def test_that_realization_state_is_kept_in_the_ensemble_manifest(tmp_path):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(
+            parameters=[
+                GenKwConfig(
+                    name="PARAMETER",
+                    forward_init=False,
+                    template_file="",
+                    transform_function_definitions=[
+                        TransformFunctionDefinition("KEY1", "UNIFORM", [0, 1]),
+                        TransformFunctionDefinition("KEY2", "UNIFORM", [0, 1]),
+                    ],
+                    output_file="kw.txt",
+                    update=True,
+                )
+            ],
+            responses=[GenDataConfig(keys=["WOPR"])],
+        )
+        ensemble = experiment.create_ensemble(ensemble_size=3, name="prior")
+        ensemble.save_parameters_many(
+            "PARAMETER", [0, 1, 2], _gen_kw_dataset(np.zeros((3, 2)))
+        )
+        for realization in [0, 2]:
+            ensemble.save_response(
+                "gen_data",
+                pl.DataFrame(
+                    {
+                        "response_key": ["WOPR"],
+                        "report_step": pl.Series([0], dtype=pl.UInt16),
+                        "index": pl.Series([0], dtype=pl.UInt16),
+                        "values": pl.Series([1.0], dtype=pl.Float32),
+                    }
+                ),
+                realization,
+            )
+        ensemble.set_failure(1, RealizationStorageState.LOAD_FAILURE, "failed")
+
+        manifest = json.loads((ensemble.mount_point / "manifest.json").read_text())
+        assert manifest == {
+            "parameters": {"PARAMETER": [0, 1, 2]},
+            "responses": {"gen_data": [0, 2]},
+            "failures": {"1": RealizationStorageState.LOAD_FAILURE.value},
+            "misfits": [],
+            "response_generations": {"0": 1, "2": 1},
+        }
+        assert ensemble.verify_manifest() == []
+
+    with open_storage(tmp_path, mode="r") as storage:
+        ensemble = storage.get_ensemble(ensemble.id)
+        assert ensemble.get_ensemble_state() == [
+            {
+                RealizationStorageState.PARAMETERS_LOADED,
+                RealizationStorageState.RESPONSES_LOADED,
+            },
+            {
+                RealizationStorageState.PARAMETERS_LOADED,
+                RealizationStorageState.LOAD_FAILURE,
+            },
+            {
+                RealizationStorageState.PARAMETERS_LOADED,
+                RealizationStorageState.RESPONSES_LOADED,
+            },
+        ]
+        assert ensemble.has_data() == [0, 2]
+        assert ensemble.get_failure(1).message == "failed"
+        assert ensemble.get_response_state(1) == {
+            "gen_data": RealizationStorageState.UNDEFINED
+        }
+
+
+def test_that_instances_of_an_ensemble_keep_each_others_manifest_updates(tmp_path):
+    response = pl.DataFrame(
+        {
+            "response_key": ["WOPR"],
+            "report_step": pl.Series([0], dtype=pl.UInt16),
+            "index": pl.Series([0], dtype=pl.UInt16),
+            "values": pl.Series([1.0], dtype=pl.Float32),
+        }
+    )
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(responses=[GenDataConfig(keys=["WOPR"])])
+        ensemble = experiment.create_ensemble(ensemble_size=2, name="prior")
+        ensemble.get_realization_list_with_responses()
+        storage.refresh()
+        other_ensemble = storage.get_ensemble(ensemble.id)
+        assert other_ensemble is not ensemble
+
+        ensemble.save_response("gen_data", response, 0)
+        other_ensemble.save_response("gen_data", response, 1)
+        assert ensemble.get_realization_list_with_responses() == [0, 1]
+
+    with open_storage(tmp_path, mode="r") as storage:
+        ensemble = storage.get_ensemble(ensemble.id)
+        assert ensemble.get_realization_list_with_responses() == [0, 1]
+
+
+def test_that_manifest_can_be_verified_and_rebuilt_from_stored_files(storage):
+    experiment = storage.create_experiment(responses=[GenDataConfig(keys=["WOPR"])])
+    ensemble = experiment.create_ensemble(ensemble_size=2, name="prior")
+    response = pl.DataFrame(
+        {
+            "response_key": ["WOPR"],
+            "report_step": pl.Series([0], dtype=pl.UInt16),
+            "index": pl.Series([0], dtype=pl.UInt16),
+            "values": pl.Series([1.0], dtype=pl.Float32),
+        }
+    )
+    ensemble.save_response("gen_data", response, 0)
+    (ensemble.mount_point / "realization-1").mkdir()
+    response.write_parquet(ensemble.mount_point / "realization-1" / "gen_data.parquet")
+
+    assert ensemble.has_data() == [0]
+    assert ensemble.verify_manifest() == [
+        "Response type gen_data is stored but not in the manifest for realizations [1]"
+    ]
+
+    ensemble.rebuild_manifest()
+    assert ensemble.verify_manifest() == []
+    assert ensemble.has_data() == [0, 1]
+
+
 def test_open_empty_read(tmp_path):
     with open_storage(tmp_path / "empty", mode="r") as storage:
         assert _ensembles(storage) == []
@@ -285,6 +623,39 @@ def test_refresh(tmp_path):
             assert _ensembles(accessor) == _ensembles(reader)
 
 
+def test_that_opening_storage_reads_ensembles_from_the_catalog(tmp_path):
+    with open_storage(tmp_path, mode="w") as storage:
+        experiment = storage.create_experiment(name="exp")
+        ensemble = storage.create_ensemble(experiment, name="foo", ensemble_size=2)
+
+    (ensemble.mount_point / "index.json").unlink()
+    with open_storage(tmp_path, mode="r") as storage:
+        assert _ensembles(storage) == ["foo"]
+        assert storage.get_ensemble(ensemble.id).experiment.name == "exp"
+
+
+def test_that_refresh_drops_deleted_ensembles_and_reads_changed_ones(tmp_path):
+    with (
+        open_storage(tmp_path, mode="w") as writer,
+        open_storage(tmp_path, mode="r") as reader,
+    ):
+        experiment = writer.create_experiment()
+        foo = writer.create_ensemble(experiment, name="foo", ensemble_size=1)
+        bar = writer.create_ensemble(experiment, name="bar", ensemble_size=1)
+        reader.refresh()
+        assert _ensembles(reader) == ["bar", "foo"]
+
+        shutil.rmtree(foo.mount_point)
+        bar.save_everest_realization_info(
+            {0: {"model_realization": 0, "perturbation": -1}}
+        )
+        reader.refresh()
+        assert _ensembles(reader) == ["bar"]
+        assert reader.get_ensemble(bar.id).everest_realization_info == {
+            0: {"model_realization": 0, "perturbation": -1}
+        }
+
+
 def test_that_reader_storage_reads_most_recent_response_configs(tmp_path):
     reader = open_storage(tmp_path, mode="r")
     writer = open_storage(tmp_path, mode="w")
@@ -740,6 +1111,170 @@ def test_asof_joining_summary(tmp_path, perturb_observations, perturb_responses)
         )
 
 
+@pytest.mark.parametrize("chunk_size", [1, 2, 100])
+def test_that_responses_are_aligned_to_observations_in_one_matrix(tmp_path, chunk_size):
+    with open_storage(tmp_path, mode="w") as storage:
+        summary_observations = pl.DataFrame(
+            {
+                "observation_key": ["o_FOPR", "o_FOPR", "o_FGPR"],
+                "response_key": ["FOPR", "FOPR", "FGPR"],
+                "time": pl.Series(
+                    [datetime(2000, 1, 1), datetime(2000, 1, 2), datetime(2000, 1, 3)],
+                    dtype=pl.Datetime("ms"),
+                ),
+                "observations": pl.Series([1, 2, 3], dtype=pl.Float32),
+                "std": pl.Series([0.1, 0.2, 0.3], dtype=pl.Float32),
+            }
+        )
+        experiment = storage.create_experiment(
+            responses=[SummaryConfig(keys=["*"], input_files=["not_relevant"])],
+            observations={"summary": summary_observations},
+        )
+        ensemble = storage.create_ensemble(
+            experiment, ensemble_size=4, iteration=0, name="prior"
+        )
+        for real in [0, 1, 3]:
+            ensemble.save_response(
+                "summary",
+                pl.DataFrame(
+                    {
+                        "response_key": ["FOPR", "FOPR", "FGPR", "FWPR"],
+                        "time": pl.Series(
+                            [
+                                datetime(2000, 1, 1),
+                                datetime(2000, 1, 2),
+                                # Not within tolerance of the observation
+                                datetime(2000, 1, 3, 0, 0, 5),
+                                datetime(2000, 1, 3),
+                            ],
+                            dtype=pl.Datetime("ms"),
+                        ),
+                        "values": pl.Series(
+                            [10 * real, 10 * real + 1, 10 * real + 2, -1.0],
+                            dtype=pl.Float32,
+                        ),
+                    }
+                ),
+                real,
+            )
+
+        observations, S = ensemble.get_observations_and_response_matrix(
+            ["o_FOPR", "o_FGPR"],
+            np.array([3, 0, 1]),
+            realization_chunk_size=chunk_size,
+        )
+
+        assert observations["observation_key"].to_list() == [
+            "o_FOPR",
+            "o_FOPR",
+            "o_FGPR",
+        ]
+        assert S.dtype == np.float32
+        assert S.flags.c_contiguous
+        np.testing.assert_array_equal(
+            S,
+            [[0.0, 10.0, 30.0], [1.0, 11.0, 31.0], [np.nan, np.nan, np.nan]],
+        )
+        assert ensemble.get_observations_and_responses(
+            ["o_FOPR", "o_FGPR"], np.array([0, 1, 3])
+        ).columns[5:] == ["0", "1", "3"]
+
+
+def test_that_misfits_are_stored_and_only_recalculated_for_new_responses(storage):
+    summary_observations = pl.DataFrame(
+        {
+            "observation_key": ["o_FOPR", "o_FOPR", "o_FGPR"],
+            "response_key": ["FOPR", "FOPR", "FGPR"],
+            "time": pl.Series(
+                [datetime(2000, 1, 1), datetime(2000, 1, 2), datetime(2000, 1, 3)],
+                dtype=pl.Datetime("ms"),
+            ),
+            "observations": pl.Series([1, 2, 3], dtype=pl.Float32),
+            "std": pl.Series([0.5, 1.0, 0.3], dtype=pl.Float32),
+        }
+    )
+    experiment = storage.create_experiment(
+        responses=[SummaryConfig(keys=["*"], input_files=["not_relevant"])],
+        observations={"summary": summary_observations},
+    )
+    ensemble = storage.create_ensemble(
+        experiment, ensemble_size=3, iteration=0, name="prior"
+    )
+
+    def save_response(real, offset):
+        ensemble.save_response(
+            "summary",
+            pl.DataFrame(
+                {
+                    "response_key": ["FOPR", "FOPR"],
+                    "time": pl.Series(
+                        [datetime(2000, 1, 1), datetime(2000, 1, 2)],
+                        dtype=pl.Datetime("ms"),
+                    ),
+                    "values": pl.Series([1 + offset, 2 + offset], dtype=pl.Float32),
+                }
+            ),
+            real,
+        )
+
+    for real in [0, 2]:
+        save_response(real, real)
+
+    assert ensemble.load_misfits().to_dicts() == [
+        {"realization": 0, "observation_key": "o_FGPR", "misfit": 0.0},
+        {"realization": 0, "observation_key": "o_FOPR", "misfit": 0.0},
+        {"realization": 2, "observation_key": "o_FGPR", "misfit": 0.0},
+        {"realization": 2, "observation_key": "o_FOPR", "misfit": 20.0},
+    ]
+    assert (ensemble.mount_point / "misfits.parquet").exists()
+
+    with patch.object(
+        LocalEnsemble,
+        "get_observations_and_response_matrix",
+        autospec=True,
+        side_effect=LocalEnsemble.get_observations_and_response_matrix,
+    ) as align:
+        cached = ensemble.load_misfits()
+        align.assert_not_called()
+        save_response(1, 1)
+        save_response(2, 0)
+        misfits = ensemble.load_misfits()
+        assert [call.args[2].tolist() for call in align.call_args_list] == [[1, 2]]
+
+    assert cached["misfit"].to_list() == [0.0, 0.0, 0.0, 20.0]
+    assert misfits.filter(pl.col("observation_key") == "o_FOPR")[
+        "misfit"
+    ].to_list() == [0.0, 5.0, 0.0]
+
+    get_observations_and_response_matrix = (
+        LocalEnsemble.get_observations_and_response_matrix
+    )
+
+    def save_response_while_aligning(self, *args):
+        save_response(0, 2)
+        return get_observations_and_response_matrix(self, *args)
+
+    save_response(1, 2)
+    with patch.object(
+        LocalEnsemble,
+        "get_observations_and_response_matrix",
+        autospec=True,
+        side_effect=save_response_while_aligning,
+    ):
+        ensemble.load_misfits()
+    with patch.object(
+        LocalEnsemble,
+        "get_observations_and_response_matrix",
+        autospec=True,
+        side_effect=LocalEnsemble.get_observations_and_response_matrix,
+    ) as align:
+        misfits = ensemble.load_misfits()
+        assert [call.args[2].tolist() for call in align.call_args_list] == [[0]]
+    assert misfits.filter(pl.col("observation_key") == "o_FOPR")[
+        "misfit"
+    ].to_list() == [20.0, 20.0, 0.0]
+
+
 def test_saving_everest_metadata_to_ensemble(tmp_path):
     with open_storage(tmp_path, mode="w") as storage:
         experiment = storage.create_experiment(
@@ -9,6 +9,7 @@
 import pytest
 import xtgeo
 
+from _ert.checksum import MANIFEST_CHECKSUM_KEY
 from ert.callbacks import forward_model_ok
 from ert.config import (
     ConfigValidationError,
@@ -99,6 +100,44 @@ def test_jobs_json_is_backed_up(make_run_path):
     )
 
 
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_run_paths_are_created_in_parallel_with_progress(
+    prior_ensemble, run_args, run_paths
+):
+    Path("template.tmpl").write_text("realization <IENS>", encoding="utf-8")
+    ert_config = ErtConfig.from_file_contents(
+        dedent(
+            """\
+            NUM_REALIZATIONS 10
+            RUN_TEMPLATE template.tmpl result.txt
+            """
+        )
+    )
+    run_arg = run_args(ert_config, prior_ensemble)
+    progress = []
+    create_run_path(
+        run_args=run_arg,
+        ensemble=prior_ensemble,
+        user_config_file=ert_config.user_config_file,
+        env_vars=ert_config.env_vars,
+        env_pr_fm_step=ert_config.env_pr_fm_step,
+        forward_model_steps=ert_config.forward_model_steps,
+        substitutions=ert_config.substitutions,
+        templates=ert_config.ert_templates,
+        model_config=ert_config.model_config,
+        runpaths=run_paths(ert_config),
+        progress_callback=lambda created, total: progress.append((created, total)),
+        max_workers=4,
+    )
+    assert progress == [(created, 10) for created in range(1, 11)]
+    for arg in run_arg:
+        assert (Path(arg.runpath) / "result.txt").read_text(
+            encoding="utf-8"
+        ) == f"realization {arg.iens}"
+        assert (Path(arg.runpath) / "jobs.json").exists()
+        assert (Path(arg.runpath) / "manifest.json").exists()
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 def test_that_run_template_replace_symlink_does_not_write_to_source(
     prior_ensemble, run_args, run_paths
@@ -547,6 +586,38 @@ def test_num_cpu_subst(append, numcpu, make_run_path):
         assert [str(numcpu)] == jobs["jobList"][0]["argList"]
 
 
+@pytest.mark.usefixtures("use_tmpdir")
+@pytest.mark.parametrize(
+    "append, expected",
+    [
+        ("CHECKSUM_ALGORITHM crc32\n", {"algorithm": "crc32", "size_limit": None}),
+        ("CHECKSUM_SIZE_LIMIT 1000\n", {"algorithm": "md5", "size_limit": 1000}),
+        (
+            "CHECKSUM_ALGORITHM crc32\nCHECKSUM_SIZE_LIMIT 1000\n",
+            {"algorithm": "crc32", "size_limit": 1000},
+        ),
+    ],
+)
+def test_that_checksum_settings_are_written_to_the_manifest(
+    append, expected, make_run_path
+):
+    config = ErtConfig.from_file_contents(
+        "NUM_REALIZATIONS 1\nSUMMARY FOPR\nECLBASE CASE\n" + append
+    )
+    make_run_path(config)
+
+    with open("simulations/realization-0/iter-0/manifest.json", encoding="utf-8") as f:
+        assert orjson.loads(f.read())[MANIFEST_CHECKSUM_KEY] == expected
+
+
+@pytest.mark.usefixtures("use_tmpdir")
+def test_that_an_unknown_checksum_algorithm_is_a_config_error():
+    with pytest.raises(
+        ConfigValidationError, match="CHECKSUM_ALGORITHM must be one of"
+    ):
+        ErtConfig.from_file_contents("NUM_REALIZATIONS 1\nCHECKSUM_ALGORITHM sha1\n")
+
+
 @pytest.mark.parametrize(
     "run_path, expected_raise, msg",
     [
@@ -755,6 +826,7 @@ def test_when_manifest_files_are_written_forward_model_ok_succeeds(storage, itr)
         )
         with open(manifest_path, encoding="utf-8") as f:
             manifest = orjson.loads(f.read())
+            assert MANIFEST_CHECKSUM_KEY not in manifest
             assert {run_path + "/" + f for f in manifest.values()} == expected_files
 
         # write files in manifest